@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Attendance
+from .models import Attendance, AttendanceMonthlySummary
 
 
 @admin.register(Attendance)
@@ -9,3 +9,11 @@ class AttendanceAdmin(admin.ModelAdmin):
     search_fields = ['student__name', 'note']
     date_hierarchy = 'date'
     raw_id_fields = ['student', 'assigned_class']
+
+
+@admin.register(AttendanceMonthlySummary)
+class AttendanceMonthlySummaryAdmin(admin.ModelAdmin):
+    list_display = ['student', 'year', 'month', 'present', 'absent', 'late', 'early_leave', 'total', 'updated_at']
+    list_filter = ['year', 'month']
+    search_fields = ['student__name']
+    raw_id_fields = ['student']
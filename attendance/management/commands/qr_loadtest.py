@@ -0,0 +1,222 @@
+"""
+QR 출석 체크인 부하 테스트
+
+테스트용 반/학생/QR 세션을 만들고, 지정한 시간창 안에 학생 수만큼의 스캔 요청을
+로컬 서버(qr_scan_api)로 동시에 보내 처리량, 지연 시간(p50/p99), 오류, 스캔당 쿼리 수를 측정한다.
+
+사용 예:
+    python manage.py runserver 0.0.0.0:8000   # 다른 터미널
+    python manage.py qr_loadtest --students 500 --window 30 --concurrency 64 --output loadtest.json
+
+서버와 같은 데이터베이스를 사용하는 설정으로 실행해야 한다.
+"""
+import json
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import requests
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from attendance.models import Attendance, QrSession
+from attendance.qr_cache import cache_session, invalidate_rosters, invalidate_sessions
+from attendance.qr_tokens import make_rotating_token
+from attendance.scan_log_buffer import flush_scan_logs
+from classes.models import Class
+from students.models import Student
+
+SCAN_PATH = '/attendance/qr/scan/api/'
+QUERY_SAMPLE_SIZE = 5
+
+
+def percentile(values, pct):
+    """정렬된 값 목록의 백분위수 (nearest-rank)"""
+    if not values:
+        return None
+    rank = max(int(round(pct / 100 * len(values) + 0.5)) - 1, 0)
+    return values[min(rank, len(values) - 1)]
+
+
+class Command(BaseCommand):
+    help = 'QR 출석 체크인 동시 스캔 부하 테스트'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='http://127.0.0.1:8000', help='테스트 대상 서버 주소')
+        parser.add_argument('--students', type=int, default=300, help='스캔할 학생 수')
+        parser.add_argument('--window', type=float, default=10.0, help='스캔을 분산할 시간창(초)')
+        parser.add_argument('--concurrency', type=int, default=50, help='동시 요청 스레드 수')
+        parser.add_argument('--rotation', type=int, default=0, help='회전형 QR 교체 주기(초), 0이면 고정 QR')
+        parser.add_argument('--timeout', type=float, default=10.0, help='요청 타임아웃(초)')
+        parser.add_argument('--output', help='결과 JSON 파일 경로')
+        parser.add_argument('--keep', action='store_true', help='테스트 데이터를 삭제하지 않음')
+
+    def handle(self, *args, **options):
+        if options['students'] <= QUERY_SAMPLE_SIZE:
+            raise CommandError(f'--students는 {QUERY_SAMPLE_SIZE}보다 커야 합니다.')
+
+        session, students = self._setup(options)
+        try:
+            queries = self._measure_queries(session, students[:QUERY_SAMPLE_SIZE])
+            results, elapsed = self._run_load(session, students[QUERY_SAMPLE_SIZE:], options)
+            report = self._build_report(session, results, elapsed, queries, options)
+        finally:
+            if not options['keep']:
+                self._cleanup(session, students)
+
+        self._print_report(report)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            self.stdout.write(f"결과 저장: {options['output']}")
+
+    def _setup(self, options):
+        """테스트용 반, 학생, QR 세션 생성"""
+        suffix = secrets.token_hex(3)
+        assigned_class = Class.objects.create(name=f'부하테스트-{suffix}')
+        Student.objects.bulk_create([
+            Student(name=f'부하{suffix}-{i:04d}', assigned_class=assigned_class)
+            for i in range(options['students'])
+        ])
+        students = list(
+            Student.objects.filter(assigned_class=assigned_class).order_by('pk').values_list('pk', flat=True)
+        )
+        # bulk_create는 시그널을 보내지 않으므로 명단 캐시를 직접 무효화
+        invalidate_rosters([assigned_class.pk])
+
+        now = timezone.now()
+        session = QrSession.objects.create(
+            assigned_class=assigned_class,
+            lesson_date=timezone.localdate(),
+            token=secrets.token_urlsafe(32),
+            starts_at=now,
+            expires_at=now + timedelta(seconds=options['window'] + 300),
+            rotation_seconds=options['rotation'],
+        )
+        cache_session(session)
+        self.stdout.write(f'테스트 데이터 생성: 반 {assigned_class.name}, 학생 {len(students)}명, 세션 {session.pk}')
+        return session, students
+
+    def _token(self, session):
+        if session.rotation_seconds:
+            return make_rotating_token(session)
+        return session.token
+
+    def _measure_queries(self, session, student_ids):
+        """프로세스 내 클라이언트로 스캔당 쿼리 수 측정 (첫 스캔은 캐시 미스 포함)"""
+        client = Client(HTTP_HOST='localhost')
+        counts = []
+        for student_id in student_ids:
+            with CaptureQueriesContext(connection) as captured:
+                client.post(
+                    SCAN_PATH,
+                    json.dumps({'token': self._token(session), 'student_id': student_id}),
+                    content_type='application/json',
+                )
+            counts.append(len(captured))
+        return {
+            'cold': counts[0],
+            'warm_avg': round(sum(counts[1:]) / len(counts[1:]), 2),
+            'samples': counts,
+        }
+
+    def _run_load(self, session, student_ids, options):
+        """시간창 안에 균등 분산된 동시 스캔 요청 실행"""
+        url = options['base_url'].rstrip('/') + SCAN_PATH
+        window = options['window']
+        interval = window / len(student_ids)
+        local = threading.local()
+
+        def scan(index, student_id):
+            if not hasattr(local, 'http'):
+                local.http = requests.Session()
+            delay = start + index * interval - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            sent = time.perf_counter()
+            try:
+                response = local.http.post(
+                    url,
+                    json={'token': self._token(session), 'student_id': student_id},
+                    timeout=options['timeout'],
+                )
+                latency = time.perf_counter() - sent
+                if response.status_code != 200:
+                    return latency, f'http_{response.status_code}'
+                data = response.json()
+                return latency, 'success' if data.get('success') else data.get('reason', 'fail')
+            except (requests.RequestException, ValueError) as e:
+                return time.perf_counter() - sent, type(e).__name__
+
+        self.stdout.write(f'{len(student_ids)}건 스캔을 {window:g}초 동안 전송합니다 ({url})')
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as executor:
+            futures = [executor.submit(scan, i, sid) for i, sid in enumerate(student_ids)]
+            results = [future.result() for future in futures]
+        return results, time.perf_counter() - start
+
+    def _build_report(self, session, results, elapsed, queries, options):
+        latencies = sorted(latency * 1000 for latency, _ in results)
+        outcomes = {}
+        for _, outcome in results:
+            outcomes[outcome] = outcomes.get(outcome, 0) + 1
+        success = outcomes.get('success', 0)
+
+        # 스캔 로그 버퍼를 비우고 실제 기록 건수 확인
+        flush_scan_logs()
+        recorded = Attendance.objects.filter(
+            assigned_class=session.assigned_class, date=session.lesson_date
+        ).count() - QUERY_SAMPLE_SIZE
+
+        return {
+            'timestamp': timezone.now().isoformat(),
+            'config': {
+                'base_url': options['base_url'],
+                'students': options['students'],
+                'window_seconds': options['window'],
+                'concurrency': options['concurrency'],
+                'rotation_seconds': options['rotation'],
+            },
+            'requests': len(results),
+            'elapsed_seconds': round(elapsed, 3),
+            'throughput_rps': round(len(results) / elapsed, 2) if elapsed else None,
+            'latency_ms': {
+                'p50': round(percentile(latencies, 50), 2),
+                'p95': round(percentile(latencies, 95), 2),
+                'p99': round(percentile(latencies, 99), 2),
+                'max': round(latencies[-1], 2),
+            },
+            'outcomes': outcomes,
+            'errors': len(results) - success,
+            'attendance_recorded': recorded,
+            'queries_per_scan': queries,
+        }
+
+    def _print_report(self, report):
+        latency = report['latency_ms']
+        self.stdout.write(self.style.SUCCESS('\n=== QR 체크인 부하 테스트 결과 ==='))
+        self.stdout.write(f"요청: {report['requests']}건 / {report['elapsed_seconds']}초")
+        self.stdout.write(f"처리량: {report['throughput_rps']} req/s")
+        self.stdout.write(f"지연(ms): p50 {latency['p50']} / p95 {latency['p95']} / p99 {latency['p99']} / max {latency['max']}")
+        self.stdout.write(f"결과: {report['outcomes']}")
+        self.stdout.write(f"출결 기록: {report['attendance_recorded']}건")
+        queries = report['queries_per_scan']
+        self.stdout.write(f"스캔당 쿼리: 첫 스캔 {queries['cold']}개, 이후 평균 {queries['warm_avg']}개")
+        if report['errors']:
+            self.stdout.write(self.style.WARNING(f"오류/실패: {report['errors']}건"))
+
+    def _cleanup(self, session, students):
+        """테스트 데이터 삭제 (학생 삭제 시 출결/스캔 로그도 함께 삭제)"""
+        flush_scan_logs()
+        assigned_class = session.assigned_class
+        invalidate_sessions([session.token])
+        Student.objects.filter(pk__in=students).delete()
+        session.delete()
+        assigned_class.delete()
+        invalidate_rosters([assigned_class.pk])
+        self.stdout.write('테스트 데이터 삭제 완료')
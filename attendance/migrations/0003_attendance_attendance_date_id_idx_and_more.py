@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-19 10:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0002_qrsession_qrscanlog'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['date', 'id'], name='attendance_date_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='qrscanlog',
+            index=models.Index(fields=['scanned_at', 'id'], name='qr_scanlog_scanned_idx'),
+        ),
+    ]
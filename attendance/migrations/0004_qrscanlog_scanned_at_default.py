@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-19 10:48
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0003_attendance_attendance_date_id_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='qrscanlog',
+            name='scanned_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, verbose_name='스캔 시각'),
+        ),
+    ]
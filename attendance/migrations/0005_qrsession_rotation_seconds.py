@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-19 10:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0004_qrscanlog_scanned_at_default'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='qrsession',
+            name='rotation_seconds',
+            field=models.PositiveIntegerField(default=0, help_text='0이면 고정 QR, 그 외에는 N초마다 서명된 QR로 교체', verbose_name='QR 교체 주기(초)'),
+        ),
+    ]
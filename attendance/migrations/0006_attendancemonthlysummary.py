@@ -0,0 +1,59 @@
+# Generated by Django 4.2.30 on 2026-10-19 10:56
+
+from django.db import migrations, models
+from django.db.models.functions import ExtractMonth, ExtractYear
+import django.db.models.deletion
+
+
+def backfill_summaries(apps, schema_editor):
+    """기존 출결로 월간 집계 초기 생성"""
+    Attendance = apps.get_model('attendance', 'Attendance')
+    AttendanceMonthlySummary = apps.get_model('attendance', 'AttendanceMonthlySummary')
+    statuses = ['present', 'absent', 'late', 'early_leave']
+    
+    rows = (
+        Attendance.objects.order_by()
+        .annotate(year=ExtractYear('date'), month=ExtractMonth('date'))
+        .values('student_id', 'year', 'month')
+        .annotate(
+            total=models.Count('id'),
+            **{status: models.Count('id', filter=models.Q(status=status)) for status in statuses}
+        )
+    )
+    AttendanceMonthlySummary.objects.bulk_create(
+        [AttendanceMonthlySummary(**row) for row in rows],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0002_waitlist_consultlog'),
+        ('attendance', '0005_qrsession_rotation_seconds'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttendanceMonthlySummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField(verbose_name='연도')),
+                ('month', models.PositiveSmallIntegerField(verbose_name='월')),
+                ('present', models.PositiveIntegerField(default=0, verbose_name='출석')),
+                ('absent', models.PositiveIntegerField(default=0, verbose_name='결석')),
+                ('late', models.PositiveIntegerField(default=0, verbose_name='지각')),
+                ('early_leave', models.PositiveIntegerField(default=0, verbose_name='조퇴')),
+                ('total', models.PositiveIntegerField(default=0, verbose_name='전체')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attendance_summaries', to='students.student', verbose_name='학생')),
+            ],
+            options={
+                'verbose_name': '월간 출결 집계',
+                'verbose_name_plural': '월간 출결 집계 목록',
+                'ordering': ['-year', '-month', 'student'],
+                'unique_together': {('student', 'year', 'month')},
+            },
+        ),
+        migrations.RunPython(backfill_summaries, migrations.RunPython.noop),
+    ]
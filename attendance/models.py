@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from students.models import Student
 from classes.models import Class
 
@@ -38,11 +39,42 @@ class Attendance(models.Model):
         verbose_name_plural = '출결 목록'
         ordering = ['-date', 'student__name']
         unique_together = ['student', 'date']
+        indexes = [
+            models.Index(fields=['date', 'id'], name='attendance_date_id_idx'),
+        ]
     
     def __str__(self):
         return f"{self.student.name} - {self.date} ({self.get_status_display()})"
 
 
+class AttendanceMonthlySummary(models.Model):
+    """학생별 월간 출결 집계 (출결 저장 시 증분 갱신, 주기적으로 재계산)"""
+    student = models.ForeignKey(
+        Student,
+        on_delete=models.CASCADE,
+        related_name='attendance_summaries',
+        verbose_name='학생'
+    )
+    year = models.PositiveSmallIntegerField('연도')
+    month = models.PositiveSmallIntegerField('월')
+    present = models.PositiveIntegerField('출석', default=0)
+    absent = models.PositiveIntegerField('결석', default=0)
+    late = models.PositiveIntegerField('지각', default=0)
+    early_leave = models.PositiveIntegerField('조퇴', default=0)
+    total = models.PositiveIntegerField('전체', default=0)
+    
+    updated_at = models.DateTimeField('수정일', auto_now=True)
+    
+    class Meta:
+        verbose_name = '월간 출결 집계'
+        verbose_name_plural = '월간 출결 집계 목록'
+        ordering = ['-year', '-month', 'student']
+        unique_together = ['student', 'year', 'month']
+    
+    def __str__(self):
+        return f"{self.student_id} - {self.year}년 {self.month}월 ({self.total}회)"
+
+
 class QrSession(models.Model):
     """QR 출석 세션"""
     STATUS_CHOICES = [
@@ -63,6 +95,10 @@ class QrSession(models.Model):
     starts_at = models.DateTimeField('시작 시각')
     expires_at = models.DateTimeField('만료 시각')
     status = models.CharField('상태', max_length=20, choices=STATUS_CHOICES, default='active')
+    rotation_seconds = models.PositiveIntegerField(
+        'QR 교체 주기(초)', default=0,
+        help_text='0이면 고정 QR, 그 외에는 N초마다 서명된 QR로 교체'
+    )
     
     created_by = models.ForeignKey(
         'auth.User',
@@ -82,7 +118,6 @@ class QrSession(models.Model):
     
     @property
     def is_expired(self):
-        from django.utils import timezone
         return timezone.now() > self.expires_at
     
     def check_and_expire(self):
@@ -121,7 +156,8 @@ class QrScanLog(models.Model):
         verbose_name='학생'
     )
     
-    scanned_at = models.DateTimeField('스캔 시각', auto_now_add=True)
+    # 버퍼링 후 일괄 기록되므로 기록 시각이 아닌 스캔 시각을 직접 저장
+    scanned_at = models.DateTimeField('스캔 시각', default=timezone.now)
     result = models.CharField('결과', max_length=20, choices=RESULT_CHOICES)
     fail_reason = models.CharField('실패 사유', max_length=30, choices=FAIL_REASON_CHOICES, blank=True)
     
@@ -132,6 +168,9 @@ class QrScanLog(models.Model):
         verbose_name = 'QR 스캔 로그'
         verbose_name_plural = 'QR 스캔 로그 목록'
         ordering = ['-scanned_at']
+        indexes = [
+            models.Index(fields=['scanned_at', 'id'], name='qr_scanlog_scanned_idx'),
+        ]
     
     def __str__(self):
         student_name = self.student.name if self.student else '알 수 없음'
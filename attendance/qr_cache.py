@@ -0,0 +1,143 @@
+"""
+QR 출석 캐시
+스캔 API 핫패스에서 DB 조회 없이 세션을 검증하기 위해 검증에 필요한 필드만 캐시에 보관한다.
+"""
+import time
+from datetime import date
+
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+
+from students.models import Student
+from .models import QrSession
+
+SESSION_KEY = 'attendance:qr:session:{token}'
+SESSION_STATUS_KEY = 'attendance:qr:session_status:{session_id}'
+ROSTER_KEY = 'attendance:roster:{class_id}'
+ROSTER_TTL = 60 * 60 * 24
+
+# 프로세스별 캐시(LocMem)는 무효화가 다른 프로세스에 전파되지 않으므로 이 시간을 넘겨 보관하지 않음
+LOCAL_CACHE_MAX_TTL = 60
+
+# 존재하지 않는 토큰/종료된 세션은 짧게 캐시 (잘못된 토큰 반복 조회 방지)
+INACTIVE_TTL = 30
+
+# 회전형 토큰의 세션 상태 캐시 - 다른 프로세스의 캐시에 남은 상태도 이 시간 안에 종료가 반영됨
+SESSION_STATUS_TTL = 30
+
+
+def _ttl(ttl):
+    """캐시 백엔드를 고려한 TTL (프로세스별 캐시면 짧게 제한)"""
+    if isinstance(caches['default'], LocMemCache):
+        return min(ttl, LOCAL_CACHE_MAX_TTL)
+    return ttl
+
+
+def _session_key(token):
+    return SESSION_KEY.format(token=token)
+
+
+def _snapshot(session):
+    return {
+        'id': session.id,
+        'assigned_class_id': session.assigned_class_id,
+        'lesson_date': session.lesson_date.isoformat(),
+        'expires_at': session.expires_at.timestamp(),
+        'status': session.status,
+        'rotation_seconds': session.rotation_seconds,
+    }
+
+
+def cache_session(session):
+    """세션 스냅샷 저장 (TTL = 만료 시각까지)"""
+    snapshot = _snapshot(session)
+    ttl = int(snapshot['expires_at'] - time.time()) + 1
+    if session.status != 'active' or ttl <= 0:
+        ttl = INACTIVE_TTL
+    cache.set(_session_key(session.token), snapshot, timeout=_ttl(ttl))
+    return snapshot
+
+
+def get_session_snapshot(token):
+    """
+    토큰으로 세션 스냅샷 조회 (캐시 우선)
+    
+    Returns:
+        dict: 세션 스냅샷 (없는 토큰이면 None)
+    """
+    if not token:
+        return None
+    
+    key = _session_key(token)
+    snapshot = cache.get(key)
+    if snapshot is not None:
+        return snapshot or None
+    
+    session = QrSession.objects.filter(token=token).first()
+    if session is None:
+        cache.set(key, {}, timeout=INACTIVE_TTL)
+        return None
+    return cache_session(session)
+
+
+def get_session_status(session_id):
+    """
+    세션 현재 상태 (캐시 우선) - 회전형 토큰은 서명에 상태를 담을 수 없으므로 따로 확인
+    
+    Returns:
+        str: 'active', 'closed', 'expired' (없는 세션이면 None)
+    """
+    key = SESSION_STATUS_KEY.format(session_id=session_id)
+    status = cache.get(key)
+    if status is None:
+        status = QrSession.objects.filter(pk=session_id).values_list('status', flat=True).first() or ''
+        cache.set(key, status, timeout=SESSION_STATUS_TTL)
+    return status or None
+
+
+def invalidate_sessions(tokens, session_ids=()):
+    """세션 캐시 삭제 (세션 종료 시)"""
+    cache.delete_many(
+        [_session_key(token) for token in tokens]
+        + [SESSION_STATUS_KEY.format(session_id=session_id) for session_id in session_ids]
+    )
+
+
+def is_session_active(snapshot):
+    """스냅샷 기준 활성 여부 (만료는 캐시된 시각으로 판단, DB 쓰기 없음)"""
+    return snapshot['status'] == 'active' and time.time() <= snapshot['expires_at']
+
+
+def lesson_date(snapshot):
+    """스냅샷의 수업일"""
+    return date.fromisoformat(snapshot['lesson_date'])
+
+
+def get_class_roster(class_id):
+    """
+    반 재원생 명단 (캐시 우선)
+    
+    Returns:
+        dict: {'ids': 학생 id set, 'names': {id: 이름}, 'students': [{'pk', 'name'}] (이름순)}
+    """
+    key = ROSTER_KEY.format(class_id=class_id)
+    roster = cache.get(key)
+    if roster is None:
+        rows = list(
+            Student.objects.filter(assigned_class_id=class_id, status='enrolled')
+            .order_by('name').values_list('id', 'name')
+        )
+        roster = {
+            'ids': {student_id for student_id, _ in rows},
+            'names': dict(rows),
+            'students': [{'pk': student_id, 'name': name} for student_id, name in rows],
+        }
+        cache.set(key, roster, timeout=_ttl(ROSTER_TTL))
+    return roster
+
+
+def invalidate_rosters(class_ids):
+    """반 명단 캐시 삭제 (학생 저장/삭제 시)"""
+    keys = [ROSTER_KEY.format(class_id=class_id) for class_id in class_ids if class_id]
+    if keys:
+        cache.delete_many(keys)
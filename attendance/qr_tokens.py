@@ -0,0 +1,92 @@
+"""
+회전형(rotating) QR 토큰
+표시되는 QR이 N초마다 바뀌며, 토큰에 세션/반/수업일/세션 만료 시각/시간창을 담아 HMAC으로 서명한다.
+스캔 API는 DB 조회 없이 서명과 시간창만 계산해 검증한다 (스크린샷 공유 차단).
+세션 종료 여부는 서명에 담을 수 없으므로 호출 측에서 세션 상태를 따로 확인한다.
+
+토큰 형식: r2.<세션ID>.<반ID>.<수업일 YYYYMMDD>.<주기(초)>.<세션 만료 timestamp>.<시간창>.<서명>
+"""
+import base64
+import time
+from datetime import datetime
+
+from django.conf import settings
+from django.utils.crypto import constant_time_compare, salted_hmac
+
+PREFIX = 'r2'
+KEY_SALT = 'attendance.qr_tokens'
+
+
+def _sign(payload):
+    digest = salted_hmac(KEY_SALT, payload, algorithm='sha256').digest()[:12]
+    return base64.urlsafe_b64encode(digest).decode().rstrip('=')
+
+
+def current_window(rotation_seconds, now=None):
+    """현재 시간창 번호"""
+    return int((now if now is not None else time.time()) // rotation_seconds)
+
+
+def is_rotating_token(token):
+    return bool(token) and token.startswith(PREFIX + '.')
+
+
+def make_rotating_token(session, now=None):
+    """
+    현재 시간창의 회전형 토큰 생성
+    
+    Args:
+        session: rotation_seconds가 설정된 QrSession
+        now: 기준 시각 (timestamp, 테스트용)
+    
+    Returns:
+        str: 서명된 토큰
+    """
+    window = current_window(session.rotation_seconds, now)
+    payload = '.'.join([
+        PREFIX,
+        str(session.id),
+        str(session.assigned_class_id),
+        session.lesson_date.strftime('%Y%m%d'),
+        str(session.rotation_seconds),
+        str(int(session.expires_at.timestamp())),
+        str(window),
+    ])
+    return f'{payload}.{_sign(payload)}'
+
+
+def verify_rotating_token(token):
+    """
+    회전형 토큰 검증 (순수 계산, DB 조회 없음)
+    
+    Returns:
+        dict: qr_cache 세션 스냅샷과 같은 형태 (서명이 잘못되었으면 None).
+              시간창이 지났거나 세션이 만료된 토큰은 expires_at이 과거인 스냅샷을 반환한다.
+              status는 항상 'active'이므로 종료된 세션은 호출 측에서 거른다.
+    """
+    try:
+        prefix, session_id, class_id, lesson_date, rotation, session_expires_at, window, signature = token.split('.')
+        payload = token.rsplit('.', 1)[0]
+        if prefix != PREFIX or not constant_time_compare(signature, _sign(payload)):
+            return None
+        rotation = int(rotation)
+        session_expires_at = int(session_expires_at)
+        window = int(window)
+        lesson_date = datetime.strptime(lesson_date, '%Y%m%d').date()
+        session_id = int(session_id)
+        class_id = int(class_id)
+    except (AttributeError, ValueError):
+        return None
+    if rotation <= 0:
+        return None
+    
+    # 현재 시간창 + 직전 N개 시간창까지 허용 (스캔 후 이름 선택 시간 여유), 세션 만료 시각을 넘지 않음
+    expires_at = min((window + 1 + settings.QR_ROTATING_GRACE_WINDOWS) * rotation, session_expires_at)
+    return {
+        'id': session_id,
+        'assigned_class_id': class_id,
+        'lesson_date': lesson_date.isoformat(),
+        'expires_at': expires_at,
+        'status': 'active',
+        'rotation_seconds': rotation,
+    }
@@ -2,43 +2,85 @@
 QR 출석 관련 뷰
 """
 import secrets
+import hashlib
+import time
 import qrcode
+import qrcode.image.svg
 import io
-import base64
 from datetime import timedelta
 
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
-from django.http import JsonResponse
+from django.http import JsonResponse, HttpResponse, HttpResponseNotModified, Http404
+from django.core.cache import cache
+from django.urls import reverse
 from django.views.decorators.http import require_POST
 from django.views.decorators.csrf import csrf_exempt
 from django.utils import timezone
-from django.core.paginator import Paginator
-from django.db import IntegrityError
+from django.utils.dateparse import parse_date
 
 from classes.models import Class
 from students.models import Student
-from .models import Attendance, QrSession, QrScanLog
+from core.pagination import KeysetPaginator, get_querystring
+from core.utils import local_day_start
+from .models import QrSession, QrScanLog
+from .scan_log_buffer import log_scan
+from .services import record_attendance
+from .qr_cache import (
+    cache_session, get_class_roster, get_session_snapshot, get_session_status, invalidate_sessions,
+    is_session_active, lesson_date,
+)
+from .qr_tokens import current_window, is_rotating_token, make_rotating_token, verify_rotating_token
+
+
+QR_IMAGE_KEY = 'attendance:qr:image:{token}:{fmt}:{host}'
+QR_ROTATING_IMAGE_KEY = 'attendance:qr:rotating:{session_id}:{window}:{fmt}:{host}'
+ROTATION_CHOICES = [0, 10, 15, 30]
+QR_CONTENT_TYPES = {
+    'png': 'image/png',
+    'svg': 'image/svg+xml',
+}
+
+
+def render_qr(data, fmt='png'):
+    """QR 코드 이미지 바이트 생성 (png 또는 svg)"""
+    qr = qrcode.QRCode(version=1, box_size=10, border=5)
+    qr.add_data(data)
+    qr.make(fit=True)
+    
+    buffer = io.BytesIO()
+    if fmt == 'svg':
+        img = qr.make_image(image_factory=qrcode.image.svg.SvgPathImage)
+        img.save(buffer)
+    else:
+        img = qr.make_image(fill_color="black", back_color="white")
+        img.save(buffer, format='PNG')
+    return buffer.getvalue()
 
 
 @login_required
 def qr_generate(request):
     """QR 코드 생성 페이지"""
     classes = Class.objects.filter(is_active=True)
-    qr_image = None
     session = None
     
     if request.method == 'POST':
         class_id = request.POST.get('class_id')
         expiry_seconds = int(request.POST.get('expiry_seconds', 120))
+        rotation_seconds = int(request.POST.get('rotation_seconds', 0))
+        if rotation_seconds not in ROTATION_CHOICES:
+            rotation_seconds = 0
         
         assigned_class = get_object_or_404(Class, id=class_id)
         
         # 기존 활성 세션 종료
-        QrSession.objects.filter(
+        active_sessions = QrSession.objects.filter(
             assigned_class=assigned_class,
             status='active'
-        ).update(status='closed')
+        )
+        closed = list(active_sessions.values_list('pk', 'token'))
+        active_sessions.update(status='closed')
+        invalidate_sessions([token for _, token in closed], [pk for pk, _ in closed])
         
         # 새 세션 생성
         now = timezone.now()
@@ -50,27 +92,107 @@ def qr_generate(request):
             token=token,
             starts_at=now,
             expires_at=now + timedelta(seconds=expiry_seconds),
+            rotation_seconds=rotation_seconds,
             created_by=request.user
         )
-        
-        # QR 코드 생성
-        qr_url = request.build_absolute_uri(f'/attendance/qr/scan/?token={token}')
-        qr = qrcode.QRCode(version=1, box_size=10, border=5)
-        qr.add_data(qr_url)
-        qr.make(fit=True)
-        
-        img = qr.make_image(fill_color="black", back_color="white")
-        buffer = io.BytesIO()
-        img.save(buffer, format='PNG')
-        qr_image = base64.b64encode(buffer.getvalue()).decode()
+        cache_session(session)
     
+    # QR 이미지는 qr_image 엔드포인트에서 캐시된 바이트로 제공
     return render(request, 'attendance/qr_generate.html', {
         'classes': classes,
-        'qr_image': qr_image,
         'session': session,
+        'rotation_choices': ROTATION_CHOICES[1:],
     })
 
 
+def resolve_session(token):
+    """
+    스캔 토큰을 세션 스냅샷으로 변환
+    
+    회전형 토큰은 서명을 계산해 검증하고 세션 상태만 캐시에서 확인하며(종료된 세션 거부),
+    고정 토큰은 캐시된 세션을 조회한다.
+    회전형 세션의 고정 토큰은 스크린샷 공유를 막기 위해 거부한다.
+    
+    Returns:
+        dict: 세션 스냅샷 (유효하지 않은 토큰이면 None)
+    """
+    if is_rotating_token(token):
+        snapshot = verify_rotating_token(token)
+        if snapshot is None:
+            return None
+        status = get_session_status(snapshot['id'])
+        if status is None:
+            return None
+        snapshot['status'] = status
+        return snapshot
+    
+    session = get_session_snapshot(token)
+    if session and session.get('rotation_seconds'):
+        return None
+    return session
+
+
+@login_required
+def qr_image(request, token, fmt):
+    """QR 코드 이미지 (세션 만료 시까지 캐시, ETag 지원)"""
+    session = get_session_snapshot(token)
+    if session is None or not is_session_active(session):
+        raise Http404('만료되었거나 유효하지 않은 QR 코드입니다.')
+    
+    remaining = max(int(session['expires_at'] - time.time()), 1)
+    key = QR_IMAGE_KEY.format(token=token, fmt=fmt, host=request.get_host())
+    image = cache.get(key)
+    if image is None:
+        scan_url = request.build_absolute_uri(f"{reverse('attendance:qr_scan')}?token={token}")
+        content = render_qr(scan_url, fmt)
+        image = {
+            'content': content,
+            'etag': '"%s"' % hashlib.md5(content).hexdigest(),
+        }
+        cache.set(key, image, timeout=remaining)
+    
+    if request.META.get('HTTP_IF_NONE_MATCH') == image['etag']:
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(image['content'], content_type=QR_CONTENT_TYPES[fmt])
+    response['ETag'] = image['etag']
+    response['Cache-Control'] = f'private, max-age={remaining}'
+    return response
+
+
+@login_required
+def qr_rotating_image(request, session_id, fmt):
+    """회전형 QR 이미지 (시간창마다 새 토큰, 시간창 동안 캐시)"""
+    session = get_object_or_404(QrSession, pk=session_id, rotation_seconds__gt=0)
+    if session.status != 'active' or session.is_expired:
+        raise Http404('만료된 QR 세션입니다.')
+    
+    now = time.time()
+    window = current_window(session.rotation_seconds, now)
+    remaining = max(int((window + 1) * session.rotation_seconds - now), 1)
+    key = QR_ROTATING_IMAGE_KEY.format(
+        session_id=session.id, window=window, fmt=fmt, host=request.get_host()
+    )
+    image = cache.get(key)
+    if image is None:
+        token = make_rotating_token(session, now)
+        scan_url = request.build_absolute_uri(f"{reverse('attendance:qr_scan')}?token={token}")
+        content = render_qr(scan_url, fmt)
+        image = {
+            'content': content,
+            'etag': '"%s"' % hashlib.md5(content).hexdigest(),
+        }
+        cache.set(key, image, timeout=remaining)
+    
+    if request.META.get('HTTP_IF_NONE_MATCH') == image['etag']:
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(image['content'], content_type=QR_CONTENT_TYPES[fmt])
+    response['ETag'] = image['etag']
+    response['Cache-Control'] = f'private, max-age={remaining}'
+    return response
+
+
 @login_required
 def qr_scan(request):
     """QR 스캔 페이지 (학생용)"""
@@ -78,22 +200,29 @@ def qr_scan(request):
     session = None
     error = None
     
-    if token:
+    if is_rotating_token(token):
+        snapshot = verify_rotating_token(token)
+        if snapshot is None:
+            error = '유효하지 않은 QR 코드입니다.'
+        elif not is_session_active(snapshot):
+            error = '만료된 QR 코드입니다. 화면의 QR 코드를 다시 스캔해주세요.'
+        else:
+            session = QrSession.objects.select_related('assigned_class').filter(pk=snapshot['id']).first()
+            if session is None or session.status != 'active':
+                error = '만료된 QR 코드입니다.'
+    elif token:
         try:
-            session = QrSession.objects.get(token=token)
+            session = QrSession.objects.get(token=token, rotation_seconds=0)
             session.check_and_expire()
             if session.status != 'active':
                 error = '만료된 QR 코드입니다.'
         except QrSession.DoesNotExist:
             error = '유효하지 않은 QR 코드입니다.'
     
-    # 해당 반의 학생 목록
+    # 해당 반의 학생 목록 (캐시된 명단)
     students = []
     if session and session.status == 'active':
-        students = Student.objects.filter(
-            assigned_class=session.assigned_class,
-            status='enrolled'
-        ).order_by('name')
+        students = get_class_roster(session.assigned_class_id)['students']
     
     return render(request, 'attendance/qr_scan.html', {
         'token': token,
@@ -121,21 +250,18 @@ def qr_scan_api(request):
     client_ip = request.META.get('REMOTE_ADDR')
     user_agent = request.META.get('HTTP_USER_AGENT', '')[:500]
     
-    # 세션 확인
-    try:
-        session = QrSession.objects.get(token=token)
-    except QrSession.DoesNotExist:
+    # 세션 확인 (회전형은 서명 검증, 고정형은 캐시 스냅샷 - 만료는 캐시된 만료 시각으로 판단)
+    session = resolve_session(token)
+    if session is None:
         return JsonResponse({
             'success': False,
             'error': '유효하지 않은 QR 코드입니다.',
             'reason': 'invalid_token'
         })
     
-    session.check_and_expire()
-    
-    if session.status != 'active':
-        QrScanLog.objects.create(
-            qr_session=session,
+    if not is_session_active(session):
+        log_scan(
+            qr_session_id=session['id'],
             result='fail',
             fail_reason='expired',
             client_ip=client_ip,
@@ -147,28 +273,21 @@ def qr_scan_api(request):
             'reason': 'expired'
         })
     
-    # 학생 확인
+    session_date = lesson_date(session)
+    
+    # 해당 반 학생인지 확인 (캐시된 명단 set 조회)
     try:
-        student = Student.objects.get(id=student_id)
-    except Student.DoesNotExist:
-        QrScanLog.objects.create(
-            qr_session=session,
-            result='fail',
-            fail_reason='not_enrolled',
-            client_ip=client_ip,
-            user_agent=user_agent
-        )
-        return JsonResponse({
-            'success': False,
-            'error': '학생을 찾을 수 없습니다.',
-            'reason': 'not_enrolled'
-        })
+        student_id = int(student_id)
+    except (TypeError, ValueError):
+        student_id = None
+    roster = get_class_roster(session['assigned_class_id'])
     
-    # 해당 반 학생인지 확인
-    if student.assigned_class_id != session.assigned_class_id:
-        QrScanLog.objects.create(
-            qr_session=session,
-            student=student,
+    if student_id not in roster['ids']:
+        # 실패 경로에서만 학생 존재 여부 조회 (감사 로그용)
+        student_exists = student_id is not None and Student.objects.filter(id=student_id).exists()
+        log_scan(
+            qr_session_id=session['id'],
+            student_id=student_id if student_exists else None,
             result='fail',
             fail_reason='not_enrolled',
             client_ip=client_ip,
@@ -176,20 +295,25 @@ def qr_scan_api(request):
         )
         return JsonResponse({
             'success': False,
-            'error': '해당 반에 등록되지 않은 학생입니다.',
+            'error': '해당 반에 등록되지 않은 학생입니다.' if student_exists else '학생을 찾을 수 없습니다.',
             'reason': 'not_enrolled'
         })
     
-    # 중복 출석 확인
-    existing = Attendance.objects.filter(
-        student=student,
-        date=session.lesson_date
-    ).exists()
+    student_name = roster['names'][student_id]
+    
+    # 출석 처리 (이미 기록이 있으면 중복)
+    created = record_attendance(
+        student_id=student_id,
+        date=session_date,
+        assigned_class_id=session['assigned_class_id'],
+        status='present',
+        note='QR 출석'
+    )
     
-    if existing:
-        QrScanLog.objects.create(
-            qr_session=session,
-            student=student,
+    if not created:
+        log_scan(
+            qr_session_id=session['id'],
+            student_id=student_id,
             result='fail',
             fail_reason='duplicate',
             client_ip=client_ip,
@@ -201,26 +325,10 @@ def qr_scan_api(request):
             'reason': 'duplicate'
         })
     
-    # 출석 처리
-    try:
-        Attendance.objects.create(
-            student=student,
-            assigned_class=session.assigned_class,
-            date=session.lesson_date,
-            status='present',
-            note='QR 출석'
-        )
-    except IntegrityError:
-        return JsonResponse({
-            'success': False,
-            'error': '이미 출석 처리되었습니다.',
-            'reason': 'duplicate'
-        })
-    
     # 성공 로그
-    QrScanLog.objects.create(
-        qr_session=session,
-        student=student,
+    log_scan(
+        qr_session_id=session['id'],
+        student_id=student_id,
         result='success',
         client_ip=client_ip,
         user_agent=user_agent
@@ -228,7 +336,7 @@ def qr_scan_api(request):
     
     return JsonResponse({
         'success': True,
-        'message': f'{student.name}님 출석이 완료되었습니다!'
+        'message': f'{student_name}님 출석이 완료되었습니다!'
     })
 
 
@@ -247,14 +355,19 @@ def qr_logs(request):
         logs = logs.filter(qr_session__assigned_class_id=class_id)
     if result:
         logs = logs.filter(result=result)
-    if date_from:
-        logs = logs.filter(scanned_at__date__gte=date_from)
-    if date_to:
-        logs = logs.filter(scanned_at__date__lte=date_to)
+    # 날짜 필터는 인덱스를 탈 수 있도록 시각 범위로 변환
+    try:
+        from_date = parse_date(date_from) if date_from else None
+        to_date = parse_date(date_to) if date_to else None
+    except ValueError:
+        from_date = to_date = None
+    if from_date:
+        logs = logs.filter(scanned_at__gte=local_day_start(from_date))
+    if to_date:
+        logs = logs.filter(scanned_at__lt=local_day_start(to_date + timedelta(days=1)))
     
-    paginator = Paginator(logs, 50)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    paginator = KeysetPaginator(logs, 50, ordering=('-scanned_at', '-id'), estimate_total=True)
+    page_obj = paginator.get_page(request.GET.get('cursor'))
     
     classes = Class.objects.filter(is_active=True)
     
@@ -263,4 +376,5 @@ def qr_logs(request):
         'classes': classes,
         'selected_class': class_id,
         'selected_result': result,
+        'querystring': get_querystring(request),
     })
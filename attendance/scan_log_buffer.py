@@ -0,0 +1,127 @@
+"""
+QR 스캔 로그 쓰기 버퍼 (write-behind)
+스캔 응답이 감사 로그 INSERT를 기다리지 않도록 로그를 Redis 리스트에 쌓고,
+주기 태스크 또는 크기 임계치에서 bulk_create로 한 번에 기록한다.
+
+- 기록할 항목은 버퍼에서 처리 중 목록으로 옮긴 뒤(LMOVE) INSERT가 커밋된 다음에만 삭제하므로,
+  기록 도중 워커가 죽어도 다음 flush에서 처리 중 목록부터 다시 기록한다.
+- Redis가 없으면 버퍼를 공유할 방법이 없으므로(웹 프로세스마다 따로 쌓여 beat 태스크가 비울 수 없음)
+  요청 안에서 바로 기록한다.
+"""
+import json
+import logging
+
+import redis
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from core.redis_client import get_redis
+from .models import QrScanLog
+
+logger = logging.getLogger(__name__)
+
+BUFFER_KEY = 'attendance:qr:scan_log_buffer'
+PROCESSING_KEY = 'attendance:qr:scan_log_buffer:processing'
+FLUSH_LOCK_KEY = 'attendance:qr:scan_log_buffer:lock'
+FLUSH_LOCK_TIMEOUT = 60
+
+
+def log_scan(qr_session_id, result, student_id=None, fail_reason='', client_ip=None, user_agent=''):
+    """스캔 로그 버퍼에 추가 (Redis가 없으면 바로 기록)"""
+    entry = {
+        'qr_session_id': qr_session_id,
+        'student_id': student_id,
+        'result': result,
+        'fail_reason': fail_reason,
+        'client_ip': client_ip,
+        'user_agent': user_agent,
+        'scanned_at': timezone.now().isoformat(),
+    }
+    
+    client = get_redis()
+    if client is None:
+        QrScanLog.objects.bulk_create(_build_logs([entry]))
+        return
+    
+    try:
+        length = client.rpush(BUFFER_KEY, json.dumps(entry))
+    except redis.RedisError:
+        # 버퍼를 쓸 수 없으면 유실 방지를 위해 바로 기록
+        logger.warning("스캔 로그 버퍼 사용 불가 - 직접 기록", exc_info=True)
+        QrScanLog.objects.bulk_create(_build_logs([entry]))
+        return
+    if length % settings.QR_SCAN_LOG_FLUSH_SIZE == 0:
+        from .tasks import flush_qr_scan_logs
+        try:
+            flush_qr_scan_logs.delay()
+        except Exception:
+            # 감사 로그 때문에 이미 처리된 스캔이 실패하면 안 되므로 주기 flush에 맡김
+            logger.warning("스캔 로그 flush 태스크 큐잉 실패 - 주기 flush에서 기록", exc_info=True)
+
+
+def _build_logs(entries):
+    return [
+        QrScanLog(
+            qr_session_id=entry['qr_session_id'],
+            student_id=entry['student_id'],
+            result=entry['result'],
+            fail_reason=entry['fail_reason'],
+            client_ip=entry['client_ip'],
+            user_agent=entry['user_agent'],
+            scanned_at=parse_datetime(entry['scanned_at']),
+        )
+        for entry in entries
+    ]
+
+
+def _claim_batch(client, count):
+    """
+    기록할 항목 확보
+    
+    이전 flush가 끝내지 못한 처리 중 목록이 있으면 그것부터, 없으면 버퍼 앞쪽 count개를
+    처리 중 목록으로 원자적으로 옮겨 반환한다.
+    """
+    raw_entries = client.lrange(PROCESSING_KEY, 0, -1)
+    if raw_entries:
+        return raw_entries
+    pipe = client.pipeline(transaction=True)
+    for _ in range(count):
+        pipe.lmove(BUFFER_KEY, PROCESSING_KEY, 'LEFT', 'RIGHT')
+    return [raw for raw in pipe.execute() if raw is not None]
+
+
+def flush_scan_logs(batch_size=None):
+    """
+    버퍼에 쌓인 스캔 로그를 DB에 기록
+    
+    한 번에 하나의 flush만 처리 중 목록을 다루도록 Redis 잠금을 잡는다.
+    (INSERT 커밋 후 처리 중 목록 삭제 전에 죽으면 해당 배치가 한 번 더 기록될 수 있다)
+    
+    Returns:
+        int: 기록한 로그 수
+    """
+    client = get_redis()
+    if client is None:
+        return 0
+    
+    batch_size = batch_size or settings.QR_SCAN_LOG_FLUSH_SIZE
+    if not client.set(FLUSH_LOCK_KEY, 1, nx=True, ex=FLUSH_LOCK_TIMEOUT):
+        return 0
+    
+    flushed = 0
+    try:
+        while True:
+            raw_entries = _claim_batch(client, batch_size)
+            if not raw_entries:
+                break
+            with transaction.atomic():
+                QrScanLog.objects.bulk_create(_build_logs([json.loads(raw) for raw in raw_entries]))
+            client.delete(PROCESSING_KEY)
+            flushed += len(raw_entries)
+            client.expire(FLUSH_LOCK_KEY, FLUSH_LOCK_TIMEOUT)
+    finally:
+        client.delete(FLUSH_LOCK_KEY)
+    
+    return flushed
@@ -0,0 +1,122 @@
+"""
+출결 기록 서비스
+QR 체크인, 키오스크, 일괄 처리 등 여러 입력 경로가 공유하는 출결 쓰기 로직.
+"""
+from django.db import connections, router, transaction
+from django.utils import timezone
+
+from .models import Attendance
+from .summary import apply_summary_delta, rebuild_monthly_summaries
+
+INSERT_COLUMNS = ('student', 'assigned_class', 'date', 'status', 'note', 'created_at', 'updated_at')
+
+
+def record_attendance(student_id, date, assigned_class_id=None, status='present', note=''):
+    """
+    출결 기록 (학생-날짜 기록이 이미 있으면 무시)
+    
+    INSERT ... ON CONFLICT (student_id, date) DO NOTHING RETURNING id 한 번으로 처리하여
+    exists() 확인 + create() 사이의 경쟁 조건과 추가 왕복을 없앤다.
+    
+    Args:
+        student_id: 학생 ID
+        date: 출결 날짜
+        assigned_class_id: 반 ID
+        status: 출결 상태
+        note: 메모
+    
+    Returns:
+        bool: 새로 기록되었으면 True, 이미 기록이 있으면 False
+    """
+    connection = connections[router.db_for_write(Attendance)]
+    
+    if connection.vendor not in ('postgresql', 'sqlite') or not connection.features.can_return_columns_from_insert:
+        with transaction.atomic(using=connection.alias):
+            _, created = Attendance.objects.get_or_create(
+                student_id=student_id,
+                date=date,
+                defaults={'assigned_class_id': assigned_class_id, 'status': status, 'note': note},
+            )
+        return created
+    
+    now = timezone.now()
+    values = {
+        'student': student_id,
+        'assigned_class': assigned_class_id,
+        'date': date,
+        'status': status,
+        'note': note,
+        'created_at': now,
+        'updated_at': now,
+    }
+    
+    opts = Attendance._meta
+    qn = connection.ops.quote_name
+    fields = [opts.get_field(name) for name in INSERT_COLUMNS]
+    columns = ', '.join(qn(field.column) for field in fields)
+    placeholders = ', '.join(['%s'] * len(fields))
+    params = [field.get_db_prep_save(values[field.name], connection) for field in fields]
+    
+    sql = (
+        f'INSERT INTO {qn(opts.db_table)} ({columns}) VALUES ({placeholders}) '
+        f'ON CONFLICT ({qn(opts.get_field("student").column)}, {qn(opts.get_field("date").column)}) '
+        f'DO NOTHING RETURNING {qn(opts.pk.column)}'
+    )
+    with transaction.atomic(using=connection.alias):
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            created = cursor.fetchone() is not None
+        
+        # 원시 INSERT는 시그널을 보내지 않으므로 월간 집계를 직접 갱신
+        if created:
+            apply_summary_delta(student_id, date, status, 1)
+    return created
+
+
+def bulk_upsert_attendance(date, assigned_class_id, entries):
+    """
+    반 단위 출결 일괄 저장 (단일 트랜잭션, 단일 UPSERT)
+    
+    INSERT ... ON CONFLICT (student_id, date) DO UPDATE 한 번으로 반 전체를 기록한다.
+    생성/수정 건수 집계를 위해 기존 기록의 학생 ID만 먼저 한 번 조회한다.
+    
+    Args:
+        date: 출결 날짜
+        assigned_class_id: 반 ID
+        entries: [(student_id, status, note), ...]
+    
+    Returns:
+        tuple: (생성 건수, 수정 건수)
+    """
+    if not entries:
+        return 0, 0
+    
+    student_ids = [student_id for student_id, _, _ in entries]
+    objs = [
+        Attendance(
+            student_id=student_id,
+            assigned_class_id=assigned_class_id,
+            date=date,
+            status=status,
+            note=note,
+        )
+        for student_id, status, note in entries
+    ]
+    
+    with transaction.atomic(using=router.db_for_write(Attendance)):
+        existing = set(
+            Attendance.objects.select_for_update()
+            .filter(date=date, student_id__in=student_ids)
+            .values_list('student_id', flat=True)
+        )
+        Attendance.objects.bulk_create(
+            objs,
+            update_conflicts=True,
+            unique_fields=['student', 'date'],
+            update_fields=['assigned_class', 'status', 'note', 'updated_at'],
+        )
+        # bulk_create는 시그널을 보내지 않으므로 해당 학생-월 집계를 재계산
+        rebuild_monthly_summaries(date.year, date.month, student_ids)
+    
+    updated = len(existing)
+    return len(objs) - updated, updated
@@ -0,0 +1,52 @@
+"""
+Attendance app 시그널
+"""
+from django.db import transaction
+from django.db.models.signals import post_init, post_save, post_delete
+from django.dispatch import receiver
+
+from students.models import Student
+from .models import Attendance
+from .qr_cache import invalidate_rosters
+from .summary import apply_summary_delta
+
+
+@receiver(post_init, sender=Student)
+def remember_student_class(sender, instance, **kwargs):
+    """로드 시점의 반을 기억 (반 이동 시 이전 반 명단도 무효화하기 위함)"""
+    instance._roster_class_id = instance.assigned_class_id
+
+
+@receiver(post_save, sender=Student)
+@receiver(post_delete, sender=Student)
+def invalidate_student_roster(sender, instance, **kwargs):
+    """학생 저장/삭제 시 관련 반 명단 캐시 무효화"""
+    class_ids = {getattr(instance, '_roster_class_id', None), instance.assigned_class_id}
+    transaction.on_commit(lambda: invalidate_rosters(class_ids))
+    instance._roster_class_id = instance.assigned_class_id
+
+
+@receiver(post_init, sender=Attendance)
+def remember_attendance_state(sender, instance, **kwargs):
+    """로드 시점의 (학생, 날짜, 상태)를 기억 (수정 시 월간 집계 증분 계산용)"""
+    instance._summary_key = (instance.student_id, instance.date, instance.status) if instance.pk else None
+
+
+@receiver(post_save, sender=Attendance)
+def update_summary_on_save(sender, instance, created, **kwargs):
+    """출결 저장 시 월간 집계 증분 갱신"""
+    old_key = None if created else getattr(instance, '_summary_key', None)
+    new_key = (instance.student_id, instance.date, instance.status)
+    if old_key == new_key:
+        return
+    if old_key is not None:
+        apply_summary_delta(*old_key, -1)
+    apply_summary_delta(*new_key, 1)
+    instance._summary_key = new_key
+
+
+@receiver(post_delete, sender=Attendance)
+def update_summary_on_delete(sender, instance, **kwargs):
+    """출결 삭제 시 월간 집계 증분 갱신"""
+    key = getattr(instance, '_summary_key', None) or (instance.student_id, instance.date, instance.status)
+    apply_summary_delta(*key, -1)
@@ -0,0 +1,214 @@
+"""
+학생별 월간 출결 집계
+학부모 포털, 주간 리포트 등은 원본 출결을 매번 상태별로 세는 대신 이 집계를 읽는다.
+
+- 단건 저장/삭제: 시그널(QR 체크인은 서비스)에서 증분 갱신 (증가는 UPSERT 1회, 감소는 F 표현식)
+- 일괄 경로(UPSERT, 결석 자동 처리 등): 해당 학생-월만 재계산
+- 주기 태스크: 최근 월 전체 재계산 (queryset.update 등으로 생긴 오차 보정)
+"""
+from datetime import date, timedelta
+
+from django.db import connections, router, transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from .models import Attendance, AttendanceMonthlySummary
+
+STATUS_FIELDS = [status for status, _ in Attendance.STATUS_CHOICES]
+COUNT_FIELDS = STATUS_FIELDS + ['total']
+
+
+def month_range(year, month):
+    """해당 월의 [시작일, 다음 달 시작일)"""
+    start = date(year, month, 1)
+    end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    return start, end
+
+
+def _status_counts():
+    counts = {status: Count('id', filter=Q(status=status)) for status in STATUS_FIELDS}
+    counts['total'] = Count('id')
+    return counts
+
+
+def apply_summary_delta(student_id, day, status, delta):
+    """
+    출결 1건 추가/삭제를 월간 집계에 반영
+
+    Args:
+        student_id: 학생 ID
+        day: 출결 날짜
+        status: 출결 상태
+        delta: +1 (추가) 또는 -1 (삭제)
+    """
+    if status not in STATUS_FIELDS:
+        return
+    lookup = {'student_id': student_id, 'year': day.year, 'month': day.month}
+
+    if delta > 0:
+        connection = connections[router.db_for_write(AttendanceMonthlySummary)]
+        if connection.vendor in ('postgresql', 'sqlite'):
+            _upsert_delta(connection, lookup, status, delta)
+            return
+
+    changes = {status: F(status) + delta, 'total': F('total') + delta}
+    if AttendanceMonthlySummary.objects.filter(**lookup).update(**changes):
+        return
+    if delta < 0:
+        # 집계 행이 없으면 다음 재계산에서 보정
+        return
+    AttendanceMonthlySummary.objects.bulk_create(
+        [AttendanceMonthlySummary(**lookup)], ignore_conflicts=True
+    )
+    AttendanceMonthlySummary.objects.filter(**lookup).update(**changes)
+
+
+def _upsert_delta(connection, lookup, status, delta):
+    """
+    INSERT ... ON CONFLICT (student_id, year, month) DO UPDATE 한 번으로 집계 증가
+
+    QR 체크인처럼 출결 INSERT와 같은 트랜잭션에서 호출되는 경로의 왕복을 1회로 줄인다.
+    (행이 없으면 delta 값으로 생성, 있으면 상태/전체 건수에 delta를 더함)
+    """
+    opts = AttendanceMonthlySummary._meta
+    qn = connection.ops.quote_name
+    table = qn(opts.db_table)
+    values = {
+        'student': lookup['student_id'],
+        'year': lookup['year'],
+        'month': lookup['month'],
+        **{field: delta if field in (status, 'total') else 0 for field in COUNT_FIELDS},
+        'updated_at': timezone.now(),
+    }
+    fields = [opts.get_field(name) for name in values]
+    columns = ', '.join(qn(field.column) for field in fields)
+    placeholders = ', '.join(['%s'] * len(fields))
+    params = [field.get_db_prep_save(values[field.name], connection) for field in fields]
+    conflict = ', '.join(qn(opts.get_field(name).column) for name in ('student', 'year', 'month'))
+    updates = ', '.join(
+        [f'{qn(name)} = {table}.{qn(name)} + EXCLUDED.{qn(name)}' for name in (status, 'total')]
+        + [f'{qn("updated_at")} = EXCLUDED.{qn("updated_at")}']
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'INSERT INTO {table} ({columns}) VALUES ({placeholders}) '
+            f'ON CONFLICT ({conflict}) DO UPDATE SET {updates}',
+            params,
+        )
+
+
+def rebuild_monthly_summaries(year, month, student_ids=None):
+    """
+    원본 출결에서 월간 집계 재계산 (그룹 집계 1회 + UPSERT 1회)
+
+    Args:
+        year: 연도
+        month: 월
+        student_ids: 재계산할 학생 ID 목록 (None이면 해당 월 전체)
+
+    Returns:
+        int: 갱신된 집계 행 수
+    """
+    start, end = month_range(year, month)
+    attendances = Attendance.objects.filter(date__gte=start, date__lt=end)
+    if student_ids is not None:
+        student_ids = list(student_ids)
+        attendances = attendances.filter(student_id__in=student_ids)
+
+    rows = attendances.order_by().values('student_id').annotate(**_status_counts())
+    summaries = [
+        AttendanceMonthlySummary(
+            student_id=row['student_id'], year=year, month=month,
+            **{field: row[field] for field in COUNT_FIELDS}
+        )
+        for row in rows
+    ]
+
+    with transaction.atomic():
+        AttendanceMonthlySummary.objects.bulk_create(
+            summaries,
+            update_conflicts=True,
+            unique_fields=['student', 'year', 'month'],
+            update_fields=COUNT_FIELDS + ['updated_at'],
+        )
+        # 출결이 모두 삭제된 학생의 집계 제거
+        stale = AttendanceMonthlySummary.objects.filter(year=year, month=month)
+        if student_ids is not None:
+            stale = stale.filter(student_id__in=student_ids)
+        stale.exclude(student_id__in=[summary.student_id for summary in summaries]).delete()
+
+    return len(summaries)
+
+
+def get_monthly_stats(student_id, year, month):
+    """학생의 월간 출결 통계 (집계 1행 조회)"""
+    row = AttendanceMonthlySummary.objects.filter(
+        student_id=student_id, year=year, month=month
+    ).values(*COUNT_FIELDS).first()
+    return row or dict.fromkeys(COUNT_FIELDS, 0)
+
+
+def get_attendance_stats(student_id, start_date, end_date):
+    """
+    기간(양 끝 포함) 출결 통계
+
+    기간에 완전히 포함된 월은 월간 집계에서, 월 일부만 걸친 앞뒤 구간은 원본 출결에서
+    한 번의 집계 쿼리로 센다. (주간 리포트처럼 한 달 안의 기간은 집계 쿼리 1회)
+
+    Returns:
+        dict: present, absent, late, early_leave, total
+    """
+    stats = dict.fromkeys(COUNT_FIELDS, 0)
+
+    # 완전히 포함된 월 구간 [full_start, full_end)
+    full_start = start_date if start_date.day == 1 else month_range(start_date.year, start_date.month)[1]
+    full_end = month_range(end_date.year, end_date.month)[0]
+    if end_date + timedelta(days=1) == month_range(end_date.year, end_date.month)[1]:
+        full_end = end_date + timedelta(days=1)
+
+    if full_start >= full_end:
+        # 완전한 월이 없음 - 원본에서 바로 집계
+        return Attendance.objects.filter(
+            student_id=student_id, date__gte=start_date, date__lte=end_date
+        ).aggregate(**_status_counts())
+
+    month_filter = Q()
+    current = full_start
+    while current < full_end:
+        month_filter |= Q(year=current.year, month=current.month)
+        current = month_range(current.year, current.month)[1]
+    for row in AttendanceMonthlySummary.objects.filter(month_filter, student_id=student_id).values(*COUNT_FIELDS):
+        for field in COUNT_FIELDS:
+            stats[field] += row[field]
+
+    edges = Q()
+    if start_date < full_start:
+        edges |= Q(date__gte=start_date, date__lt=full_start)
+    if full_end <= end_date:
+        edges |= Q(date__gte=full_end, date__lte=end_date)
+    if edges:
+        partial = Attendance.objects.filter(edges, student_id=student_id).aggregate(**_status_counts())
+        for field in COUNT_FIELDS:
+            stats[field] += partial[field]
+
+    return stats
+
+
+def get_attendance_stats_by_student(students, start_date, end_date):
+    """
+    여러 학생의 기간(양 끝 포함) 출결 통계 (학생별 GROUP BY 집계 쿼리 1회)
+
+    Args:
+        students: 학생 ID 목록 또는 학생 쿼리셋 (서브쿼리로 사용)
+
+    Returns:
+        dict: {학생 ID: {present, absent, late, early_leave, total}} (출결이 없는 학생은 빠짐)
+    """
+    rows = (
+        Attendance.objects.filter(student__in=students, date__gte=start_date, date__lte=end_date)
+        .order_by()
+        .values('student_id')
+        .annotate(**_status_counts())
+    )
+    return {row.pop('student_id'): row for row in rows}
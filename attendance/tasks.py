@@ -0,0 +1,152 @@
+"""
+Attendance app Celery tasks.
+"""
+
+from celery import shared_task
+from celery.signals import worker_shutdown
+from django.utils import timezone
+
+
+@shared_task
+def expire_qr_sessions():
+    """만료 시각이 지난 QR 세션 상태 일괄 갱신"""
+    from .models import QrSession
+    
+    expired = QrSession.objects.filter(
+        status='active',
+        expires_at__lt=timezone.now()
+    ).update(status='expired')
+    
+    return {'status': 'success', 'expired': expired}
+
+
+@shared_task
+def flush_qr_scan_logs():
+    """버퍼에 쌓인 QR 스캔 로그 일괄 기록"""
+    from .scan_log_buffer import flush_scan_logs
+    
+    return {'status': 'success', 'flushed': flush_scan_logs()}
+
+
+@shared_task
+def rebuild_attendance_summaries(months=2):
+    """
+    최근 N개월 월간 출결 집계 재계산
+    
+    시그널을 거치지 않는 쓰기(queryset.update/delete 등)로 생긴 오차를 보정한다.
+    """
+    from .summary import rebuild_monthly_summaries
+    
+    today = timezone.localdate()
+    year, month = today.year, today.month
+    rebuilt = 0
+    for _ in range(months):
+        rebuilt += rebuild_monthly_summaries(year, month)
+        year, month = (year - 1, 12) if month == 1 else (year, month - 1)
+    
+    return {'status': 'success', 'rebuilt': rebuilt}
+
+
+@shared_task
+def mark_absences(day=None):
+    """
+    수업이 끝난 반의 미출석 학생을 결석으로 일괄 기록
+    
+    수업 요일이고 종료 시각 + 유예 시간이 지난 반(휴원 반 제외)의 재원생 중
+    해당 날짜 출결이 없는 학생을 한 번의 NOT EXISTS 쿼리로 찾아 bulk_create 한다.
+    학생 수와 무관하게 쿼리 수가 일정하며, 이미 기록된 학생은 건드리지 않으므로 반복 실행해도 안전하다.
+    
+    날짜를 지정하지 않으면 (현재 - 유예 시간)이 속한 날짜와 그 전날을 처리한다.
+    자정 직전에 끝나는 반은 자정이 지나서 전날로 처리되고, 놓친 실행도 다음 날 안에 보충된다.
+    
+    Args:
+        day: 처리할 날짜 (YYYY-MM-DD - 지난 날짜는 종료 시각과 무관하게 전체 처리)
+    """
+    from datetime import date, timedelta
+    from django.conf import settings
+    
+    cutoff = timezone.localtime() - timedelta(minutes=settings.ATTENDANCE_AUTO_ABSENT_GRACE_MINUTES)
+    if day:
+        targets = [date.fromisoformat(day)]
+    else:
+        targets = [cutoff.date() - timedelta(days=1), cutoff.date()]
+    
+    results = [_mark_absences_on(target, cutoff) for target in targets]
+    if len(results) == 1:
+        return results[0]
+    return {'status': 'success', 'marked': sum(result.get('marked', 0) for result in results), 'results': results}
+
+
+def _mark_absences_on(target, cutoff):
+    """한 날짜의 미출석 학생 결석 처리 (cutoff 날짜면 cutoff 시각까지 끝난 반만)"""
+    from django.db.models import Exists, OuterRef
+    from classes.models import Class
+    from schedule.models import HolidayRange
+    from students.models import Student
+    from .models import Attendance
+    from .summary import rebuild_monthly_summaries
+    
+    if target > cutoff.date():
+        return {'status': 'skipped', 'reason': 'future', 'date': target.isoformat()}
+    weekday = Class.WEEKDAY_CHOICES[target.weekday()][0]
+    
+    # 휴원일 확인 (전체 휴원이면 종료)
+    holidays = HolidayRange.objects.filter(start_date__lte=target, end_date__gte=target)
+    if holidays.filter(affects_all=True).exists():
+        return {'status': 'skipped', 'reason': 'holiday', 'date': target.isoformat()}
+    
+    classes = Class.objects.filter(
+        is_active=True,
+        weekdays__contains=weekday,
+        end_time__isnull=False,
+    ).exclude(holidays__in=holidays)
+    if target == cutoff.date():
+        classes = classes.filter(end_time__lte=cutoff.time())
+    
+    # 출결이 없는 재원생 (집합 차이)
+    missing = list(
+        Student.objects.filter(status='enrolled', assigned_class__in=classes)
+        .exclude(Exists(Attendance.objects.filter(student=OuterRef('pk'), date=target)))
+        .values_list('pk', 'assigned_class_id')
+    )
+    if not missing:
+        return {'status': 'success', 'marked': 0, 'date': target.isoformat()}
+    
+    started_at = timezone.now()
+    Attendance.objects.bulk_create(
+        [
+            Attendance(
+                student_id=student_id,
+                assigned_class_id=class_id,
+                date=target,
+                status='absent',
+                note='자동 결석 처리',
+            )
+            for student_id, class_id in missing
+        ],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+    student_ids = [student_id for student_id, _ in missing]
+    rebuild_monthly_summaries(target.year, target.month, student_ids)
+    
+    # 이번 실행에서 실제로 기록된 학생 (사이에 교사가 입력한 학생 제외)
+    marked_ids = list(
+        Attendance.objects.filter(
+            date=target, student_id__in=student_ids, status='absent', created_at__gte=started_at
+        ).values_list('student_id', flat=True)
+    )
+    
+    # 오늘 결석이면 결석 알림 트리거 평가 (자동 발송 템플릿이 있을 때만 발송)
+    if marked_ids and target == timezone.localdate():
+        from notifications.tasks import evaluate_notification_triggers
+        evaluate_notification_triggers.delay(['absent'])
+    return {'status': 'success', 'marked': len(marked_ids), 'date': target.isoformat()}
+
+
+@worker_shutdown.connect
+def flush_qr_scan_logs_on_shutdown(**kwargs):
+    """워커 종료 시 남은 스캔 로그 기록"""
+    from .scan_log_buffer import flush_scan_logs
+    
+    flush_scan_logs()
@@ -0,0 +1,61 @@
+from datetime import date
+
+from django.test import TestCase
+
+from classes.models import Class
+from students.models import Student
+from .models import Attendance
+from .summary import get_attendance_stats
+
+COUNT_FIELDS = ('present', 'absent', 'late', 'early_leave', 'total')
+
+
+class AttendanceStatsTests(TestCase):
+    """월간 집계 + 원본 출결을 합친 기간 통계"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        assigned_class = Class.objects.create(
+            name='테스트반', weekdays='mon,wed,fri', start_time='15:00', end_time='17:00',
+        )
+        cls.student = Student.objects.create(name='홍길동', assigned_class=assigned_class, parent_phone='010-1234-5678')
+        records = [
+            (date(2025, 1, 20), 'present'),
+            (date(2025, 1, 31), 'late'),
+            (date(2025, 2, 1), 'present'),
+            (date(2025, 2, 15), 'absent'),
+            (date(2025, 2, 28), 'early_leave'),
+            (date(2025, 3, 1), 'present'),
+            (date(2025, 3, 10), 'early_leave'),
+            (date(2025, 3, 20), 'present'),
+        ]
+        for day, status in records:
+            Attendance.objects.create(student=cls.student, assigned_class=assigned_class, date=day, status=status)
+    
+    def _raw_stats(self, start, end):
+        attendances = Attendance.objects.filter(student=self.student, date__gte=start, date__lte=end)
+        stats = {status: attendances.filter(status=status).count() for status in COUNT_FIELDS[:-1]}
+        stats['total'] = attendances.count()
+        return stats
+    
+    def _stats(self, start, end):
+        stats = get_attendance_stats(self.student.pk, start, end)
+        return {field: stats[field] for field in COUNT_FIELDS}
+    
+    def test_range_spanning_partial_months(self):
+        # 1월 말 일부 + 2월 전체 + 3월 초 일부
+        stats = self._stats(date(2025, 1, 25), date(2025, 3, 10))
+        
+        self.assertEqual(stats, {'present': 2, 'absent': 1, 'late': 1, 'early_leave': 2, 'total': 6})
+    
+    def test_matches_raw_counts(self):
+        ranges = [
+            (date(2025, 1, 1), date(2025, 3, 31)),
+            (date(2025, 1, 31), date(2025, 2, 1)),
+            (date(2025, 2, 1), date(2025, 2, 28)),
+            (date(2025, 2, 2), date(2025, 3, 19)),
+            (date(2025, 3, 5), date(2025, 3, 15)),
+        ]
+        for start, end in ranges:
+            with self.subTest(start=start, end=end):
+                self.assertEqual(self._stats(start, end), self._raw_stats(start, end))
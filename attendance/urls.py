@@ -1,4 +1,4 @@
-from django.urls import path
+from django.urls import path, re_path
 from . import views
 from . import qr_views
 
@@ -13,6 +13,8 @@ urlpatterns = [
     
     # QR 출석
     path('qr/generate/', qr_views.qr_generate, name='qr_generate'),
+    re_path(r'^qr/image/(?P<token>[\w-]+)\.(?P<fmt>png|svg)$', qr_views.qr_image, name='qr_image'),
+    re_path(r'^qr/rotating/(?P<session_id>\d+)\.(?P<fmt>png|svg)$', qr_views.qr_rotating_image, name='qr_rotating_image'),
     path('qr/scan/', qr_views.qr_scan, name='qr_scan'),
     path('qr/scan/api/', qr_views.qr_scan_api, name='qr_scan_api'),
     path('qr/logs/', qr_views.qr_logs, name='qr_logs'),
@@ -1,7 +1,6 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.core.paginator import Paginator
 from django.db.models import Q, Count
 from django.utils import timezone
 from datetime import datetime, timedelta
@@ -9,9 +8,11 @@ import logging
 
 from .models import Attendance
 from .forms import AttendanceForm, BulkAttendanceForm
+from .services import bulk_upsert_attendance
 from students.models import Student
 from classes.models import Class
 from core.utils import parse_date_safe
+from core.pagination import KeysetPaginator, get_querystring
 
 logger = logging.getLogger(__name__)
 
@@ -43,11 +44,9 @@ def attendance_list(request):
     if status:
         attendances = attendances.filter(status=status)
     
-    # 정렬 및 페이지네이션
-    attendances = attendances.order_by('-date', '-id')
-    paginator = Paginator(attendances, 20)
-    page = request.GET.get('page', 1)
-    attendances = paginator.get_page(page)
+    # 정렬 및 페이지네이션 (날짜, id 기준 커서)
+    paginator = KeysetPaginator(attendances, 20, ordering=('-date', '-id'), estimate_total=True)
+    attendances = paginator.get_page(request.GET.get('cursor'))
     
     # 활성 반 목록
     classes = Class.objects.filter(is_active=True)
@@ -59,6 +58,7 @@ def attendance_list(request):
         'class_id': class_id,
         'student_id': student_id,
         'status': status,
+        'querystring': get_querystring(request),
     })
 
 
@@ -147,30 +147,32 @@ def attendance_bulk(request):
                 return redirect('attendance:bulk')
             
             # 학생 목록 조회
-            students = Student.objects.filter(assigned_class=class_obj, status='enrolled')
+            student_ids = list(
+                Student.objects.filter(assigned_class=class_obj, status='enrolled')
+                .values_list('pk', flat=True)
+            )
             
-            if not students.exists():
+            if not student_ids:
                 messages.warning(request, '해당 반에 등록된 학생이 없습니다.')
                 return redirect('attendance:bulk')
             
-            # 출결 처리
-            processed_count = 0
-            for student in students:
-                status = request.POST.get(f'status_{student.pk}', 'present')
-                note = request.POST.get(f'note_{student.pk}', '')
-                
-                Attendance.objects.update_or_create(
-                    student=student,
-                    date=filter_date,
-                    defaults={
-                        'assigned_class': class_obj,
-                        'status': status,
-                        'note': note
-                    }
-                )
-                processed_count += 1
+            # 출결 처리 (반 전체를 한 번의 UPSERT로 기록)
+            valid_statuses = dict(Attendance.STATUS_CHOICES)
+            entries = []
+            for student_id in student_ids:
+                status = request.POST.get(f'status_{student_id}', 'present')
+                if status not in valid_statuses:
+                    status = 'present'
+                note = request.POST.get(f'note_{student_id}', '')
+                entries.append((student_id, status, note))
             
-            messages.success(request, f'{processed_count}명의 출결이 처리되었습니다.')
+            created_count, updated_count = bulk_upsert_attendance(filter_date, class_obj.pk, entries)
+            
+            messages.success(
+                request,
+                f'{created_count + updated_count}명의 출결이 처리되었습니다. '
+                f'(신규 {created_count}건, 수정 {updated_count}건)'
+            )
             return redirect('attendance:list')
             
         except Exception as e:
@@ -109,6 +109,28 @@ else:
     }
 
 
+# Cache
+# Redis가 설정되면 프로세스 간 공유 캐시로 사용, 없으면 로컬 메모리 캐시
+REDIS_URL = os.getenv('REDIS_URL', '')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# 시스템 설정 캐시 버전 확인 주기 (초)
+SYSTEM_SETTINGS_CHECK_INTERVAL = 1.0
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -180,6 +202,61 @@ CELERY_ENABLE_UTC = True
 # Celery Beat 스케줄 (정기 작업)
 from celery.schedules import crontab
 CELERY_BEAT_SCHEDULE = {
+    # 실패 메시지 재시도 (1분마다, 백오프 시각이 지난 메시지만)
+    'retry-failed-messages': {
+        'task': 'core.tasks.retry_failed_messages',
+        'schedule': 60.0,
+    },
+    # 오래된 로그 아카이브 (매일 새벽 3시)
+    'archive-old-logs': {
+        'task': 'core.tasks.archive_old_logs',
+        'schedule': crontab(hour=3, minute=0),
+    },
+    # 큐 적체량 샘플링 (30초마다)
+    'sample-queue-depth': {
+        'task': 'core.tasks.sample_queue_depth',
+        'schedule': 30.0,
+    },
+    # 만료된 QR 세션 상태 갱신 (5분마다)
+    'expire-qr-sessions': {
+        'task': 'attendance.tasks.expire_qr_sessions',
+        'schedule': 300.0,
+    },
+    # QR 스캔 로그 버퍼 기록 (10초마다)
+    'flush-qr-scan-logs': {
+        'task': 'attendance.tasks.flush_qr_scan_logs',
+        'schedule': 10.0,
+    },
+    # 수업 종료 후 미출석 학생 결석 처리 (15분마다)
+    'mark-absences': {
+        'task': 'attendance.tasks.mark_absences',
+        'schedule': 900.0,
+    },
+    # 예약 알림 발송 (1분마다, 예약 시각이 지난 작업만)
+    'dispatch-scheduled-notifications': {
+        'task': 'notifications.tasks.dispatch_scheduled_jobs',
+        'schedule': 60.0,
+    },
+    # 자동 발송 알림 트리거 평가 (10분마다, 템플릿 발송 시각 이후)
+    'evaluate-notification-triggers': {
+        'task': 'notifications.tasks.evaluate_notification_triggers',
+        'schedule': 600.0,
+    },
+    # 중단된 알림 발송 작업 재개 (5분마다, 선점이 만료된 미완료 아웃박스가 있는 작업)
+    'resume-stalled-notifications': {
+        'task': 'notifications.tasks.resume_stalled_notification_jobs',
+        'schedule': 300.0,
+    },
+    # 끝난 알림 발송 아웃박스 정리 (매일 새벽 3시 30분)
+    'purge-notification-outbox': {
+        'task': 'notifications.tasks.purge_notification_outbox',
+        'schedule': crontab(hour=3, minute=30),
+    },
+    # 월간 출결 집계 재계산 (매일 새벽 2시 30분, 이번 달과 지난 달)
+    'rebuild-attendance-summaries': {
+        'task': 'attendance.tasks.rebuild_attendance_summaries',
+        'schedule': crontab(hour=2, minute=30),
+    },
     # 예시: 매일 오전 9시에 미납 알림 발송
     # 'send-unpaid-notifications': {
     #     'task': 'payments.tasks.send_unpaid_notifications',
@@ -188,5 +265,43 @@ CELERY_BEAT_SCHEDULE = {
 }
 
 
+# 모니터링 설정
+CELERY_MONITORED_QUEUES = ['celery']                # 적체량을 샘플링할 큐
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')      # /core/metrics/ 스크래핑용 Bearer 토큰
+
+
+# QR 스캔 로그 버퍼 (이 건수마다 즉시 기록, 그 외에는 주기 태스크가 기록)
+QR_SCAN_LOG_FLUSH_SIZE = 200
+
+# 회전형 QR 토큰 - 현재 시간창 외에 허용할 직전 시간창 수
+QR_ROTATING_GRACE_WINDOWS = 2
+
+# 자동 결석 처리 - 수업 종료 후 이 시간(분)이 지나도 출결이 없으면 결석으로 기록
+ATTENDANCE_AUTO_ABSENT_GRACE_MINUTES = 30
+
+
+# 메시지 재시도 설정 (지수 백오프)
+MESSAGE_RETRY_MAX_ATTEMPTS = 5          # 최대 시도 횟수
+MESSAGE_RETRY_BASE_DELAY = 60           # 첫 재시도 지연 (초)
+MESSAGE_RETRY_MAX_DELAY = 60 * 60       # 최대 재시도 지연 (초)
+MESSAGE_RETRY_BATCH_SIZE = 200          # 스케줄러 1회당 재큐잉 건수
+MESSAGE_RETRY_LEASE_SECONDS = 5 * 60    # 재큐잉/발송 선점 후 끝나지 않으면 다시 재큐잉할 때까지 (초)
+
+
+# 알림 발송
+NOTIFICATION_PROVIDER = 'notifications.providers.SimulatedProvider'   # 발송 제공자 클래스
+NOTIFICATION_CHUNK_SIZE = 200           # 태스크 하나가 처리할 수신자 수
+NOTIFICATION_LOG_BATCH_SIZE = 500       # 발송 로그 bulk_create 배치 크기
+NOTIFICATION_DISPATCH_BATCH_SIZE = 100  # 예약 발송 디스패처 1회당 분배 작업 수
+NOTIFICATION_OUTBOX_RETENTION_DAYS = 7  # 로그로 옮겨진 아웃박스 행 보관 일수
+NOTIFICATION_OUTBOX_LEASE_SECONDS = 600 # 아웃박스 행 발송 선점 유효 시간 (청크 발송 시간보다 길게)
+NOTIFICATION_RESUME_BATCH_SIZE = 20     # 재개 스윕 1회당 재개할 작업 수
+
+
+# 로그 보관 설정 (보관 기간이 지난 로그는 압축 아카이브 + 월별 요약만 유지)
+LOG_RETENTION_MONTHS = 6
+LOG_ARCHIVE_BATCH_SIZE = 1000
+
+
 # Simple History 설정
 SIMPLE_HISTORY_HISTORY_CHANGE_REASON_USE_TEXT_FIELD = True
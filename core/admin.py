@@ -1,14 +1,14 @@
 from django.contrib import admin
 from simple_history.admin import SimpleHistoryAdmin
-from .models import MessageLog, Notification, SystemSetting, Backup
+from .models import MessageLog, Notification, SystemSetting, Backup, LogArchive, LogMonthlySummary
 
 
 @admin.register(MessageLog)
 class MessageLogAdmin(admin.ModelAdmin):
-    list_display = ['message_type', 'recipient', 'status', 'sent_at', 'created_at']
+    list_display = ['message_type', 'recipient', 'status', 'retry_count', 'next_retry_at', 'sent_at', 'created_at']
     list_filter = ['message_type', 'status', 'created_at']
     search_fields = ['recipient', 'recipient_phone', 'content']
-    readonly_fields = ['created_at', 'sent_at']
+    readonly_fields = ['created_at', 'sent_at', 'next_retry_at']
 
 
 @admin.register(Notification)
@@ -30,3 +30,17 @@ class BackupAdmin(admin.ModelAdmin):
     list_display = ['filename', 'status', 'file_size', 'created_at', 'completed_at']
     list_filter = ['status', 'created_at']
     readonly_fields = ['created_at', 'completed_at']
+
+
+@admin.register(LogArchive)
+class LogArchiveAdmin(admin.ModelAdmin):
+    list_display = ['source', 'first_id', 'last_id', 'row_count', 'period_start', 'period_end', 'created_at']
+    list_filter = ['source', 'created_at']
+    exclude = ['data']
+    readonly_fields = ['source', 'first_id', 'last_id', 'row_count', 'period_start', 'period_end', 'created_at']
+
+
+@admin.register(LogMonthlySummary)
+class LogMonthlySummaryAdmin(admin.ModelAdmin):
+    list_display = ['source', 'year', 'month', 'status', 'count']
+    list_filter = ['source', 'year', 'status']
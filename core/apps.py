@@ -5,3 +5,7 @@ class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
     verbose_name = '핵심 기능'
+    
+    def ready(self):
+        from . import signals  # noqa: F401
+        from . import monitoring  # noqa: F401  (Celery 시그널 연결)
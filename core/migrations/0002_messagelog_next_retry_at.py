@@ -0,0 +1,22 @@
+# Generated by Django 4.2.30 on 2026-10-19 10:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='messagelog',
+            name='next_retry_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='다음 재시도 시각'),
+        ),
+        migrations.AddIndex(
+            model_name='messagelog',
+            index=models.Index(fields=['status', 'next_retry_at'], name='core_msglog_retry_idx'),
+        ),
+    ]
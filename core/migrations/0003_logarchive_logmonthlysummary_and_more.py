@@ -0,0 +1,56 @@
+# Generated by Django 4.2.30 on 2026-10-19 10:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_messagelog_next_retry_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LogArchive',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(choices=[('message_log', '메시지 로그'), ('notification_log', '알림 발송 로그')], max_length=30, verbose_name='원본')),
+                ('first_id', models.BigIntegerField(verbose_name='시작 ID')),
+                ('last_id', models.BigIntegerField(verbose_name='종료 ID')),
+                ('period_start', models.DateTimeField(verbose_name='기간 시작')),
+                ('period_end', models.DateTimeField(verbose_name='기간 종료')),
+                ('row_count', models.PositiveIntegerField(verbose_name='건수')),
+                ('data', models.BinaryField(verbose_name='압축 데이터')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+            ],
+            options={
+                'verbose_name': '로그 아카이브',
+                'verbose_name_plural': '로그 아카이브 목록',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='LogMonthlySummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(choices=[('message_log', '메시지 로그'), ('notification_log', '알림 발송 로그')], max_length=30, verbose_name='원본')),
+                ('year', models.IntegerField(verbose_name='년도')),
+                ('month', models.IntegerField(verbose_name='월')),
+                ('status', models.CharField(max_length=20, verbose_name='상태')),
+                ('count', models.PositiveIntegerField(default=0, verbose_name='건수')),
+            ],
+            options={
+                'verbose_name': '로그 월별 요약',
+                'verbose_name_plural': '로그 월별 요약 목록',
+                'ordering': ['source', '-year', '-month', 'status'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='messagelog',
+            index=models.Index(fields=['created_at', 'id'], name='core_msglog_created_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='logmonthlysummary',
+            unique_together={('source', 'year', 'month', 'status')},
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-19 11:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_logarchive_logmonthlysummary_and_more'),
+    ]
+    
+    operations = [
+        migrations.AlterField(
+            model_name='messagelog',
+            name='status',
+            field=models.CharField(choices=[('pending', '대기'), ('sending', '발송 중'), ('sent', '발송 완료'), ('failed', '발송 실패'), ('retry', '재시도')], default='pending', max_length=20, verbose_name='상태'),
+        ),
+    ]
@@ -1,7 +1,15 @@
+import gzip
+import json
+from datetime import timedelta
+
+from django.conf import settings
 from django.db import models
 from django.contrib.auth.models import User
+from django.utils import timezone
 from simple_history.models import HistoricalRecords
 
+from .utils import calculate_backoff
+
 
 class MessageLog(models.Model):
     """SMS/알림톡 발송 기록"""
@@ -12,6 +20,7 @@ class MessageLog(models.Model):
     ]
     STATUS_CHOICES = [
         ('pending', '대기'),
+        ('sending', '발송 중'),
         ('sent', '발송 완료'),
         ('failed', '발송 실패'),
         ('retry', '재시도'),
@@ -25,6 +34,7 @@ class MessageLog(models.Model):
     status = models.CharField('상태', max_length=20, choices=STATUS_CHOICES, default='pending')
     error_message = models.TextField('오류 메시지', blank=True)
     retry_count = models.PositiveIntegerField('재시도 횟수', default=0)
+    next_retry_at = models.DateTimeField('다음 재시도 시각', null=True, blank=True)
     sent_at = models.DateTimeField('발송 시각', null=True, blank=True)
     created_at = models.DateTimeField('생성일', auto_now_add=True)
     created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, verbose_name='발송자')
@@ -33,9 +43,32 @@ class MessageLog(models.Model):
         verbose_name = '메시지 로그'
         verbose_name_plural = '메시지 로그 목록'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'next_retry_at'], name='core_msglog_retry_idx'),
+            models.Index(fields=['created_at', 'id'], name='core_msglog_created_idx'),
+        ]
     
     def __str__(self):
         return f"[{self.get_message_type_display()}] {self.recipient} - {self.get_status_display()}"
+    
+    def mark_failed(self, error):
+        """발송 실패 처리 - 재시도 가능하면 백오프 후 재시도 예약"""
+        self.error_message = str(error)
+        self.retry_count += 1
+        
+        if self.retry_count < settings.MESSAGE_RETRY_MAX_ATTEMPTS:
+            delay = calculate_backoff(
+                self.retry_count,
+                base=settings.MESSAGE_RETRY_BASE_DELAY,
+                cap=settings.MESSAGE_RETRY_MAX_DELAY,
+            )
+            self.status = 'retry'
+            self.next_retry_at = timezone.now() + timedelta(seconds=delay)
+        else:
+            self.status = 'failed'
+            self.next_retry_at = None
+        
+        self.save(update_fields=['status', 'error_message', 'retry_count', 'next_retry_at'])
 
 
 class Notification(models.Model):
@@ -108,3 +141,50 @@ class Backup(models.Model):
     
     def __str__(self):
         return f"{self.filename} ({self.get_status_display()})"
+
+
+class LogArchive(models.Model):
+    """오래된 로그 아카이브 (gzip 압축 JSON)"""
+    SOURCE_CHOICES = [
+        ('message_log', '메시지 로그'),
+        ('notification_log', '알림 발송 로그'),
+    ]
+    
+    source = models.CharField('원본', max_length=30, choices=SOURCE_CHOICES)
+    first_id = models.BigIntegerField('시작 ID')
+    last_id = models.BigIntegerField('종료 ID')
+    period_start = models.DateTimeField('기간 시작')
+    period_end = models.DateTimeField('기간 종료')
+    row_count = models.PositiveIntegerField('건수')
+    data = models.BinaryField('압축 데이터')
+    created_at = models.DateTimeField('생성일', auto_now_add=True)
+    
+    class Meta:
+        verbose_name = '로그 아카이브'
+        verbose_name_plural = '로그 아카이브 목록'
+        ordering = ['-created_at']
+    
+    def __str__(self):
+        return f"[{self.get_source_display()}] #{self.first_id}~#{self.last_id} ({self.row_count}건)"
+    
+    def load_rows(self):
+        """압축 해제된 원본 행 목록"""
+        return json.loads(gzip.decompress(bytes(self.data)).decode('utf-8'))
+
+
+class LogMonthlySummary(models.Model):
+    """아카이브된 로그의 월별/상태별 건수"""
+    source = models.CharField('원본', max_length=30, choices=LogArchive.SOURCE_CHOICES)
+    year = models.IntegerField('년도')
+    month = models.IntegerField('월')
+    status = models.CharField('상태', max_length=20)
+    count = models.PositiveIntegerField('건수', default=0)
+    
+    class Meta:
+        verbose_name = '로그 월별 요약'
+        verbose_name_plural = '로그 월별 요약 목록'
+        ordering = ['source', '-year', '-month', 'status']
+        unique_together = ['source', 'year', 'month', 'status']
+    
+    def __str__(self):
+        return f"[{self.get_source_display()}] {self.year}년 {self.month}월 {self.status}: {self.count}건"
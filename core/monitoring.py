@@ -0,0 +1,235 @@
+"""
+Celery 태스크 모니터링
+Celery 시그널로 태스크별 실행 시간 히스토그램/재시도/실패를 캐시(Redis)에 누적하고,
+브로커 큐 적체량을 주기적으로 샘플링한다. 데이터는 /core/metrics/ 와 관리자 모니터 화면에서 조회한다.
+
+워커와 웹 프로세스가 같은 저장소를 봐야 하므로 Redis가 없으면(프로세스별 LocMem 캐시) 기록하지 않는다.
+"""
+import logging
+import time
+
+from celery.signals import task_prerun, task_postrun, task_retry, task_failure
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.utils import timezone
+
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+PREFIX = 'celery:metrics'
+TASK_NAMES_KEY = f'{PREFIX}:tasks'
+QUEUE_HISTORY_SIZE = 120
+
+# 실행 시간 히스토그램 구간 (초)
+RUNTIME_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+
+_started = {}
+
+
+def is_available():
+    """메트릭 저장소를 프로세스 간에 공유하는지 (LocMem이면 워커가 기록한 값을 웹에서 볼 수 없음)"""
+    return get_redis() is not None and not isinstance(caches['default'], LocMemCache)
+
+
+def _incr(key, delta=1):
+    """캐시 카운터 증가 (키가 없으면 생성)"""
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        if not cache.add(key, delta, timeout=None):
+            cache.incr(key, delta)
+
+
+def _register_task(name):
+    """태스크 이름 등록 (Redis 집합에 SADD하므로 여러 워커가 동시에 등록해도 누락되지 않음)"""
+    client = get_redis()
+    if client is not None:
+        client.sadd(TASK_NAMES_KEY, name)
+
+
+def _get_task_names():
+    client = get_redis()
+    if client is None:
+        return []
+    return sorted(name.decode() for name in client.smembers(TASK_NAMES_KEY))
+
+
+def _task_key(name, metric):
+    return f'{PREFIX}:task:{name}:{metric}'
+
+
+def _safe(handler):
+    """공유 저장소가 없으면 기록하지 않고, 모니터링 오류가 태스크 실행에 영향을 주지 않도록 보호"""
+    def wrapper(*args, **kwargs):
+        if not is_available():
+            return
+        try:
+            handler(*args, **kwargs)
+        except Exception:
+            logger.warning("태스크 메트릭 기록 실패", exc_info=True)
+    wrapper.__name__ = handler.__name__
+    return wrapper
+
+
+@task_prerun.connect(weak=False)
+@_safe
+def record_task_start(task_id=None, task=None, **kwargs):
+    _started[task_id] = time.monotonic()
+
+
+@task_postrun.connect(weak=False)
+@_safe
+def record_task_runtime(task_id=None, task=None, state=None, **kwargs):
+    started = _started.pop(task_id, None)
+    if started is None or task is None:
+        return
+    runtime = time.monotonic() - started
+    name = task.name
+    
+    _register_task(name)
+    _incr(_task_key(name, 'count'))
+    _incr(_task_key(name, 'runtime_ms'), int(runtime * 1000))
+    for bucket in RUNTIME_BUCKETS:
+        if runtime <= bucket:
+            _incr(_task_key(name, f'bucket:{bucket}'))
+            break
+    if state == 'SUCCESS':
+        _incr(_task_key(name, 'success'))
+
+
+@task_retry.connect(weak=False)
+@_safe
+def record_task_retry(sender=None, request=None, **kwargs):
+    name = getattr(sender, 'name', None) or getattr(request, 'task', None)
+    if name:
+        _register_task(name)
+        _incr(_task_key(name, 'retries'))
+
+
+@task_failure.connect(weak=False)
+@_safe
+def record_task_failure(sender=None, **kwargs):
+    if sender is not None:
+        _register_task(sender.name)
+        _incr(_task_key(sender.name, 'failures'))
+
+
+def estimate_quantile(buckets, count, quantile):
+    """히스토그램 구간으로 분위수 근사 (구간 상한값)"""
+    if not count:
+        return None
+    target = count * quantile
+    cumulative = 0
+    for bound, value in buckets:
+        cumulative += value
+        if cumulative >= target:
+            return bound
+    return None
+
+
+def get_task_metrics():
+    """
+    태스크별 메트릭 조회
+    
+    Returns:
+        list: [{'name', 'count', 'success', 'retries', 'failures', 'avg_ms', 'p50', 'p95', 'buckets'}]
+    """
+    metrics = []
+    for name in _get_task_names():
+        bucket_keys = [_task_key(name, f'bucket:{bucket}') for bucket in RUNTIME_BUCKETS]
+        keys = [_task_key(name, metric) for metric in ('count', 'runtime_ms', 'success', 'retries', 'failures')]
+        values = cache.get_many(keys + bucket_keys)
+        
+        count = values.get(keys[0], 0)
+        buckets = [(bucket, values.get(key, 0)) for bucket, key in zip(RUNTIME_BUCKETS, bucket_keys)]
+        metrics.append({
+            'name': name,
+            'count': count,
+            'runtime_ms': values.get(keys[1], 0),
+            'success': values.get(keys[2], 0),
+            'retries': values.get(keys[3], 0),
+            'failures': values.get(keys[4], 0),
+            'avg_ms': round(values.get(keys[1], 0) / count, 1) if count else None,
+            'p50': estimate_quantile(buckets, count, 0.5),
+            'p95': estimate_quantile(buckets, count, 0.95),
+            'buckets': buckets,
+        })
+    return metrics
+
+
+def sample_queue_depths(app):
+    """
+    브로커 큐 적체량 샘플링
+    
+    Args:
+        app: Celery 앱
+    
+    Returns:
+        dict: {큐 이름: 대기 메시지 수}
+    """
+    depths = {}
+    with app.connection_for_read() as connection:
+        channel = connection.default_channel
+        for queue in settings.CELERY_MONITORED_QUEUES:
+            try:
+                depths[queue] = channel.queue_declare(queue=queue, passive=True).message_count
+            except Exception:
+                logger.warning(f"큐 적체량 조회 실패: {queue}", exc_info=True)
+    
+    if not is_available():
+        return depths
+    
+    sampled_at = timezone.now().isoformat()
+    for queue, depth in depths.items():
+        key = f'{PREFIX}:queue:{queue}'
+        history = cache.get(key, [])
+        history.append({'depth': depth, 'sampled_at': sampled_at})
+        cache.set(key, history[-QUEUE_HISTORY_SIZE:], timeout=None)
+    return depths
+
+
+def get_queue_metrics():
+    """큐별 최근 샘플 (최신값 + 이력)"""
+    queues = []
+    for queue in settings.CELERY_MONITORED_QUEUES:
+        history = cache.get(f'{PREFIX}:queue:{queue}', [])
+        queues.append({
+            'name': queue,
+            'depth': history[-1]['depth'] if history else None,
+            'sampled_at': history[-1]['sampled_at'] if history else None,
+            'max_depth': max((sample['depth'] for sample in history), default=None),
+            'history': history,
+        })
+    return queues
+
+
+def render_prometheus():
+    """Prometheus 텍스트 포맷 출력"""
+    lines = [
+        '# HELP celery_task_runtime_seconds Celery task runtime',
+        '# TYPE celery_task_runtime_seconds histogram',
+    ]
+    task_metrics = get_task_metrics()
+    for metric in task_metrics:
+        label = f'task="{metric["name"]}"'
+        cumulative = 0
+        for bucket, value in metric['buckets']:
+            cumulative += value
+            lines.append(f'celery_task_runtime_seconds_bucket{{{label},le="{bucket}"}} {cumulative}')
+        lines.append(f'celery_task_runtime_seconds_bucket{{{label},le="+Inf"}} {metric["count"]}')
+        lines.append(f'celery_task_runtime_seconds_sum{{{label}}} {metric["runtime_ms"] / 1000:.3f}')
+        lines.append(f'celery_task_runtime_seconds_count{{{label}}} {metric["count"]}')
+    
+    for metric_name, field in (('celery_task_retries_total', 'retries'), ('celery_task_failures_total', 'failures')):
+        lines.append(f'# TYPE {metric_name} counter')
+        for metric in task_metrics:
+            lines.append(f'{metric_name}{{task="{metric["name"]}"}} {metric[field]}')
+    
+    lines.append('# TYPE celery_queue_depth gauge')
+    for queue in get_queue_metrics():
+        if queue['depth'] is not None:
+            lines.append(f'celery_queue_depth{{queue="{queue["name"]}"}} {queue["depth"]}')
+    
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,176 @@
+"""
+Keyset(커서) 페이지네이션
+COUNT(*)와 깊은 OFFSET 스캔 없이 (정렬 키, id) 기준으로 다음/이전 페이지를 조회한다.
+"""
+import base64
+import json
+import logging
+
+from django.db import connections
+from django.db.models import Q
+
+logger = logging.getLogger(__name__)
+
+
+def encode_cursor(values, direction):
+    """커서 인코딩 (URL-safe base64 JSON)"""
+    raw = json.dumps({'v': values, 'd': direction}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """커서 디코딩 - 잘못된 커서는 None"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        if data['d'] not in ('n', 'p') or not isinstance(data['v'], list):
+            return None
+        return data['v'], data['d']
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def estimate_count(queryset):
+    """
+    플래너 추정치로 전체 건수 계산 (PostgreSQL 전용)
+    
+    Returns:
+        int: 추정 건수 (지원하지 않는 DB면 None)
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+    
+    sql, params = queryset.order_by().query.sql_with_params()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute('EXPLAIN (FORMAT JSON) ' + sql, params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+    except Exception:
+        logger.warning("건수 추정 실패", exc_info=True)
+        return None
+
+
+class KeysetPage:
+    """Keyset 페이지"""
+    
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None, estimated_total=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        self.estimated_total = estimated_total
+    
+    def __iter__(self):
+        return iter(self.object_list)
+    
+    def __len__(self):
+        return len(self.object_list)
+    
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+    
+    @property
+    def has_previous(self):
+        return self.previous_cursor is not None
+    
+    @property
+    def has_other_pages(self):
+        return self.has_next or self.has_previous
+
+
+class KeysetPaginator:
+    """
+    Keyset 페이지네이터
+    
+    Args:
+        queryset: 필터가 적용된 쿼리셋
+        per_page: 페이지 크기
+        ordering: 정렬 키 (마지막 키는 유일해야 함, 예: ('-created_at', '-id'))
+        estimate_total: 추정 전체 건수 계산 여부
+    """
+    
+    def __init__(self, queryset, per_page, ordering=('-created_at', '-id'), estimate_total=False):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ordering = tuple(ordering)
+        self.estimate_total = estimate_total
+        self.fields = [
+            queryset.model._meta.get_field(key.lstrip('-')) for key in self.ordering
+        ]
+    
+    def _row_values(self, obj):
+        values = []
+        for field in self.fields:
+            value = getattr(obj, field.attname)
+            values.append(value.isoformat() if hasattr(value, 'isoformat') else value)
+        return values
+    
+    def _parse_values(self, raw_values):
+        if len(raw_values) != len(self.fields):
+            raise ValueError('커서 길이 불일치')
+        return [field.to_python(value) for field, value in zip(self.fields, raw_values)]
+    
+    def _seek_filter(self, values, forward):
+        """커서 이후(forward) 또는 이전 행 조건 (사전식 비교)"""
+        condition = Q()
+        for index, key in enumerate(self.ordering):
+            descending = key.startswith('-')
+            lookup = 'lt' if descending == forward else 'gt'
+            term = Q(**{f'{self.fields[index].name}__{lookup}': values[index]})
+            for prev_index in range(index):
+                term &= Q(**{self.fields[prev_index].name: values[prev_index]})
+            condition |= term
+        return condition
+    
+    def get_page(self, cursor=None):
+        """커서에 해당하는 페이지 (잘못된 커서는 첫 페이지)"""
+        decoded = decode_cursor(cursor) if cursor else None
+        values, direction = None, 'n'
+        if decoded:
+            try:
+                values = self._parse_values(decoded[0])
+                direction = decoded[1]
+            except Exception:
+                values = None
+        
+        queryset = self.queryset
+        if values is None:
+            rows = list(queryset.order_by(*self.ordering)[:self.per_page + 1])
+            has_more = len(rows) > self.per_page
+            rows = rows[:self.per_page]
+            has_next, has_previous = has_more, False
+        elif direction == 'n':
+            rows = list(
+                queryset.filter(self._seek_filter(values, forward=True))
+                .order_by(*self.ordering)[:self.per_page + 1]
+            )
+            has_next, has_previous = len(rows) > self.per_page, True
+            rows = rows[:self.per_page]
+        else:
+            reverse_ordering = [
+                key[1:] if key.startswith('-') else f'-{key}' for key in self.ordering
+            ]
+            rows = list(
+                queryset.filter(self._seek_filter(values, forward=False))
+                .order_by(*reverse_ordering)[:self.per_page + 1]
+            )
+            has_next, has_previous = True, len(rows) > self.per_page
+            rows = rows[:self.per_page][::-1]
+        
+        next_cursor = encode_cursor(self._row_values(rows[-1]), 'n') if rows and has_next else None
+        previous_cursor = encode_cursor(self._row_values(rows[0]), 'p') if rows and has_previous else None
+        estimated_total = estimate_count(queryset) if self.estimate_total else None
+        
+        return KeysetPage(rows, next_cursor, previous_cursor, estimated_total)
+
+
+def get_querystring(request, exclude=('cursor', 'page')):
+    """페이지 링크용 쿼리스트링 (커서 제외)"""
+    query = request.GET.copy()
+    for key in exclude:
+        query.pop(key, None)
+    return query.urlencode()
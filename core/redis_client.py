@@ -0,0 +1,23 @@
+"""
+공유 Redis 클라이언트
+캐시 API로 표현하기 어려운 자료구조(리스트 등)가 필요할 때 사용한다.
+"""
+import redis
+from django.conf import settings
+
+_client = None
+
+
+def get_redis():
+    """
+    Redis 클라이언트 반환
+    
+    Returns:
+        Redis: 클라이언트 (REDIS_URL 미설정 시 None)
+    """
+    global _client
+    if not settings.REDIS_URL:
+        return None
+    if _client is None:
+        _client = redis.Redis.from_url(settings.REDIS_URL)
+    return _client
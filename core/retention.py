@@ -0,0 +1,143 @@
+"""
+로그 보관(retention) 및 아카이브
+보관 기간이 지난 MessageLog/NotificationLog를 압축 아카이브로 옮기고 월별 요약만 남긴다.
+"""
+import gzip
+import json
+import logging
+from collections import Counter
+
+from django.apps import apps
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import LogArchive, LogMonthlySummary
+from .utils import local_day_start
+
+logger = logging.getLogger(__name__)
+
+# source -> (모델, 기준 시각 필드, 상태 필드, 아카이브하지 않을 상태)
+# 재발송 대기/발송 중인 로그는 아직 처리가 끝나지 않았으므로 보관 기간이 지나도 남긴다.
+ARCHIVE_SOURCES = {
+    'message_log': ('core.MessageLog', 'created_at', 'status', ('pending', 'sending', 'retry')),
+    'notification_log': ('notifications.NotificationLog', 'sent_at', 'result', ()),
+}
+
+
+def get_retention_cutoff(months=None):
+    """
+    보관 기준 시각 (이 시각 이전 로그는 아카이브 대상)
+    
+    Args:
+        months: 보관 개월 수 (None이면 settings.LOG_RETENTION_MONTHS)
+    
+    Returns:
+        datetime: N개월 전 1일 00:00
+    """
+    if months is None:
+        months = settings.LOG_RETENTION_MONTHS
+    today = timezone.localdate()
+    year, month = today.year, today.month - months
+    while month <= 0:
+        month += 12
+        year -= 1
+    return local_day_start(today.replace(year=year, month=month, day=1))
+
+
+def _add_monthly_counts(source, counts):
+    """월별 요약 건수 누적"""
+    for (year, month, status), count in counts.items():
+        updated = LogMonthlySummary.objects.filter(
+            source=source, year=year, month=month, status=status
+        ).update(count=F('count') + count)
+        if not updated:
+            LogMonthlySummary.objects.create(
+                source=source, year=year, month=month, status=status, count=count
+            )
+
+
+def archive_logs(source, months=None, batch_size=None):
+    """
+    보관 기간이 지난 로그를 배치 단위로 아카이브
+    
+    Args:
+        source: ARCHIVE_SOURCES 키
+        months: 보관 개월 수
+        batch_size: 배치 크기 (None이면 settings.LOG_ARCHIVE_BATCH_SIZE)
+    
+    Returns:
+        int: 아카이브된 행 수
+    """
+    model_label, date_field, status_field, open_statuses = ARCHIVE_SOURCES[source]
+    model = apps.get_model(model_label)
+    batch_size = batch_size or settings.LOG_ARCHIVE_BATCH_SIZE
+    cutoff = get_retention_cutoff(months)
+    
+    archived = 0
+    while True:
+        with transaction.atomic():
+            rows = list(
+                model.objects.filter(**{f'{date_field}__lt': cutoff})
+                .exclude(**{f'{status_field}__in': open_statuses})
+                .order_by('id').values()[:batch_size]
+            )
+            if not rows:
+                break
+            
+            timestamps = [row[date_field] for row in rows]
+            payload = json.dumps(rows, cls=DjangoJSONEncoder, ensure_ascii=False)
+            LogArchive.objects.create(
+                source=source,
+                first_id=rows[0]['id'],
+                last_id=rows[-1]['id'],
+                period_start=min(timestamps),
+                period_end=max(timestamps),
+                row_count=len(rows),
+                data=gzip.compress(payload.encode('utf-8')),
+            )
+            
+            counts = Counter()
+            for row in rows:
+                local = timezone.localtime(row[date_field])
+                counts[(local.year, local.month, row[status_field])] += 1
+            _add_monthly_counts(source, counts)
+            
+            model.objects.filter(id__in=[row['id'] for row in rows]).delete()
+        
+        archived += len(rows)
+    
+    if archived:
+        logger.info(f"{source} 로그 {archived}건 아카이브 완료 (기준: {cutoff:%Y-%m-%d})")
+    return archived
+
+
+def get_monthly_summaries(source, since=None, until=None):
+    """
+    아카이브된 로그의 월별 요약 (월 단위로 상태별 건수를 묶음)
+    
+    Args:
+        source: ARCHIVE_SOURCES 키
+        since: 이 날짜가 속한 달부터 조회 (None이면 전체)
+        until: 이 날짜가 속한 달까지 조회 (None이면 전체)
+    
+    Returns:
+        list: [{'year', 'month', 'counts': {status: count}, 'total'}] 최신 월 순
+    """
+    summaries = LogMonthlySummary.objects.filter(source=source)
+    if since:
+        summaries = summaries.filter(year__gte=since.year).exclude(year=since.year, month__lt=since.month)
+    if until:
+        summaries = summaries.filter(year__lte=until.year).exclude(year=until.year, month__gt=until.month)
+    
+    months = {}
+    for summary in summaries.order_by('-year', '-month'):
+        entry = months.setdefault(
+            (summary.year, summary.month),
+            {'year': summary.year, 'month': summary.month, 'counts': {}, 'total': 0},
+        )
+        entry['counts'][summary.status] = summary.count
+        entry['total'] += summary.count
+    return list(months.values())
@@ -0,0 +1,16 @@
+"""
+Core app 시그널
+"""
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import SystemSetting
+from . import system_settings
+
+
+@receiver(post_save, sender=SystemSetting)
+@receiver(post_delete, sender=SystemSetting)
+def invalidate_system_settings(sender, **kwargs):
+    """설정 저장/삭제 시 캐시 무효화 (커밋 후)"""
+    transaction.on_commit(system_settings.invalidate)
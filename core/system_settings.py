@@ -0,0 +1,109 @@
+"""
+SystemSetting 캐시 접근 API
+활성 설정 전체를 프로세스 메모리에 올려두고, 캐시(Redis)의 버전 키로 프로세스 간 변경을 감지한다.
+캐시가 프로세스별(LocMem)이면 버전 키가 다른 프로세스에 전파되지 않으므로 확인 주기마다 DB에서 다시 읽는다.
+
+사용 예:
+    from core.system_settings import get_int, get_bool
+    due_day = get_int('payment.due_day', default=10)
+"""
+import json
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = 'core:system_settings:version'
+TRUE_VALUES = ('true', '1', 'yes', 'y', 'on')
+
+_lock = threading.Lock()
+_state = {
+    'version': None,
+    'checked_at': 0.0,
+    'loaded': False,
+    'values': {},
+    'parsed': {},
+}
+
+
+def _current_version():
+    try:
+        return cache.get(VERSION_KEY, 0)
+    except Exception:
+        logger.warning("설정 버전 조회 실패", exc_info=True)
+        return _state['version']
+
+
+def _load(version):
+    from .models import SystemSetting
+    
+    values = dict(SystemSetting.objects.filter(is_active=True).values_list('key', 'value'))
+    with _lock:
+        _state['values'] = values
+        _state['parsed'] = {}
+        _state['version'] = version
+        _state['loaded'] = True
+
+
+def _get_values():
+    now = time.monotonic()
+    if not _state['loaded'] or now - _state['checked_at'] >= settings.SYSTEM_SETTINGS_CHECK_INTERVAL:
+        _state['checked_at'] = now
+        version = _current_version()
+        if not _state['loaded'] or version != _state['version'] or isinstance(caches['default'], LocMemCache):
+            _load(version)
+    return _state['values']
+
+
+def _get_parsed(key, kind, parser, default):
+    cache_key = (key, kind)
+    values = _get_values()
+    parsed = _state['parsed']
+    if cache_key in parsed:
+        return parsed[cache_key]
+    
+    if key not in values:
+        return default
+    try:
+        value = parser(values[key])
+    except (ValueError, TypeError):
+        logger.warning(f"설정 값 파싱 실패: {key}={values[key]!r} ({kind})")
+        return default
+    parsed[cache_key] = value
+    return value
+
+
+def get_setting(key, default=None):
+    """문자열 설정 값"""
+    return _get_values().get(key, default)
+
+
+def get_int(key, default=0):
+    """정수 설정 값"""
+    return _get_parsed(key, 'int', lambda raw: int(raw.strip()), default)
+
+
+def get_bool(key, default=False):
+    """불리언 설정 값 (true/1/yes/y/on)"""
+    return _get_parsed(key, 'bool', lambda raw: raw.strip().lower() in TRUE_VALUES, default)
+
+
+def get_json(key, default=None):
+    """JSON 설정 값"""
+    return _get_parsed(key, 'json', json.loads, default)
+
+
+def invalidate():
+    """설정 변경 알림 - 버전 키를 올려 모든 프로세스가 다시 로드하도록 함"""
+    with _lock:
+        _state['loaded'] = False
+    try:
+        cache.add(VERSION_KEY, 0, timeout=None)
+        cache.incr(VERSION_KEY)
+    except Exception:
+        logger.warning("설정 버전 갱신 실패", exc_info=True)
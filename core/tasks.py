@@ -2,36 +2,108 @@
 Core app Celery tasks.
 비동기 작업 정의 (SMS 발송, 백업, 통계 집계 등)
 """
+import logging
 
 from celery import shared_task
 from django.utils import timezone
 
+logger = logging.getLogger(__name__)
+
 
 @shared_task
 def send_message_task(message_log_id):
     """메시지 발송 태스크 (SMS/알림톡)"""
+    from datetime import timedelta
+    from django.conf import settings
     from .models import MessageLog
     
     try:
         message = MessageLog.objects.get(id=message_log_id)
-        
+    except MessageLog.DoesNotExist:
+        return {'status': 'error', 'message': 'Message not found'}
+    
+    # 대기/재시도 상태일 때만 'sending'으로 선점 (중복 큐잉돼도 한 태스크만 발송)
+    # 선점 유예 시각이 지나도록 끝나지 않으면(워커 종료 등) 스케줄러가 재발송
+    lease_until = timezone.now() + timedelta(seconds=settings.MESSAGE_RETRY_LEASE_SECONDS)
+    claimed = MessageLog.objects.filter(
+        id=message_log_id, status__in=['pending', 'retry']
+    ).update(status='sending', next_retry_at=lease_until)
+    if not claimed:
+        return {'status': 'skipped', 'message_id': message_log_id}
+    message.status, message.next_retry_at = 'sending', lease_until
+    
+    try:
         # TODO: 실제 발송 로직 구현 (SMS API 호출 등)
         # 현재는 성공으로 가정
         message.status = 'sent'
         message.sent_at = timezone.now()
+        message.next_retry_at = None
         message.save()
         
         return {'status': 'success', 'message_id': message_log_id}
     
-    except MessageLog.DoesNotExist:
-        return {'status': 'error', 'message': 'Message not found'}
     except Exception as e:
-        # 실패 시 재시도 카운트 증가
-        message.status = 'failed'
-        message.error_message = str(e)
-        message.retry_count += 1
-        message.save()
-        raise  # Celery가 재시도하도록 예외 발생
+        # 실패 시 재시도 카운트 증가 및 백오프 예약 (retry_failed_messages가 재발송)
+        message.mark_failed(e)
+        return {'status': 'error', 'message_id': message_log_id, 'message': str(e)}
+
+
+@shared_task
+def retry_failed_messages():
+    """실패 메시지 재시도 스케줄러 (지수 백오프)"""
+    from datetime import timedelta
+    from django.conf import settings
+    from django.db import transaction
+    from django.db.models import F
+    from .models import MessageLog
+    
+    now = timezone.now()
+    
+    with transaction.atomic():
+        # 여러 스케줄러가 동시에 실행되어도 같은 메시지를 중복 선점하지 않도록 잠금
+        rows = list(
+            MessageLog.objects.select_for_update(skip_locked=True).filter(
+                status__in=['failed', 'retry', 'sending'],
+                retry_count__lt=settings.MESSAGE_RETRY_MAX_ATTEMPTS,
+                next_retry_at__lte=now,
+            ).order_by('next_retry_at').values_list('id', 'status', 'retry_count')[:settings.MESSAGE_RETRY_BATCH_SIZE]
+        )
+        # 선점 유예 시각이 지난 'sending'은 발송 중 중단된 것이므로 실패 1회로 세고, 한도에 닿으면 실패 처리
+        stalled_ids = [message_id for message_id, status, _ in rows if status == 'sending']
+        exhausted_ids = [
+            message_id for message_id, status, retry_count in rows
+            if status == 'sending' and retry_count + 1 >= settings.MESSAGE_RETRY_MAX_ATTEMPTS
+        ]
+        if stalled_ids:
+            MessageLog.objects.filter(id__in=stalled_ids).update(
+                retry_count=F('retry_count') + 1, error_message='발송 중 중단됨',
+            )
+            MessageLog.objects.filter(id__in=exhausted_ids).update(status='failed', next_retry_at=None)
+        message_ids = [message_id for message_id, _, _ in rows if message_id not in exhausted_ids]
+        # 발송 태스크가 선점할 때까지 'retry'로 두고, 가져가지 않으면 유예 시간 뒤 다시 재큐잉
+        MessageLog.objects.filter(id__in=message_ids).update(
+            status='retry',
+            next_retry_at=now + timedelta(seconds=settings.MESSAGE_RETRY_LEASE_SECONDS),
+        )
+        # 커밋된 뒤에 큐잉해야 발송 태스크가 갱신 전 상태를 읽지 않는다
+        transaction.on_commit(lambda: _enqueue_retries(message_ids))
+    
+    return {'status': 'success', 'queued': len(message_ids)}
+
+
+def _enqueue_retries(message_ids):
+    """재발송 메시지 큐잉 (큐에 넣지 못한 메시지는 다음 스케줄러 실행에서 바로 다시 재큐잉)"""
+    from .models import MessageLog
+    
+    for index, message_id in enumerate(message_ids):
+        try:
+            send_message_task.delay(message_id)
+        except Exception:
+            logger.exception(f"재발송 큐잉 실패 - 메시지 {len(message_ids) - index}건은 다음 실행에서 재시도")
+            MessageLog.objects.filter(
+                id__in=message_ids[index:], status='retry'
+            ).update(next_retry_at=timezone.now())
+            break
 
 
 @shared_task
@@ -74,6 +146,27 @@ def create_backup_task():
         return {'status': 'error', 'message': str(e)}
 
 
+@shared_task
+def archive_old_logs():
+    """보관 기간이 지난 메시지/알림 로그 아카이브 태스크"""
+    from .retention import ARCHIVE_SOURCES, archive_logs
+    
+    result = {}
+    for source in ARCHIVE_SOURCES:
+        result[source] = archive_logs(source)
+    
+    return {'status': 'success', 'archived': result}
+
+
+@shared_task
+def sample_queue_depth():
+    """브로커 큐 적체량 샘플링 태스크"""
+    from config.celery import app
+    from .monitoring import sample_queue_depths
+    
+    return {'status': 'success', 'depths': sample_queue_depths(app)}
+
+
 @shared_task
 def calculate_monthly_statistics():
     """월별 통계 집계 태스크"""
@@ -0,0 +1,55 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from .models import MessageLog
+from .pagination import KeysetPaginator
+
+
+class KeysetPaginatorTests(TestCase):
+    """Keyset 페이지네이션 - 다음/이전 페이지 이동"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        base = timezone.now()
+        for index in range(7):
+            log = MessageLog.objects.create(recipient=f'010-0000-{index:04d}', message_type='sms', content='테스트')
+            # 두 건씩 같은 시각으로 두어 id 보조 정렬도 확인
+            MessageLog.objects.filter(pk=log.pk).update(created_at=base - timedelta(minutes=index // 2))
+        cls.expected = list(MessageLog.objects.order_by('-created_at', '-id').values_list('pk', flat=True))
+    
+    def _pks(self, page):
+        return [log.pk for log in page]
+    
+    def test_forward_then_back(self):
+        paginator = KeysetPaginator(MessageLog.objects.all(), 3, ordering=('-created_at', '-id'))
+        
+        first = paginator.get_page()
+        self.assertEqual(self._pks(first), self.expected[:3])
+        self.assertFalse(first.has_previous)
+        self.assertTrue(first.has_next)
+        
+        second = paginator.get_page(first.next_cursor)
+        self.assertEqual(self._pks(second), self.expected[3:6])
+        self.assertTrue(second.has_previous)
+        self.assertTrue(second.has_next)
+        
+        last = paginator.get_page(second.next_cursor)
+        self.assertEqual(self._pks(last), self.expected[6:])
+        self.assertFalse(last.has_next)
+        
+        back = paginator.get_page(last.previous_cursor)
+        self.assertEqual(self._pks(back), self.expected[3:6])
+        self.assertTrue(back.has_next)
+        self.assertTrue(back.has_previous)
+        
+        start = paginator.get_page(back.previous_cursor)
+        self.assertEqual(self._pks(start), self.expected[:3])
+        self.assertFalse(start.has_previous)
+    
+    def test_invalid_cursor_returns_first_page(self):
+        paginator = KeysetPaginator(MessageLog.objects.all(), 3, ordering=('-created_at', '-id'))
+        
+        page = paginator.get_page('not-a-cursor')
+        self.assertEqual(self._pks(page), self.expected[:3])
@@ -5,4 +5,6 @@ app_name = 'core'
 
 urlpatterns = [
     path('api/search/', views.global_search, name='global_search'),
+    path('metrics/', views.metrics, name='metrics'),
+    path('monitor/tasks/', views.task_monitor, name='task_monitor'),
 ]
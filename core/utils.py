@@ -3,8 +3,9 @@ Core utility functions for Academy Manager
 공통으로 사용되는 유틸리티 함수들
 """
 from django.utils import timezone
-from datetime import datetime
+from datetime import datetime, time
 import logging
+import random
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +88,50 @@ def format_phone(phone):
     return phone  # 원본 반환
 
 
+def normalize_phone(phone):
+    """
+    전화번호 정규화 (중복 수신자 판별용)
+    
+    Args:
+        phone: 전화번호 문자열 (예: 010-1234-5678, +82 10 1234 5678)
+    
+    Returns:
+        str: 숫자만 남긴 국내 형식 번호 (예: 01012345678), 번호가 없으면 빈 문자열
+    """
+    if not phone:
+        return ''
+    
+    digits = ''.join(filter(str.isdigit, phone))
+    if digits.startswith('82') and phone.lstrip().startswith('+'):
+        digits = '0' + digits[2:]
+    return digits
+
+
+def group_by_contact(rows):
+    """
+    수신자를 정규화한 연락처별로 묶기
+    
+    Args:
+        rows: (키, 연락처) 목록 - 예: (학생 ID, 학부모 연락처)
+    
+    Returns:
+        list: [(정규화 연락처, [키, ...]), ...] - 연락처별 그룹(처음 나온 순서) 뒤에
+              연락처가 없는 수신자를 묶지 않고 각각 한 그룹으로 붙인다
+    """
+    groups = {}
+    singles = []
+    for key, contact in rows:
+        normalized = normalize_phone(contact)
+        if not normalized:
+            singles.append(('', [key]))
+            continue
+        if normalized in groups:
+            groups[normalized][1].append(key)
+        else:
+            groups[normalized] = (normalized, [key])
+    return list(groups.values()) + singles
+
+
 def format_currency(amount):
     """
     금액 포맷팅
@@ -100,3 +145,33 @@ def format_currency(amount):
     if amount is None:
         return '0원'
     return f"{int(amount):,}원"
+
+
+def calculate_backoff(attempt, base=60, cap=3600):
+    """
+    지수 백오프 + 지터 지연 시간 계산
+    
+    Args:
+        attempt: 재시도 횟수 (1부터 시작)
+        base: 기본 지연 시간 (초)
+        cap: 최대 지연 시간 (초)
+    
+    Returns:
+        float: 다음 시도까지 대기할 시간 (초)
+    """
+    delay = min(cap, base * (2 ** max(attempt - 1, 0)))
+    # 절반은 고정, 절반은 무작위 (동시 재시도 분산)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def local_day_start(day):
+    """
+    날짜의 0시 (현재 타임존 기준 aware datetime)
+    
+    Args:
+        day: date 객체
+    
+    Returns:
+        datetime: 해당 날짜 00:00 시각
+    """
+    return timezone.make_aware(datetime.combine(day, time.min))
@@ -1,5 +1,9 @@
-from django.http import JsonResponse
+from django.conf import settings
+from django.http import JsonResponse, HttpResponse
+from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
+from django.contrib.admin.views.decorators import staff_member_required
+from django.utils.crypto import constant_time_compare
 from django.db.models import Q
 from students.models import Student
 from classes.models import Class
@@ -76,3 +80,35 @@ def global_search(request):
         'total': total,
         'query': query
     })
+
+
+def metrics(request):
+    """메트릭 엔드포인트 (Prometheus 텍스트 포맷)"""
+    from .monitoring import is_available, render_prometheus
+    
+    token = settings.METRICS_TOKEN
+    auth_header = request.META.get('HTTP_AUTHORIZATION', '')
+    authorized = (request.user.is_authenticated and request.user.is_staff) or (
+        token and constant_time_compare(auth_header, f'Bearer {token}')
+    )
+    if not authorized:
+        return HttpResponse(status=403)
+    if not is_available():
+        return HttpResponse(
+            '# Celery metrics require Redis (REDIS_URL is not set)\n',
+            status=503, content_type='text/plain; charset=utf-8',
+        )
+    
+    return HttpResponse(render_prometheus(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+@staff_member_required
+def task_monitor(request):
+    """Celery 작업 모니터 (관리자용)"""
+    from .monitoring import get_task_metrics, get_queue_metrics, is_available
+    
+    return render(request, 'core/task_monitor.html', {
+        'metrics_available': is_available(),
+        'task_metrics': get_task_metrics(),
+        'queue_metrics': get_queue_metrics(),
+    })
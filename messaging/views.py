@@ -4,13 +4,17 @@
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.core.paginator import Paginator
 from django.utils import timezone
+from django.utils.dateparse import parse_date
+from datetime import timedelta
 
 from students.models import Student
 from classes.models import Class
 from payments.models import Payment
 from core.models import MessageLog
+from core.pagination import KeysetPaginator, get_querystring
+from core.retention import get_retention_cutoff, get_monthly_summaries
+from core.utils import group_by_contact, local_day_start
 
 
 @login_required
@@ -53,24 +57,32 @@ def message_send(request):
         elif target_type == 'all':
             students = Student.objects.filter(status='enrolled')
         
+        # 연락처별로 묶어 같은 번호(형제의 학부모 등)에는 한 번만 발송
+        recipients = [(student.name, student.parent_phone or student.phone) for student in students]
+        groups = [
+            (contact, indexes)
+            for contact, indexes in group_by_contact((i, phone) for i, (_, phone) in enumerate(recipients))
+            if contact
+        ]
+        
         # 메시지 로그 생성
-        sent_count = 0
-        for student in students:
-            phone = student.parent_phone or student.phone
-            if phone:
-                MessageLog.objects.create(
-                    message_type=message_type,
-                    recipient=student.name,
-                    recipient_phone=phone,
-                    content=content,
-                    status='sent',  # 실제로는 'pending' 후 비동기 처리
-                    sent_at=timezone.now(),
-                    created_by=request.user
-                )
-                sent_count += 1
+        now = timezone.now()
+        MessageLog.objects.bulk_create([
+            MessageLog(
+                message_type=message_type,
+                recipient=', '.join(recipients[i][0] for i in indexes)[:100],
+                recipient_phone=recipients[indexes[0]][1],
+                content=content,
+                status='sent',  # 실제로는 'pending' 후 비동기 처리
+                sent_at=now,
+                created_by=request.user
+            )
+            for _, indexes in groups
+        ])
+        sent_count = sum(len(indexes) for _, indexes in groups)
         
         if sent_count > 0:
-            messages.success(request, f'{sent_count}명에게 메시지가 발송되었습니다.')
+            messages.success(request, f'{sent_count}명에게 메시지가 발송되었습니다. (중복 연락처 제외 {len(groups)}건)')
         else:
             messages.warning(request, '발송 대상이 없습니다.')
         
@@ -88,7 +100,7 @@ def message_send(request):
 @login_required
 def message_logs(request):
     """발송 로그 페이지"""
-    logs = MessageLog.objects.select_related('created_by').order_by('-created_at')
+    logs = MessageLog.objects.select_related('created_by')
     
     # 필터
     message_type = request.GET.get('message_type')
@@ -100,17 +112,34 @@ def message_logs(request):
         logs = logs.filter(message_type=message_type)
     if status:
         logs = logs.filter(status=status)
-    if date_from:
-        logs = logs.filter(created_at__date__gte=date_from)
-    if date_to:
-        logs = logs.filter(created_at__date__lte=date_to)
+    # 보관 기간 이내(핫 데이터)만 조회 - 이전 기간은 월별 요약으로 제공
+    cutoff = get_retention_cutoff()
+    start = cutoff
+    archived_summaries = None
+    
+    try:
+        from_date = parse_date(date_from) if date_from else None
+        to_date = parse_date(date_to) if date_to else None
+    except ValueError:
+        from_date = to_date = None
+    
+    if from_date:
+        if local_day_start(from_date) > cutoff:
+            start = local_day_start(from_date)
+        else:
+            archived_summaries = get_monthly_summaries('message_log', since=from_date, until=to_date)
+    logs = logs.filter(created_at__gte=start)
+    if to_date:
+        logs = logs.filter(created_at__lt=local_day_start(to_date + timedelta(days=1)))
     
-    paginator = Paginator(logs, 50)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    paginator = KeysetPaginator(logs, 50, ordering=('-created_at', '-id'), estimate_total=True)
+    page_obj = paginator.get_page(request.GET.get('cursor'))
     
     return render(request, 'messaging/logs.html', {
         'page_obj': page_obj,
+        'querystring': get_querystring(request),
         'selected_type': message_type,
         'selected_status': status,
+        'retention_cutoff': cutoff,
+        'archived_summaries': archived_summaries,
     })
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import NotificationTemplate, NotificationJob, NotificationLog, WeeklyReport
+from .models import NotificationTemplate, NotificationJob, NotificationLog, NotificationOutbox, WeeklyReport
 
 
 @admin.register(NotificationTemplate)
@@ -18,7 +18,15 @@ class NotificationJobAdmin(admin.ModelAdmin):
 
 @admin.register(NotificationLog)
 class NotificationLogAdmin(admin.ModelAdmin):
-    list_display = ['recipient_name', 'result', 'sent_at']
-    list_filter = ['result']
+    list_display = ['recipient_name', 'result', 'error_code', 'sent_at']
+    list_filter = ['result', 'error_code']
     search_fields = ['recipient_name', 'recipient_contact']
     readonly_fields = ['sent_at']
+
+
+@admin.register(NotificationOutbox)
+class NotificationOutboxAdmin(admin.ModelAdmin):
+    list_display = ['idempotency_key', 'recipient_name', 'channel', 'status', 'attempts', 'sent_at', 'logged_at']
+    list_filter = ['status', 'channel']
+    search_fields = ['idempotency_key', 'recipient_name', 'recipient_contact']
+    readonly_fields = ['created_at', 'sent_at', 'logged_at']
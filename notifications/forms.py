@@ -73,3 +73,10 @@ class NotificationSendForm(forms.Form):
         widget=forms.DateTimeInput(attrs={'class': 'form-control', 'type': 'datetime-local'}),
         required=False
     )
+    
+    merge_siblings = forms.BooleanField(
+        label='형제 합쳐 발송',
+        help_text='같은 연락처의 학생들을 한 메시지로 합쳐 발송합니다. (예: {학생명} → 홍길동, 홍길순)',
+        widget=forms.CheckboxInput(attrs={'class': 'form-check-input'}),
+        required=False
+    )
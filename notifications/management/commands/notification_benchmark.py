@@ -0,0 +1,206 @@
+"""
+알림 발송 처리량 벤치마크
+
+테스트용 반/학생을 만들고, 지연 시간을 설정할 수 있는 스텁 발송 제공자로
+발송 작업 전체 경로(수신자 결정 → 변수 조회/렌더링 → 아웃박스 기록 → 발송 → 로그 기록 → 집계)를 실행해
+초당 메시지 수, 메시지당 쿼리 수, 최대 메모리 사용량을 측정한다.
+
+Celery 브로커 없이 태스크 함수를 같은 프로세스에서 순서대로 호출하며,
+모든 데이터는 트랜잭션 안에서 만들고 마지막에 롤백하므로 반복 실행해도 DB가 바뀌지 않는다.
+
+사용 예:
+    python manage.py notification_benchmark --recipients 2000 --latency 5 --output bench.json
+    python manage.py notification_benchmark --recipients 2000 --baseline bench.json   # 회귀 확인
+"""
+import json
+import secrets
+import statistics
+import time
+import tracemalloc
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+
+from classes.models import Class
+from notifications.models import NotificationJob, NotificationLog
+from notifications.providers import BaseProvider, SendResult
+from notifications.services import prepare_outbox
+from notifications.tasks import send_notification_chunk
+from students.models import Student
+
+STUB_PROVIDER = 'notifications.management.commands.notification_benchmark.StubProvider'
+DEFAULT_CONTENT = '[{반명}] {학생명} 학부모님, {날짜} 기준 수업 일정은 {수업일정}이며 미납 금액은 {금액}입니다.'
+
+
+class StubProvider(BaseProvider):
+    """고정 지연 후 성공을 반환하는 벤치마크용 발송 제공자"""
+    latency = 0.0
+
+    def send(self, channel, contact, subject, content, idempotency_key=None):
+        if self.latency:
+            time.sleep(self.latency)
+        return SendResult(True, response='stub')
+
+
+class Rollback(Exception):
+    """벤치마크 데이터 롤백용"""
+
+
+class Command(BaseCommand):
+    help = '스텁 발송 제공자로 알림 발송 처리량 측정'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--recipients', type=int, default=1000, help='수신자(학생) 수')
+        parser.add_argument('--latency', type=float, default=0.0, help='메시지당 발송 지연(ms)')
+        parser.add_argument('--chunk-size', type=int, default=settings.NOTIFICATION_CHUNK_SIZE, help='청크당 수신자 수')
+        parser.add_argument('--content', default=DEFAULT_CONTENT, help='발송 내용 (템플릿 변수 사용 가능)')
+        parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (중앙값으로 비교)')
+        parser.add_argument('--output', help='결과 JSON 파일 경로')
+        parser.add_argument('--baseline', help='비교할 이전 결과 JSON 파일 경로')
+        parser.add_argument('--tolerance', type=float, default=10.0, help='회귀로 판단할 성능 저하 비율(%%)')
+
+    def handle(self, *args, **options):
+        if options['recipients'] < 1 or options['repeat'] < 1:
+            raise CommandError('--recipients와 --repeat는 1 이상이어야 합니다.')
+
+        StubProvider.latency = options['latency'] / 1000
+        runs = []
+        try:
+            with transaction.atomic(), override_settings(NOTIFICATION_PROVIDER=STUB_PROVIDER):
+                assigned_class = self._setup(options)
+                for index in range(options['repeat']):
+                    run = self._run(assigned_class, options)
+                    runs.append(run)
+                    self.stdout.write(
+                        f"[{index + 1}/{options['repeat']}] {run['messages']}건 {run['elapsed_seconds']}초, "
+                        f"{run['messages_per_second']} msg/s, 메시지당 쿼리 {run['queries_per_message']}개, "
+                        f"최대 메모리 {run['peak_memory_mb']}MB"
+                    )
+                raise Rollback
+        except Rollback:
+            pass
+
+        report = self._build_report(runs, options)
+        self._print_report(report)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            self.stdout.write(f"결과 저장: {options['output']}")
+        if options['baseline']:
+            self._compare(report, options)
+
+    def _setup(self, options):
+        """테스트용 반과 학생 생성 (연락처가 모두 달라 학생 1명당 메시지 1건)"""
+        suffix = secrets.token_hex(3)
+        assigned_class = Class.objects.create(
+            name=f'벤치마크-{suffix}',
+            weekdays='mon,wed,fri',
+            start_time='15:00',
+            end_time='17:00',
+        )
+        Student.objects.bulk_create(
+            [
+                Student(
+                    name=f'벤치{suffix}-{i:05d}',
+                    assigned_class=assigned_class,
+                    parent_phone=f'010-9{i // 10000:03d}-{i % 10000:04d}',
+                )
+                for i in range(options['recipients'])
+            ],
+            batch_size=1000,
+        )
+        return assigned_class
+
+    def _run(self, assigned_class, options):
+        """발송 작업 1회 실행 (process_notification_job → send_notification_chunk 경로)"""
+        job = NotificationJob.objects.create(
+            target_type='class',
+            target_class=assigned_class,
+            subject='벤치마크',
+            content=options['content'],
+        )
+
+        tracemalloc.start()
+        started = time.perf_counter()
+        with CaptureQueriesContext(connection) as captured:
+            NotificationJob.objects.filter(pk=job.pk).update(status='processing')
+            for chunk in prepare_outbox(job, options['chunk_size']):
+                send_notification_chunk(job.pk, chunk)
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        job.refresh_from_db()
+        messages = NotificationLog.objects.filter(job=job).count()
+        if job.status != 'sent' or messages == 0:
+            raise CommandError(f'발송 작업이 완료되지 않았습니다 (상태: {job.status}, 로그 {messages}건)')
+
+        return {
+            'messages': messages,
+            'elapsed_seconds': round(elapsed, 3),
+            'messages_per_second': round(messages / elapsed, 1),
+            'queries': len(captured),
+            'queries_per_message': round(len(captured) / messages, 3),
+            'peak_memory_mb': round(peak / 1024 / 1024, 2),
+        }
+
+    def _build_report(self, runs, options):
+        def median(key):
+            return round(statistics.median(run[key] for run in runs), 3)
+
+        return {
+            'timestamp': timezone.now().isoformat(),
+            'config': {
+                'recipients': options['recipients'],
+                'latency_ms': options['latency'],
+                'chunk_size': options['chunk_size'],
+                'content': options['content'],
+                'repeat': options['repeat'],
+                'database': connection.vendor,
+            },
+            'runs': runs,
+            'median': {
+                'messages_per_second': median('messages_per_second'),
+                'queries_per_message': median('queries_per_message'),
+                'peak_memory_mb': median('peak_memory_mb'),
+            },
+        }
+
+    def _print_report(self, report):
+        median = report['median']
+        config = report['config']
+        self.stdout.write(self.style.SUCCESS('\n=== 알림 발송 벤치마크 결과 (중앙값) ==='))
+        self.stdout.write(f"수신자 {config['recipients']}명, 발송 지연 {config['latency_ms']:g}ms, 청크 {config['chunk_size']}명")
+        self.stdout.write(f"처리량: {median['messages_per_second']} msg/s")
+        self.stdout.write(f"메시지당 쿼리: {median['queries_per_message']}개")
+        self.stdout.write(f"최대 메모리: {median['peak_memory_mb']}MB (tracemalloc 기준)")
+
+    def _compare(self, report, options):
+        """이전 결과 대비 회귀 확인 (처리량 감소, 쿼리/메모리 증가가 허용치를 넘으면 실패)"""
+        try:
+            with open(options['baseline'], encoding='utf-8') as f:
+                baseline = json.load(f)['median']
+        except (OSError, ValueError, KeyError) as e:
+            raise CommandError(f'기준 결과를 읽을 수 없습니다: {e}')
+
+        tolerance = options['tolerance'] / 100
+        current = report['median']
+        checks = [
+            ('messages_per_second', '처리량', -1),
+            ('queries_per_message', '메시지당 쿼리', 1),
+            ('peak_memory_mb', '최대 메모리', 1),
+        ]
+        regressions = []
+        for key, label, worse in checks:
+            before, after = baseline[key], current[key]
+            change = (after - before) / before if before else 0
+            self.stdout.write(f'{label}: {before} → {after} ({change:+.1%})')
+            if change * worse > tolerance:
+                regressions.append(label)
+
+        if regressions:
+            raise CommandError(f"성능 회귀: {', '.join(regressions)} (허용치 {options['tolerance']:g}%)")
+        self.stdout.write(self.style.SUCCESS('기준 대비 회귀 없음'))
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-19 11:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0002_waitlist_consultlog'),
+        ('notifications', '0003_notificationlog_notif_log_sent_at_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notificationlog',
+            name='student',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='notification_logs', to='students.student', verbose_name='학생'),
+        ),
+    ]
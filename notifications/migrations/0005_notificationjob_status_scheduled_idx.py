@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-19 11:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0004_notificationlog_student'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notificationjob',
+            index=models.Index(fields=['status', 'scheduled_at'], name='notif_job_status_sched_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-19 11:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0005_notificationjob_status_scheduled_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notificationjob',
+            name='merge_siblings',
+            field=models.BooleanField(default=False, help_text='같은 연락처의 학생들을 변수를 합친 한 메시지로 발송', verbose_name='형제 합쳐 발송'),
+        ),
+    ]
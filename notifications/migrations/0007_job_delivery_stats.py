@@ -0,0 +1,31 @@
+# Generated by Django 4.2.30 on 2026-10-19 11:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0006_notificationjob_merge_siblings'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notificationjob',
+            name='delivery_stats',
+            field=models.JSONField(blank=True, default=dict, verbose_name='발송 집계'),
+        ),
+        migrations.AddField(
+            model_name='notificationlog',
+            name='error_code',
+            field=models.CharField(blank=True, max_length=50, verbose_name='오류 유형'),
+        ),
+        migrations.AddIndex(
+            model_name='notificationlog',
+            index=models.Index(fields=['job', 'sent_at'], name='notif_log_job_sent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notificationlog',
+            index=models.Index(fields=['job', 'result', 'sent_at'], name='notif_log_job_result_idx'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 4.2.30 on 2026-10-19 11:12
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0003_consultlog_consult_next_date_idx'),
+        ('notifications', '0007_job_delivery_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationOutbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('idempotency_key', models.CharField(max_length=100, unique=True, verbose_name='멱등 키')),
+                ('channel', models.CharField(choices=[('sms', 'SMS'), ('kakao', '카카오 알림톡'), ('email', '이메일'), ('app', '앱 푸시')], max_length=20, verbose_name='채널')),
+                ('recipient_name', models.CharField(max_length=100, verbose_name='수신자명')),
+                ('recipient_contact', models.CharField(max_length=100, verbose_name='수신 연락처')),
+                ('recipient_count', models.PositiveIntegerField(default=1, verbose_name='대상 학생 수')),
+                ('content', models.TextField(verbose_name='발송 내용')),
+                ('status', models.CharField(choices=[('pending', '발송대기'), ('sent', '발송완료'), ('failed', '발송실패')], default='pending', max_length=20, verbose_name='상태')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='발송 시도')),
+                ('error_code', models.CharField(blank=True, max_length=50, verbose_name='오류 유형')),
+                ('error_message', models.TextField(blank=True, verbose_name='오류 메시지')),
+                ('provider_response', models.TextField(blank=True, verbose_name='발송 응답')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('sent_at', models.DateTimeField(blank=True, null=True, verbose_name='발송 시각')),
+                ('logged_at', models.DateTimeField(blank=True, null=True, verbose_name='로그 기록 시각')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='outbox', to='notifications.notificationjob', verbose_name='발송 작업')),
+                ('student', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='students.student', verbose_name='대표 학생')),
+            ],
+            options={
+                'verbose_name': '알림 발송 아웃박스',
+                'verbose_name_plural': '알림 발송 아웃박스 목록',
+                'indexes': [models.Index(fields=['job', 'logged_at'], name='notif_outbox_job_logged_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-19 11:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0008_notificationoutbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notificationoutbox',
+            name='claimed_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='발송 선점 시각'),
+        ),
+    ]
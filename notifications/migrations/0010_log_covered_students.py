@@ -0,0 +1,45 @@
+# Generated by Django 4.2.30 on 2026-10-19 11:22
+
+from django.db import migrations, models
+
+
+def backfill_covered_students(apps, schema_editor):
+    """기존 로그/아웃박스의 대표 학생을 대상 학생으로 채움"""
+    NotificationLog = apps.get_model('notifications', 'NotificationLog')
+    NotificationOutbox = apps.get_model('notifications', 'NotificationOutbox')
+    Through = NotificationLog.covered_students.through
+
+    rows = NotificationLog.objects.filter(student__isnull=False).values_list('pk', 'student_id').iterator()
+    batch = []
+    for log_id, student_id in rows:
+        batch.append(Through(notificationlog_id=log_id, student_id=student_id))
+        if len(batch) >= 1000:
+            Through.objects.bulk_create(batch)
+            batch = []
+    Through.objects.bulk_create(batch)
+
+    for outbox in NotificationOutbox.objects.filter(logged_at__isnull=True, student__isnull=False):
+        outbox.student_ids = [outbox.student_id]
+        outbox.save(update_fields=['student_ids'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0003_consultlog_consult_next_date_idx'),
+        ('notifications', '0009_notificationoutbox_claimed_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notificationlog',
+            name='covered_students',
+            field=models.ManyToManyField(blank=True, related_name='covered_notification_logs', to='students.student', verbose_name='대상 학생'),
+        ),
+        migrations.AddField(
+            model_name='notificationoutbox',
+            name='student_ids',
+            field=models.JSONField(blank=True, default=list, verbose_name='대상 학생 ID'),
+        ),
+        migrations.RunPython(backfill_covered_students, migrations.RunPython.noop),
+    ]
@@ -97,12 +97,18 @@ class NotificationJob(models.Model):
     
     # 발송 설정
     scheduled_at = models.DateTimeField('예약 발송일시', null=True, blank=True)
+    merge_siblings = models.BooleanField(
+        '형제 합쳐 발송', default=False,
+        help_text='같은 연락처의 학생들을 변수를 합친 한 메시지로 발송'
+    )
     status = models.CharField('상태', max_length=20, choices=STATUS_CHOICES, default='pending')
     
     # 결과
     total_count = models.IntegerField('전체 건수', default=0)
     success_count = models.IntegerField('성공 건수', default=0)
     fail_count = models.IntegerField('실패 건수', default=0)
+    # 완료 시 한 번 계산해 두는 결과/오류 유형별 메시지 수 (services.store_delivery_stats)
+    delivery_stats = models.JSONField('발송 집계', default=dict, blank=True)
     
     created_at = models.DateTimeField('생성일', auto_now_add=True)
     processed_at = models.DateTimeField('처리일', null=True, blank=True)
@@ -112,6 +118,9 @@ class NotificationJob(models.Model):
         verbose_name = '알림 발송 작업'
         verbose_name_plural = '알림 발송 작업 목록'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'scheduled_at'], name='notif_job_status_sched_idx'),
+        ]
     
     def __str__(self):
         return f"[{self.get_status_display()}] {self.created_at.strftime('%Y-%m-%d %H:%M')}"
@@ -130,12 +139,28 @@ class NotificationLog(models.Model):
         related_name='logs',
         verbose_name='발송 작업'
     )
+    student = models.ForeignKey(
+        Student,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='notification_logs',
+        verbose_name='학생'
+    )
+    # 형제 합치기로 한 메시지가 여러 학생 몫이면 전부 (중복 발송 판단 기준)
+    covered_students = models.ManyToManyField(
+        Student,
+        blank=True,
+        related_name='covered_notification_logs',
+        verbose_name='대상 학생'
+    )
     
     recipient_name = models.CharField('수신자명', max_length=100)
     recipient_contact = models.CharField('수신 연락처', max_length=100)
     
     sent_content = models.TextField('발송 내용')
     result = models.CharField('결과', max_length=20, choices=RESULT_CHOICES)
+    error_code = models.CharField('오류 유형', max_length=50, blank=True)
     error_message = models.TextField('오류 메시지', blank=True)
     
     sent_at = models.DateTimeField('발송 시각', auto_now_add=True)
@@ -145,11 +170,79 @@ class NotificationLog(models.Model):
         verbose_name = '알림 발송 로그'
         verbose_name_plural = '알림 발송 로그 목록'
         ordering = ['-sent_at']
+        indexes = [
+            models.Index(fields=['sent_at'], name='notif_log_sent_at_idx'),
+            models.Index(fields=['job', 'sent_at'], name='notif_log_job_sent_idx'),
+            models.Index(fields=['job', 'result', 'sent_at'], name='notif_log_job_result_idx'),
+        ]
     
     def __str__(self):
         return f"{self.recipient_name} - {self.get_result_display()}"
 
 
+class NotificationOutbox(models.Model):
+    """
+    알림 발송 아웃박스
+    
+    발송 전에 메시지 1건당 1행을 일괄 기록하고, 발송 제공자가 접수하면 행 단위로 완료 표시한다.
+    멱등 키(작업, 수신자, 채널)가 유일하므로 작업을 재시도/재개해도 이미 보낸 메시지는 다시 보내지 않는다.
+    """
+    STATUS_CHOICES = [
+        ('pending', '발송대기'),
+        ('sent', '발송완료'),
+        ('failed', '발송실패'),
+    ]
+    
+    job = models.ForeignKey(
+        NotificationJob,
+        on_delete=models.CASCADE,
+        related_name='outbox',
+        verbose_name='발송 작업'
+    )
+    idempotency_key = models.CharField('멱등 키', max_length=100, unique=True)
+    student = models.ForeignKey(
+        Student,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name='대표 학생'
+    )
+    channel = models.CharField('채널', max_length=20, choices=NotificationTemplate.CHANNEL_CHOICES)
+    
+    recipient_name = models.CharField('수신자명', max_length=100)
+    recipient_contact = models.CharField('수신 연락처', max_length=100)
+    recipient_count = models.PositiveIntegerField('대상 학생 수', default=1)
+    student_ids = models.JSONField('대상 학생 ID', default=list, blank=True)
+    content = models.TextField('발송 내용')
+    
+    status = models.CharField('상태', max_length=20, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveIntegerField('발송 시도', default=0)
+    error_code = models.CharField('오류 유형', max_length=50, blank=True)
+    error_message = models.TextField('오류 메시지', blank=True)
+    provider_response = models.TextField('발송 응답', blank=True)
+    
+    created_at = models.DateTimeField('생성일', auto_now_add=True)
+    claimed_at = models.DateTimeField('발송 선점 시각', null=True, blank=True)
+    sent_at = models.DateTimeField('발송 시각', null=True, blank=True)
+    logged_at = models.DateTimeField('로그 기록 시각', null=True, blank=True)
+    
+    class Meta:
+        verbose_name = '알림 발송 아웃박스'
+        verbose_name_plural = '알림 발송 아웃박스 목록'
+        indexes = [
+            models.Index(fields=['job', 'logged_at'], name='notif_outbox_job_logged_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.idempotency_key} - {self.get_status_display()}"
+    
+    @staticmethod
+    def make_key(job_id, student_id, channel):
+        """멱등 키 (작업, 대표 학생, 채널)"""
+        return f'{job_id}:{student_id}:{channel}'
+
+
 class WeeklyReport(models.Model):
     """주간/월간 보고서"""
     PERIOD_CHOICES = [
@@ -206,22 +299,39 @@ class WeeklyReport(models.Model):
     def __str__(self):
         return f"{self.student.name} - {self.title}"
     
+    @staticmethod
+    def get_period(period_type, today):
+        """
+        기준일이 속한 주(월~일) 또는 월의 보고서 기간
+        
+        Returns:
+            tuple: (시작일, 종료일, 제목)
+        """
+        from calendar import monthrange
+        from datetime import timedelta
+        
+        if period_type == 'weekly':
+            start_date = today - timedelta(days=today.weekday())
+            end_date = start_date + timedelta(days=6)
+            title = f"{start_date.strftime('%m/%d')} ~ {end_date.strftime('%m/%d')} 주간 보고서"
+        else:
+            start_date = today.replace(day=1)
+            end_date = today.replace(day=monthrange(today.year, today.month)[1])
+            title = f"{today.month}월 월간 보고서"
+        return start_date, end_date, title
+    
     def calculate_stats(self):
         """통계 자동 계산"""
         from django.db.models import Avg
-        from attendance.models import Attendance
+        from attendance.summary import get_attendance_stats
         from academics.models import Score
         
-        # 출결 통계
-        attendances = Attendance.objects.filter(
-            student=self.student,
-            date__gte=self.start_date,
-            date__lte=self.end_date
-        )
-        self.attendance_total = attendances.count()
-        self.attendance_present = attendances.filter(status='present').count()
-        self.attendance_absent = attendances.filter(status='absent').count()
-        self.attendance_late = attendances.filter(status='late').count()
+        # 출결 통계 (완전한 월은 월간 집계, 나머지는 집계 쿼리 1회)
+        stats = get_attendance_stats(self.student_id, self.start_date, self.end_date)
+        self.attendance_total = stats['total']
+        self.attendance_present = stats['present']
+        self.attendance_absent = stats['absent']
+        self.attendance_late = stats['late']
         
         # 성적 통계
         scores = Score.objects.filter(
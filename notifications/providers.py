@@ -0,0 +1,52 @@
+"""
+알림 발송 제공자 (SMS/알림톡/이메일 API 연동 지점)
+
+settings.NOTIFICATION_PROVIDER에 지정한 클래스로 발송한다.
+실제 API 연동 전까지는 SimulatedProvider가 모든 발송을 성공으로 처리한다.
+"""
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+class SendResult:
+    """
+    발송 결과
+    
+    error_code: 실패 유형 (예: 'invalid_number', 'timeout') - 발송 작업의 오류 유형별 집계 기준
+    """
+    __slots__ = ('success', 'response', 'error', 'error_code')
+    
+    def __init__(self, success, response='', error='', error_code=''):
+        self.success = success
+        self.response = response
+        self.error = error
+        self.error_code = error_code
+
+
+class BaseProvider:
+    """발송 제공자 기본 클래스"""
+    
+    def send(self, channel, contact, subject, content, idempotency_key=None):
+        """
+        메시지 1건 발송
+        
+        Args:
+            idempotency_key: 아웃박스 멱등 키 - 지원하는 API에는 그대로 넘겨
+                재시도 중 중복 접수된 요청을 제공자 쪽에서 걸러내게 한다
+        
+        Returns:
+            SendResult
+        """
+        raise NotImplementedError
+
+
+class SimulatedProvider(BaseProvider):
+    """시뮬레이션 발송 (항상 성공)"""
+    
+    def send(self, channel, contact, subject, content, idempotency_key=None):
+        return SendResult(True)
+
+
+def get_provider():
+    """설정된 발송 제공자 인스턴스"""
+    return import_string(settings.NOTIFICATION_PROVIDER)()
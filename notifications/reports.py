@@ -0,0 +1,86 @@
+"""
+주간/월간 보고서 일괄 생성
+
+학생마다 calculate_stats()를 호출하면 학생 수 x 집계 쿼리만큼 DB를 왕복하므로,
+대상 학생 전체의 출결/성적 통계를 학생별 GROUP BY 집계 쿼리 두 번으로 구하고
+보고서를 bulk_create 한다. 학생 수와 무관하게 쿼리 수가 일정하다.
+"""
+from django.db.models import Avg, Count, Exists, OuterRef
+
+from attendance.summary import get_attendance_stats_by_student
+from .models import WeeklyReport
+
+
+def get_score_stats_by_student(students, start_date, end_date):
+    """
+    여러 학생의 기간(양 끝 포함) 성적 통계 (학생별 GROUP BY 집계 쿼리 1회)
+    
+    Returns:
+        dict: {학생 ID: (시험 수, 평균 점수)} (성적이 없는 학생은 빠짐)
+    """
+    from academics.models import Score
+    
+    rows = (
+        Score.objects.filter(
+            student__in=students,
+            exam__exam_date__gte=start_date,
+            exam__exam_date__lte=end_date,
+        )
+        .order_by()
+        .values('student_id')
+        .annotate(count=Count('id'), avg=Avg('score'))
+    )
+    return {row['student_id']: (row['count'], row['avg']) for row in rows}
+
+
+def generate_reports(students, period_type, start_date, end_date, title, created_by_id=None):
+    """
+    대상 학생 전체의 보고서 일괄 생성
+    
+    같은 기간 보고서가 이미 있는 학생은 건너뛰므로 반복 실행해도 중복 생성되지 않는다.
+    
+    Args:
+        students: 대상 학생 쿼리셋
+        period_type: 'weekly' 또는 'monthly'
+        start_date, end_date: 보고서 기간 (양 끝 포함)
+        title: 보고서 제목
+        created_by_id: 작성자 ID
+    
+    Returns:
+        int: 생성된 보고서 수
+    """
+    existing = WeeklyReport.objects.filter(
+        student=OuterRef('pk'),
+        period_type=period_type,
+        start_date=start_date,
+        end_date=end_date,
+    )
+    targets = students.exclude(Exists(existing))
+    student_ids = list(targets.order_by('pk').values_list('pk', flat=True))
+    if not student_ids:
+        return 0
+    
+    attendance = get_attendance_stats_by_student(targets, start_date, end_date)
+    scores = get_score_stats_by_student(targets, start_date, end_date)
+    
+    reports = []
+    for student_id in student_ids:
+        stats = attendance.get(student_id, {})
+        exam_count, avg = scores.get(student_id, (0, None))
+        reports.append(WeeklyReport(
+            student_id=student_id,
+            period_type=period_type,
+            start_date=start_date,
+            end_date=end_date,
+            title=title,
+            attendance_total=stats.get('total', 0),
+            attendance_present=stats.get('present', 0),
+            attendance_absent=stats.get('absent', 0),
+            attendance_late=stats.get('late', 0),
+            exam_count=exam_count,
+            average_score=round(avg, 2) if avg else None,
+            created_by_id=created_by_id,
+        ))
+    WeeklyReport.objects.bulk_create(reports, batch_size=1000)
+    
+    return len(reports)
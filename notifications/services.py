@@ -0,0 +1,333 @@
+"""
+알림 발송 서비스
+수동 발송 화면과 자동 발송(결석 처리 등)이 공유하는 발송 로직.
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, Count, F, Q, Sum, Value, When
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from core.utils import group_by_contact
+from students.models import Student
+from .models import NotificationJob, NotificationLog, NotificationOutbox
+from .providers import SendResult, get_provider
+from .templating import compile_template, merge_values, resolve_variables
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_recipient_groups(job):
+    """
+    발송 작업의 대상 학생을 연락처별 그룹으로 결정
+    
+    반 전체/전체 대상은 발송 시점의 재원생으로 결정한다 (M2M에 저장하지 않음).
+    연락처(학부모 연락처 우선)를 정규화해 같은 번호의 형제를 한 그룹으로 묶는다.
+    
+    Returns:
+        list: [[학생 ID, ...], ...]
+    """
+    if job.target_type == 'student':
+        students = job.target_students.all()
+    elif job.target_type == 'class':
+        if not job.target_class_id:
+            return []
+        students = Student.objects.filter(assigned_class_id=job.target_class_id, status='enrolled')
+    else:
+        students = Student.objects.filter(status='enrolled')
+    rows = students.order_by('pk').values_list('pk', 'parent_phone', 'phone')
+    return [
+        student_ids
+        for _, student_ids in group_by_contact((pk, parent_phone or phone) for pk, parent_phone, phone in rows)
+    ]
+
+
+def chunk_groups(groups, size):
+    """그룹을 쪼개지 않고 학생 수 기준 약 size명씩 청크로 나누기"""
+    chunk = []
+    count = 0
+    for group in groups:
+        chunk.append(group)
+        count += len(group)
+        if count >= size:
+            yield chunk
+            chunk = []
+            count = 0
+    if chunk:
+        yield chunk
+
+
+def load_recipients(student_ids):
+    """청크 대상 학생을 반 정보와 함께 한 번에 조회"""
+    return list(
+        Student.objects.filter(pk__in=student_ids).select_related('assigned_class').order_by('pk')
+    )
+
+
+def build_outbox(job, groups):
+    """
+    연락처 그룹별 메시지를 렌더링해 아웃박스 행 생성 (저장 전)
+    
+    학생 로딩(쿼리 1회) → 변수 일괄 조회(변수별 최대 1회) → 렌더링 순서로 처리하여 수신자당 쿼리가 없다.
+    같은 연락처의 학생들은 merge_siblings이면 변수를 합친 한 메시지로, 아니면 내용이 같은 메시지를 한 번만 보낸다.
+    학생 삭제 등으로 찾지 못한 대상은 실패 행으로 만들어 집계에 포함한다.
+    
+    Args:
+        job: NotificationJob
+        groups: [[학생 ID, ...], ...] (같은 연락처끼리 묶인 그룹)
+    
+    Returns:
+        list: NotificationOutbox 목록
+    """
+    channel = job.template.channel if job.template else 'sms'
+    
+    template = compile_template(job.content)
+    students = load_recipients([student_id for group in groups for student_id in group])
+    by_pk = {student.pk: student for student in students}
+    context = {}
+    values = resolve_variables(template.variables, students, context)
+    
+    rows = []
+    for group in groups:
+        members = []
+        for student_id in group:
+            if student_id in by_pk:
+                members.append(by_pk[student_id])
+                continue
+            rows.append(NotificationOutbox(
+                job=job,
+                idempotency_key=NotificationOutbox.make_key(job.pk, student_id, channel),
+                channel=channel,
+                recipient_name='-',
+                recipient_contact='-',
+                content='',
+                status='failed',
+                error_code='student_not_found',
+                error_message=f'학생을 찾을 수 없습니다 (ID {student_id})',
+            ))
+        if not members:
+            continue
+        
+        # (대상 학생 목록, 내용) - 같은 연락처로 보낼 메시지
+        if job.merge_siblings and len(members) > 1:
+            merged = merge_values(values, [student.pk for student in members], context)
+            outgoing = [(members, template.render(merged))]
+        else:
+            by_content = {}
+            for student in members:
+                by_content.setdefault(template.render(values, student.pk), []).append(student)
+            outgoing = [(covered, content) for content, covered in by_content.items()]
+        
+        recipient_contact = members[0].parent_phone or members[0].phone or '-'
+        for covered, content in outgoing:
+            rows.append(NotificationOutbox(
+                job=job,
+                idempotency_key=NotificationOutbox.make_key(job.pk, covered[0].pk, channel),
+                student=covered[0],
+                channel=channel,
+                recipient_name=', '.join(student.name for student in covered)[:100],
+                recipient_contact=recipient_contact,
+                recipient_count=len(covered),
+                student_ids=[student.pk for student in covered],
+                content=content,
+            ))
+    return rows
+
+
+def prepare_outbox(job, chunk_size):
+    """
+    발송 작업의 모든 메시지를 아웃박스에 일괄 기록하고, 로그로 확정되지 않은 행을 청크로 나누기
+    
+    같은 멱등 키의 행이 이미 있으면 그대로 두므로(ignore_conflicts), 중단된 작업을 다시 준비해도
+    이미 보낸 메시지는 다시 만들어지지 않고 남은 행만 청크로 반환된다.
+    
+    Returns:
+        list: [[아웃박스 ID, ...], ...]
+    """
+    groups = resolve_recipient_groups(job)
+    # 같은 연락처 그룹은 한 청크에서 렌더링해야 형제 합치기/중복 제거가 된다
+    for chunk in chunk_groups(groups, chunk_size):
+        NotificationOutbox.objects.bulk_create(
+            build_outbox(job, chunk),
+            batch_size=settings.NOTIFICATION_LOG_BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+    
+    NotificationJob.objects.filter(pk=job.pk).update(
+        total_count=job.outbox.aggregate(total=Coalesce(Sum('recipient_count'), 0))['total']
+    )
+    outbox_ids = list(job.outbox.filter(logged_at__isnull=True).order_by('pk').values_list('pk', flat=True))
+    return [outbox_ids[i:i + chunk_size] for i in range(0, len(outbox_ids), chunk_size)]
+
+
+def send_outbox(job, outbox_ids):
+    """
+    대기 중인 아웃박스 행 발송
+    
+    청크의 대기 행을 먼저 선점(claimed_at)하므로 같은 청크가 동시에 실행되어도(재개 스윕,
+    브로커 재전달) 한 행은 한 워커만 보낸다. 선점은 NOTIFICATION_OUTBOX_LEASE_SECONDS 동안 유효하고,
+    그 안에 끝나지 않은 행(워커 장애)은 만료 후 다시 선점할 수 있다.
+    발송 제공자가 접수(또는 거절)할 때마다 해당 행을 완료 표시하므로, 다시 실행하면 남은 대기 행부터
+    이어서 보낸다. (중복 가능 구간은 발송 중이던 1건뿐이며, 그마저도 멱등 키를 받는 제공자는 걸러낼 수 있다)
+    
+    Returns:
+        int: 이번에 발송 시도한 메시지 수
+    """
+    provider = get_provider()
+    now = timezone.now()
+    lease_cutoff = now - timedelta(seconds=settings.NOTIFICATION_OUTBOX_LEASE_SECONDS)
+    with transaction.atomic():
+        claimable = list(
+            job.outbox.select_for_update(skip_locked=True)
+            .filter(pk__in=outbox_ids, status='pending')
+            .filter(Q(claimed_at__isnull=True) | Q(claimed_at__lt=lease_cutoff))
+            .values_list('pk', flat=True)
+        )
+        NotificationOutbox.objects.filter(pk__in=claimable).update(claimed_at=now)
+    rows = list(job.outbox.filter(pk__in=claimable).order_by('pk'))
+    
+    for row in rows:
+        try:
+            result = provider.send(
+                row.channel, row.recipient_contact, job.subject, row.content,
+                idempotency_key=row.idempotency_key,
+            )
+        except Exception as e:
+            logger.exception("알림 발송 실패 (job=%s, outbox=%s)", job.pk, row.pk)
+            result = SendResult(False, error=str(e), error_code=type(e).__name__)
+        
+        NotificationOutbox.objects.filter(pk=row.pk, status='pending').update(
+            status='sent' if result.success else 'failed',
+            attempts=F('attempts') + 1,
+            error_code='' if result.success else (result.error_code or 'unknown')[:50],
+            error_message=result.error,
+            provider_response=result.response,
+            sent_at=timezone.now(),
+        )
+    return len(rows)
+
+
+def _add_covered_students(logs, rows):
+    """로그별 대상 학생(형제 합치기 포함) 일괄 연결 - 그 사이 삭제된 학생은 제외"""
+    pairs = [
+        (log.pk, student_id)
+        for log, row in zip(logs, rows)
+        for student_id in (row.student_ids or ([row.student_id] if row.student_id else []))
+    ]
+    existing = set(
+        Student.objects.filter(pk__in={student_id for _, student_id in pairs}).values_list('pk', flat=True)
+    )
+    Through = NotificationLog.covered_students.through
+    Through.objects.bulk_create(
+        [
+            Through(notificationlog_id=log_id, student_id=student_id)
+            for log_id, student_id in pairs
+            if student_id in existing
+        ],
+        batch_size=settings.NOTIFICATION_LOG_BATCH_SIZE,
+    )
+
+
+def finalize_outbox(job_id, outbox_ids):
+    """
+    발송이 끝난 아웃박스 행을 로그로 옮기고 작업 진행 카운터에 반영
+    
+    로그 기록, logged_at 표시, 카운터 증가를 한 트랜잭션에서 하므로
+    같은 청크를 다시 처리해도 로그와 카운터가 두 번 반영되지 않는다.
+    
+    Returns:
+        tuple: (성공 학생 수, 실패 학생 수, 이 호출로 작업이 완료되었는지)
+    """
+    with transaction.atomic():
+        rows = list(
+            NotificationOutbox.objects.select_for_update()
+            .filter(pk__in=outbox_ids, logged_at__isnull=True)
+            .exclude(status='pending')
+            .order_by('pk')
+        )
+        if not rows:
+            return 0, 0, False
+        
+        logs = NotificationLog.objects.bulk_create(
+            [
+                NotificationLog(
+                    job_id=job_id,
+                    student_id=row.student_id,
+                    recipient_name=row.recipient_name,
+                    recipient_contact=row.recipient_contact,
+                    sent_content=row.content,
+                    result='success' if row.status == 'sent' else 'failed',
+                    error_code=row.error_code,
+                    error_message=row.error_message,
+                    provider_response=row.provider_response,
+                )
+                for row in rows
+            ],
+            batch_size=settings.NOTIFICATION_LOG_BATCH_SIZE,
+        )
+        _add_covered_students(logs, rows)
+        NotificationOutbox.objects.filter(pk__in=[row.pk for row in rows]).update(logged_at=timezone.now())
+        
+        success_count = sum(row.recipient_count for row in rows if row.status == 'sent')
+        fail_count = sum(row.recipient_count for row in rows if row.status != 'sent')
+        completed = record_progress(job_id, success_count, fail_count)
+    
+    return success_count, fail_count, completed
+
+
+def record_progress(job_id, success_count, fail_count):
+    """
+    청크 결과를 작업 카운터에 원자적으로 반영하고, 모든 대상이 처리되었으면 작업 완료 처리
+    
+    Returns:
+        bool: 이 호출로 작업이 완료되었으면 True
+    """
+    NotificationJob.objects.filter(pk=job_id).update(
+        success_count=F('success_count') + success_count,
+        fail_count=F('fail_count') + fail_count,
+    )
+    # 마지막 청크만 조건을 만족 (동시에 끝나도 상태 전이는 한 번)
+    return bool(
+        NotificationJob.objects.filter(
+            pk=job_id,
+            status='processing',
+            total_count__lte=F('success_count') + F('fail_count'),
+        ).update(
+            status=Case(
+                When(success_count=0, fail_count__gt=0, then=Value('failed')),
+                default=Value('sent'),
+            ),
+            processed_at=timezone.now(),
+        )
+    )
+
+
+def store_delivery_stats(job_id):
+    """
+    발송 로그를 결과/오류 유형별로 한 번 집계해 작업에 저장
+    
+    작업 완료 시 한 번만 호출하므로, 상세 화면은 로그 수와 무관하게 저장된 집계를 읽는다.
+    
+    Returns:
+        dict: {'results': {결과: 메시지 수}, 'errors': [{'code': 오류 유형, 'count': 메시지 수}, ...]}
+    """
+    rows = (
+        NotificationLog.objects.filter(job_id=job_id)
+        .order_by()
+        .values('result', 'error_code')
+        .annotate(count=Count('id'))
+    )
+    results = {}
+    errors = []
+    for row in rows:
+        results[row['result']] = results.get(row['result'], 0) + row['count']
+        if row['result'] != 'success':
+            errors.append({'code': row['error_code'], 'count': row['count']})
+    errors.sort(key=lambda error: -error['count'])
+    
+    stats = {'results': results, 'errors': errors}
+    NotificationJob.objects.filter(pk=job_id).update(delivery_stats=stats)
+    return stats
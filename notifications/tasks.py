@@ -0,0 +1,247 @@
+"""
+Notifications app Celery tasks.
+알림 발송 작업을 수신자 청크로 나누어 병렬 처리
+"""
+
+from celery import group, shared_task
+
+TRIGGER_LOCK_KEY = 'notifications:triggers:lock'
+
+
+@shared_task
+def process_notification_job(job_id, claimed=False):
+    """
+    알림 발송 작업 분배
+    
+    pending 작업을 processing으로 선점하고, 모든 메시지를 아웃박스에 기록한 뒤
+    아웃박스 행을 청크로 나누어 send_notification_chunk 태스크들로 병렬 발송한다.
+    
+    Args:
+        job_id: 발송 작업 ID
+        claimed: 예약 발송 디스패처가 이미 processing으로 선점한 작업이면 True
+    """
+    from .models import NotificationJob
+    
+    # 중복 큐잉되어도 한 번만 처리
+    if claimed:
+        if not NotificationJob.objects.filter(pk=job_id, status='processing', success_count=0, fail_count=0).exists():
+            return {'status': 'skipped', 'job_id': job_id}
+    elif not NotificationJob.objects.filter(pk=job_id, status='pending').update(status='processing'):
+        return {'status': 'skipped', 'job_id': job_id}
+    
+    return _dispatch_outbox(job_id)
+
+
+@shared_task
+def resume_notification_job(job_id):
+    """
+    중단된 발송 작업 재개
+    
+    워커 장애 등으로 processing에 멈춘 작업의 아웃박스를 다시 준비하고 로그로 확정되지 않은 행만 발송한다.
+    이미 접수된 메시지는 멱등 키로 걸러지고, 다른 워커가 선점한 행은 건너뛰므로 다시 보내지 않는다.
+    resume_stalled_notification_jobs가 주기적으로 호출한다.
+    """
+    from .models import NotificationJob
+    
+    if not NotificationJob.objects.filter(pk=job_id, status='processing').exists():
+        return {'status': 'skipped', 'job_id': job_id}
+    
+    return _dispatch_outbox(job_id)
+
+
+def _dispatch_outbox(job_id):
+    """아웃박스 준비 후 남은 행을 청크 태스크로 분배"""
+    from django.conf import settings
+    from .models import NotificationJob
+    from .services import prepare_outbox, record_progress, store_delivery_stats
+    
+    job = NotificationJob.objects.select_related('template').get(pk=job_id)
+    chunks = prepare_outbox(job, settings.NOTIFICATION_CHUNK_SIZE)
+    
+    if not chunks:
+        # 보낼 메시지가 없거나 모두 확정됨 - 카운터가 전체 건수에 도달했으면 완료 처리
+        if record_progress(job_id, 0, 0):
+            store_delivery_stats(job_id)
+        return {'status': 'success', 'job_id': job_id, 'chunks': 0}
+    
+    group(send_notification_chunk.s(job_id, chunk) for chunk in chunks).apply_async()
+    
+    return {'status': 'success', 'job_id': job_id, 'chunks': len(chunks)}
+
+
+# 워커가 발송 도중 죽으면 브로커가 청크를 다시 전달하고, 아웃박스 상태로 남은 메시지부터 이어서 보낸다
+# (죽은 워커가 선점한 행은 선점이 만료된 뒤 재개 스윕이 다시 분배)
+@shared_task(acks_late=True, reject_on_worker_lost=True)
+def send_notification_chunk(job_id, outbox_ids):
+    """아웃박스 청크 발송 후 로그 기록 및 작업 진행 카운터 갱신"""
+    from .models import NotificationJob
+    from .services import finalize_outbox, send_outbox, store_delivery_stats
+    
+    try:
+        job = NotificationJob.objects.get(pk=job_id)
+    except NotificationJob.DoesNotExist:
+        return {'status': 'error', 'message': 'Job not found'}
+    
+    if job.status == 'cancelled':
+        return {'status': 'skipped', 'job_id': job_id}
+    
+    attempted = send_outbox(job, outbox_ids)
+    success_count, fail_count, completed = finalize_outbox(job_id, outbox_ids)
+    if completed:
+        store_delivery_stats(job_id)
+    
+    return {
+        'status': 'success',
+        'job_id': job_id,
+        'attempted': attempted,
+        'sent': success_count,
+        'failed': fail_count,
+        'completed': completed,
+    }
+
+
+@shared_task
+def resume_stalled_notification_jobs():
+    """
+    멈춘 발송 작업 찾아 재개
+    
+    processing 상태이면서 다음 중 하나인 작업을 resume_notification_job으로 다시 분배한다.
+    - 로그로 확정되지 않은 아웃박스 행이 있고, 선점 유효 시간 동안 행이 새로 만들어지거나 선점되지 않음
+      (청크 태스크 유실, 워커 장애)
+    - 아웃박스가 없고 선점 유효 시간이 지남 (분배 태스크가 아웃박스 준비 전에 중단)
+    """
+    from datetime import timedelta
+    from django.conf import settings
+    from django.db.models import Exists, OuterRef, Q
+    from django.db.models.functions import Coalesce
+    from django.utils import timezone
+    from .models import NotificationJob, NotificationOutbox
+    
+    cutoff = timezone.now() - timedelta(seconds=settings.NOTIFICATION_OUTBOX_LEASE_SECONDS)
+    outbox = NotificationOutbox.objects.filter(job=OuterRef('pk'))
+    recent = outbox.filter(Q(created_at__gte=cutoff) | Q(claimed_at__gte=cutoff))
+    
+    job_ids = list(
+        NotificationJob.objects.filter(status='processing')
+        .annotate(started_at=Coalesce('scheduled_at', 'created_at'))
+        .filter(
+            Q(Exists(outbox.filter(logged_at__isnull=True)), ~Exists(recent))
+            | Q(~Exists(outbox), started_at__lt=cutoff)
+        )
+        .order_by('pk')
+        .values_list('pk', flat=True)[:settings.NOTIFICATION_RESUME_BATCH_SIZE]
+    )
+    for job_id in job_ids:
+        resume_notification_job.delay(job_id)
+    
+    return {'status': 'success', 'resumed': len(job_ids)}
+
+
+@shared_task
+def dispatch_scheduled_jobs():
+    """
+    예약 시각이 지난 알림 발송 작업 분배
+    
+    SKIP LOCKED로 선점하므로 디스패처가 여러 워커에서 동시에 실행되어도 같은 작업을 중복 처리하지 않는다.
+    """
+    from django.conf import settings
+    from django.db import transaction
+    from django.utils import timezone
+    from .models import NotificationJob
+    
+    with transaction.atomic():
+        job_ids = list(
+            NotificationJob.objects.select_for_update(skip_locked=True).filter(
+                status='pending',
+                scheduled_at__lte=timezone.now(),
+            ).order_by('scheduled_at').values_list('id', flat=True)[:settings.NOTIFICATION_DISPATCH_BATCH_SIZE]
+        )
+        NotificationJob.objects.filter(id__in=job_ids).update(status='processing')
+    
+    for job_id in job_ids:
+        process_notification_job.delay(job_id, claimed=True)
+    
+    return {'status': 'success', 'dispatched': len(job_ids)}
+
+
+@shared_task
+def evaluate_notification_triggers(trigger_types=None):
+    """자동 발송 템플릿 조건 평가 후 발송 작업 생성 및 분배"""
+    from django.core.cache import cache
+    from .triggers import evaluate_triggers
+    
+    # 주기 실행과 결석 처리 직후 실행이 겹쳐 같은 작업을 두 번 만들지 않도록 잠금
+    if not cache.add(TRIGGER_LOCK_KEY, 1, timeout=300):
+        return {'status': 'skipped', 'reason': 'locked'}
+    try:
+        job_ids = evaluate_triggers(trigger_types)
+    finally:
+        cache.delete(TRIGGER_LOCK_KEY)
+    for job_id in job_ids:
+        process_notification_job.delay(job_id)
+    
+    return {'status': 'success', 'jobs': len(job_ids)}
+
+
+@shared_task
+def generate_weekly_reports(period_type='weekly', class_id=None, user_id=None, day=None):
+    """
+    반 전체 또는 전체 재원생의 주간/월간 보고서 일괄 생성
+    
+    Args:
+        period_type: 'weekly' 또는 'monthly'
+        class_id: 대상 반 ID (None이면 전체 재원생)
+        user_id: 작성자 ID
+        day: 기준일 (YYYY-MM-DD, 기본값 오늘) - 이 날짜가 속한 주/월의 보고서를 만든다
+    """
+    from datetime import date
+    from django.utils import timezone
+    from students.models import Student
+    from .models import WeeklyReport
+    from .reports import generate_reports
+    
+    today = date.fromisoformat(day) if day else timezone.localdate()
+    start_date, end_date, title = WeeklyReport.get_period(period_type, today)
+    
+    students = Student.objects.filter(status='enrolled')
+    if class_id:
+        students = students.filter(assigned_class_id=class_id)
+    
+    created = generate_reports(students, period_type, start_date, end_date, title, created_by_id=user_id)
+    
+    return {
+        'status': 'success',
+        'created': created,
+        'start_date': start_date.isoformat(),
+        'end_date': end_date.isoformat(),
+    }
+
+
+@shared_task
+def purge_notification_outbox():
+    """
+    끝난 작업의 아웃박스 행 정리
+    
+    로그로 옮겨진 지 보관 기간이 지난 행과 취소된 작업의 남은 행을 배치 단위로 삭제한다.
+    (발송 이력은 NotificationLog에 남음)
+    """
+    from datetime import timedelta
+    from django.conf import settings
+    from django.db.models import Q
+    from django.utils import timezone
+    from .models import NotificationOutbox
+    
+    cutoff = timezone.now() - timedelta(days=settings.NOTIFICATION_OUTBOX_RETENTION_DAYS)
+    deleted = 0
+    while True:
+        batch = list(
+            NotificationOutbox.objects.filter(
+                Q(logged_at__lt=cutoff) | Q(job__status='cancelled', created_at__lt=cutoff)
+            )
+            .values_list('pk', flat=True)[:settings.NOTIFICATION_LOG_BATCH_SIZE]
+        )
+        if not batch:
+            break
+        deleted += NotificationOutbox.objects.filter(pk__in=batch).delete()[0]
+    
+    return {'status': 'success', 'deleted': deleted}
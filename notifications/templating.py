@@ -0,0 +1,218 @@
+"""
+알림 템플릿 컴파일러와 변수 리졸버
+
+템플릿 내용은 한 번만 파싱하여 리터럴/변수 조각으로 나누고,
+변수 값은 수신자 전체에 대해 변수별로 한 번씩 일괄 조회한다.
+수신자당 렌더링 비용은 조각 목록 복사 + join 한 번이다.
+
+사용 예:
+    template = compile_template(job.content)
+    values = resolve_variables(template.variables, students)
+    for student in students:
+        content = template.render(values, student.pk)
+"""
+import re
+from functools import lru_cache
+
+from django.utils import timezone
+
+from core.utils import format_currency
+
+PLACEHOLDER_RE = re.compile(r'\{([^{}\s]+)\}')
+
+# 변수명 -> 리졸버 함수 (students, context) -> {학생 ID: 값} 또는 전체 공통 값(str)
+RESOLVERS = {}
+# 변수명 -> 형제 합치기 함수 (keys, values, context) -> str (없으면 중복 제거 후 쉼표로 연결)
+COMBINERS = {}
+
+
+class CompiledTemplate:
+    """리터럴/변수 조각으로 파싱된 템플릿"""
+    __slots__ = ('parts', 'slots', 'variables')
+    
+    def __init__(self, content):
+        # 변수 자리에는 원문('{변수명}')을 넣어 두어, 값이 없는 변수는 그대로 남는다
+        self.parts = []
+        self.slots = []
+        position = 0
+        for match in PLACEHOLDER_RE.finditer(content):
+            if match.start() > position:
+                self.parts.append(content[position:match.start()])
+            self.slots.append((len(self.parts), match.group(1)))
+            self.parts.append(match.group(0))
+            position = match.end()
+        if position < len(content):
+            self.parts.append(content[position:])
+        self.variables = frozenset(name for _, name in self.slots)
+    
+    def render(self, values, key=None):
+        """
+        Args:
+            values: {변수명: {키: 값} 또는 공통 값}
+            key: 수신자 키 (학생 ID)
+        """
+        if not self.slots:
+            return ''.join(self.parts)
+        parts = self.parts[:]
+        for index, name in self.slots:
+            value = values.get(name)
+            if value is None:
+                continue
+            if isinstance(value, dict):
+                value = value.get(key)
+                if value is None:
+                    continue
+            parts[index] = value
+        return ''.join(parts)
+
+
+@lru_cache(maxsize=256)
+def compile_template(content):
+    """템플릿 컴파일 (같은 내용은 재사용)"""
+    return CompiledTemplate(content)
+
+
+def resolver(name, combine=None):
+    """변수 리졸버 등록 데코레이터 (combine: 형제 합쳐 발송 시 값 합치기 함수)"""
+    def decorator(func):
+        RESOLVERS[name] = func
+        if combine is not None:
+            COMBINERS[name] = combine
+        return func
+    return decorator
+
+
+def resolve_variables(variables, students, context=None):
+    """
+    템플릿에 쓰인 변수만 수신자 전체에 대해 일괄 조회
+    
+    Args:
+        variables: 변수명 집합 (CompiledTemplate.variables)
+        students: 학생 목록 (assigned_class select_related)
+        context: 리졸버 간 공유 데이터 (같은 조회 결과 재사용)
+    
+    Returns:
+        dict: {변수명: {학생 ID: 값} 또는 공통 값}
+    """
+    context = {} if context is None else context
+    context.setdefault('today', timezone.localdate())
+    return {
+        name: RESOLVERS[name](students, context)
+        for name in variables
+        if name in RESOLVERS
+    }
+
+
+def merge_values(values, keys, context):
+    """
+    여러 수신자(형제)의 변수 값을 한 메시지용으로 합치기
+    
+    Args:
+        values: resolve_variables 결과
+        keys: 합칠 학생 ID 목록
+        context: resolve_variables에 넘긴 공유 데이터
+    
+    Returns:
+        dict: {변수명: 합쳐진 값}
+    """
+    merged = {}
+    for name, value in values.items():
+        if not isinstance(value, dict):
+            merged[name] = value
+        elif name in COMBINERS:
+            merged[name] = COMBINERS[name](keys, value, context)
+        else:
+            merged[name] = ', '.join(dict.fromkeys(
+                value[key] for key in keys if value.get(key)
+            ))
+    return merged
+
+
+def _outstanding_payments(students, context):
+    """미납/부분납 수납 (학생별 미납 합계와 가장 오래된 미납 월) - 한 번만 조회"""
+    if 'outstanding' not in context:
+        from payments.models import Payment
+        
+        rows = (
+            Payment.objects.filter(
+                student_id__in=[student.pk for student in students],
+                status__in=['unpaid', 'partial'],
+            )
+            .order_by('student_id', 'year', 'month')
+            .values_list('student_id', 'year', 'month', 'amount', 'paid_amount')
+        )
+        outstanding = {}
+        for student_id, year, month, amount, paid_amount in rows:
+            entry = outstanding.setdefault(student_id, {'amount': 0, 'first': (year, month)})
+            entry['amount'] += max(0, amount - paid_amount)
+        context['outstanding'] = outstanding
+    return context['outstanding']
+
+
+@resolver('학생명')
+def resolve_student_name(students, context):
+    return {student.pk: student.name for student in students}
+
+
+@resolver('반명')
+def resolve_class_name(students, context):
+    return {
+        student.pk: student.assigned_class.name if student.assigned_class else ''
+        for student in students
+    }
+
+
+@resolver('수업일정')
+def resolve_class_schedule(students, context):
+    schedules = {}
+    result = {}
+    for student in students:
+        assigned_class = student.assigned_class
+        if assigned_class is None:
+            result[student.pk] = ''
+            continue
+        if assigned_class.pk not in schedules:
+            schedules[assigned_class.pk] = f'{assigned_class.weekday_display} {assigned_class.schedule_display}'
+        result[student.pk] = schedules[assigned_class.pk]
+    return result
+
+
+def _combine_amount(keys, values, context):
+    outstanding = context.get('outstanding', {})
+    return format_currency(sum(outstanding[key]['amount'] for key in keys if key in outstanding))
+
+
+def _combine_due_date(keys, values, context):
+    return min((values[key] for key in keys if values.get(key)), default='')
+
+
+@resolver('금액', combine=_combine_amount)
+def resolve_amount(students, context):
+    outstanding = _outstanding_payments(students, context)
+    zero = format_currency(0)
+    return {
+        student.pk: format_currency(outstanding[student.pk]['amount']) if student.pk in outstanding else zero
+        for student in students
+    }
+
+
+@resolver('마감일', combine=_combine_due_date)
+def resolve_due_date(students, context):
+    """가장 오래된 미납 월의 마감일 (미납이 없으면 이번 달 마감일)"""
+    from payments.models import Payment
+    
+    outstanding = _outstanding_payments(students, context)
+    today = context['today']
+    due_dates = {}
+    result = {}
+    for student in students:
+        year_month = outstanding[student.pk]['first'] if student.pk in outstanding else (today.year, today.month)
+        if year_month not in due_dates:
+            due_dates[year_month] = Payment.get_due_date(*year_month).strftime('%Y-%m-%d')
+        result[student.pk] = due_dates[year_month]
+    return result
+
+
+@resolver('날짜')
+def resolve_date(students, context):
+    return context['today'].strftime('%Y-%m-%d')
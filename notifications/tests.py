@@ -1,3 +1,69 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from django.utils import timezone
 
-# Create your tests here.
+from classes.models import Class
+from students.models import Student
+from .models import NotificationJob, NotificationLog, NotificationOutbox
+from .providers import BaseProvider, SendResult
+from .services import finalize_outbox, prepare_outbox, send_outbox
+
+
+class RecordingProvider(BaseProvider):
+    """보낸 연락처를 기록하는 테스트용 발송 제공자"""
+    sent = []
+    
+    def send(self, channel, contact, subject, content, idempotency_key=None):
+        self.sent.append(contact)
+        return SendResult(True, response='ok')
+
+
+@override_settings(NOTIFICATION_PROVIDER='notifications.tests.RecordingProvider')
+class OutboxResumeTests(TestCase):
+    """중단된 발송 작업 재개 - 이미 보낸 아웃박스 행은 다시 보내지 않음"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        assigned_class = Class.objects.create(
+            name='테스트반', weekdays='mon,wed,fri', start_time='15:00', end_time='17:00',
+        )
+        for index in range(3):
+            Student.objects.create(
+                name=f'학생{index}', assigned_class=assigned_class, parent_phone=f'010-1000-000{index}',
+            )
+        cls.job = NotificationJob.objects.create(
+            target_type='class',
+            target_class=assigned_class,
+            subject='안내',
+            content='{학생명} 학부모님, 안내드립니다.',
+            status='processing',
+        )
+    
+    def setUp(self):
+        RecordingProvider.sent = []
+    
+    def test_resume_skips_sent_rows(self):
+        chunks = prepare_outbox(self.job, 100)
+        outbox_ids = [pk for chunk in chunks for pk in chunk]
+        self.assertEqual(len(outbox_ids), 3)
+        
+        # 첫 행은 보낸 뒤 로그로 옮기기 전에 워커가 중단된 상황
+        already_sent = NotificationOutbox.objects.get(pk=outbox_ids[0])
+        NotificationOutbox.objects.filter(pk=already_sent.pk).update(status='sent', sent_at=timezone.now())
+        
+        # 재개: 다시 준비해도 행이 늘지 않고, 대기 행만 발송
+        resumed_ids = [pk for chunk in prepare_outbox(self.job, 100) for pk in chunk]
+        self.assertEqual(resumed_ids, outbox_ids)
+        self.assertEqual(self.job.outbox.count(), 3)
+        
+        self.assertEqual(send_outbox(self.job, resumed_ids), 2)
+        self.assertNotIn(already_sent.recipient_contact, RecordingProvider.sent)
+        self.assertEqual(len(RecordingProvider.sent), 2)
+        
+        # 같은 청크를 다시 실행해도 추가 발송 없음
+        self.assertEqual(send_outbox(self.job, resumed_ids), 0)
+        self.assertEqual(len(RecordingProvider.sent), 2)
+        
+        success_count, fail_count, completed = finalize_outbox(self.job.pk, resumed_ids)
+        self.assertEqual((success_count, fail_count, completed), (3, 0, True))
+        self.assertEqual(NotificationLog.objects.filter(job=self.job).count(), 3)
+        self.assertEqual(finalize_outbox(self.job.pk, resumed_ids), (0, 0, False))
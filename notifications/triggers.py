@@ -0,0 +1,152 @@
+"""
+자동 발송 트리거 엔진
+auto_send가 켜진 알림 템플릿마다 조건에 맞는 수신자를 SQL 한 번으로 찾아 발송 작업을 만든다.
+
+트리거별 평가 함수는 이벤트 테이블(수납, 출결, 상담 등)에서 학생 ID 서브쿼리를 반환하므로
+쿼리 비용은 전체 학생 수가 아니라 조건에 맞는 행 수에 비례한다.
+같은 날 같은 템플릿으로 이미 발송(예정)된 학생은 제외한다. (형제 합치기로 함께 받은 학생 포함)
+"""
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from core.utils import local_day_start
+from students.models import ConsultLog, Student
+from .models import NotificationJob, NotificationLog, NotificationTemplate
+
+# 트리거 유형 -> 평가 함수 (template, today) -> 학생 ID 쿼리셋 (오늘 해당 없으면 None)
+TRIGGERS = {}
+
+
+def trigger(trigger_type):
+    """트리거 평가 함수 등록 데코레이터"""
+    def decorator(func):
+        TRIGGERS[trigger_type] = func
+        return func
+    return decorator
+
+
+@trigger('unpaid')
+def unpaid_students(template, today):
+    """마감일 N일 전인 달의 미납/부분납 학생"""
+    from payments.models import Payment
+    
+    due = today + timedelta(days=template.days_before or 0)
+    if Payment.get_due_date(due.year, due.month) != due:
+        return None
+    return Payment.objects.filter(
+        year=due.year, month=due.month, status__in=['unpaid', 'partial']
+    ).values('student_id')
+
+
+@trigger('absent')
+def absent_students(template, today):
+    """오늘 결석한 학생"""
+    from attendance.models import Attendance
+    
+    return Attendance.objects.filter(date=today, status='absent').values('student_id')
+
+
+@trigger('consult_reminder')
+def consult_students(template, today):
+    """다음 상담 예정일이 N일 후인 학생"""
+    return ConsultLog.objects.filter(
+        next_consult_date=today + timedelta(days=template.days_before or 0)
+    ).values('student_id')
+
+
+@trigger('enrollment')
+def enrolled_students(template, today):
+    """오늘 등록한 학생"""
+    return Student.objects.filter(enrollment_date=today).values('pk')
+
+
+@trigger('payment_complete')
+def paid_students(template, today):
+    """오늘 완납한 학생"""
+    from payments.models import Payment
+    
+    return Payment.objects.filter(payment_date=today, status='paid').values('student_id')
+
+
+def match_recipients(template, today):
+    """
+    템플릿의 오늘 발송 대상 학생 ID (쿼리 1회)
+    
+    Returns:
+        list: 학생 ID 목록 (오늘 해당 없으면 빈 목록)
+    """
+    source = TRIGGERS[template.trigger_type](template, today)
+    if source is None:
+        return []
+    
+    day_start = local_day_start(today)
+    already_queued = NotificationJob.objects.filter(
+        template=template, created_at__gte=day_start, target_students=OuterRef('pk')
+    )
+    already_sent = NotificationLog.objects.filter(
+        job__template=template, sent_at__gte=day_start, covered_students=OuterRef('pk')
+    )
+    return list(
+        Student.objects.filter(pk__in=source, status='enrolled')
+        .exclude(Exists(already_queued))
+        .exclude(Exists(already_sent))
+        .order_by('pk')
+        .values_list('pk', flat=True)
+    )
+
+
+def evaluate_triggers(trigger_types=None, now=None):
+    """
+    자동 발송 템플릿 평가 후 발송 작업 일괄 생성
+    
+    Args:
+        trigger_types: 평가할 트리거 유형 목록 (None이면 전체)
+        now: 기준 시각 (기본값 현재)
+    
+    Returns:
+        list: 생성된 발송 작업 ID 목록
+    """
+    now = timezone.localtime(now)
+    today = now.date()
+    
+    templates = NotificationTemplate.objects.filter(
+        auto_send=True, is_active=True, trigger_type__in=list(trigger_types or TRIGGERS)
+    )
+    
+    matches = []
+    for template in templates:
+        # 발송 시각 전이면 다음 평가에서 처리
+        if template.send_time and now.time() < template.send_time:
+            continue
+        student_ids = match_recipients(template, today)
+        if student_ids:
+            matches.append((template, student_ids))
+    
+    if not matches:
+        return []
+    
+    with transaction.atomic():
+        jobs = NotificationJob.objects.bulk_create([
+            NotificationJob(
+                template=template,
+                target_type='student',
+                subject=template.subject,
+                content=template.content,
+                total_count=len(student_ids),
+            )
+            for template, student_ids in matches
+        ])
+        Through = NotificationJob.target_students.through
+        Through.objects.bulk_create(
+            [
+                Through(notificationjob_id=job.pk, student_id=student_id)
+                for job, (_, student_ids) in zip(jobs, matches)
+                for student_id in student_ids
+            ],
+            batch_size=1000,
+        )
+    
+    return [job.pk for job in jobs]
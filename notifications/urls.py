@@ -17,10 +17,12 @@ urlpatterns = [
     # 발송 작업
     path('jobs/', views.job_list, name='job_list'),
     path('jobs/<int:pk>/', views.job_detail, name='job_detail'),
+    path('jobs/<int:pk>/progress/', views.job_progress, name='job_progress'),
     
     # 주간/월간 보고서
     path('reports/', views.report_list, name='report_list'),
     path('reports/create/', views.report_create, name='report_create'),
+    path('reports/batch/', views.report_batch_create, name='report_batch_create'),
     path('reports/<int:pk>/', views.report_detail, name='report_detail'),
     path('reports/<int:pk>/edit/', views.report_edit, name='report_edit'),
 ]
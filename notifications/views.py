@@ -7,18 +7,17 @@ from django.http import JsonResponse
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.utils import timezone
+from django.db import transaction
 from django.db.models import Q
 
 from .models import NotificationTemplate, NotificationJob, NotificationLog
 from .forms import NotificationTemplateForm, NotificationSendForm
+from .services import store_delivery_stats
+from .tasks import process_notification_job
+from core.pagination import KeysetPaginator, get_querystring
 from students.models import Student
 
-
-def replace_variables(content, context):
-    """변수 치환"""
-    for key, value in context.items():
-        content = content.replace('{' + key + '}', str(value))
-    return content
+FINISHED_STATUSES = ('sent', 'failed', 'cancelled')
 
 
 @login_required
@@ -104,20 +103,20 @@ def send_notification(request):
     if request.method == 'POST':
         form = NotificationSendForm(request.POST)
         if form.is_valid():
-            # 대상 학생 결정
+            # 대상 학생 결정 (반 전체/전체는 발송 태스크에서 재원생으로 결정)
             target_type = form.cleaned_data['target_type']
             students = []
             
             if target_type == 'student':
                 students = list(form.cleaned_data['target_students'])
+                total_count = len(students)
             elif target_type == 'class':
                 target_class = form.cleaned_data['target_class']
-                if target_class:
-                    students = list(target_class.students.filter(status='enrolled'))
-            elif target_type == 'all':
-                students = list(Student.objects.filter(status='enrolled'))
+                total_count = target_class.students.filter(status='enrolled').count() if target_class else 0
+            else:
+                total_count = Student.objects.filter(status='enrolled').count()
             
-            if not students:
+            if not total_count:
                 messages.error(request, '발송 대상이 없습니다.')
             else:
                 # 발송 작업 생성
@@ -128,43 +127,20 @@ def send_notification(request):
                     subject=form.cleaned_data.get('subject', ''),
                     content=form.cleaned_data['content'],
                     scheduled_at=form.cleaned_data.get('scheduled_at'),
-                    total_count=len(students),
+                    merge_siblings=form.cleaned_data.get('merge_siblings', False),
+                    total_count=total_count,
                     created_by=request.user,
                 )
-                job.target_students.set(students)
+                if students:
+                    job.target_students.set(students)
                 
-                # 예약 발송이 아니면 즉시 처리 (시뮬레이션)
+                # 예약 발송이 아니면 즉시 백그라운드 처리 (진행 상황은 상세 화면에서 확인)
                 if not job.scheduled_at:
-                    success_count = 0
-                    for student in students:
-                        # 변수 치환
-                        context = {
-                            '학생명': student.name,
-                            '반명': student.assigned_class.name if student.assigned_class else '',
-                        }
-                        sent_content = replace_variables(job.content, context)
-                        
-                        # 로그 생성 (실제로는 SMS API 호출)
-                        recipient_contact = student.parent_phone or student.phone or '-'
-                        
-                        NotificationLog.objects.create(
-                            job=job,
-                            recipient_name=student.name,
-                            recipient_contact=recipient_contact,
-                            sent_content=sent_content,
-                            result='success',  # 시뮬레이션
-                        )
-                        success_count += 1
-                    
-                    job.status = 'sent'
-                    job.success_count = success_count
-                    job.processed_at = timezone.now()
-                    job.save()
-                    
-                    messages.success(request, f'{success_count}건의 알림이 발송되었습니다.')
-                else:
-                    messages.success(request, f'{len(students)}건의 알림이 예약되었습니다.')
+                    transaction.on_commit(lambda: process_notification_job.delay(job.pk))
+                    messages.success(request, f'{total_count}건의 알림 발송을 시작했습니다.')
+                    return redirect('notifications:job_detail', pk=job.pk)
                 
+                messages.success(request, f'{total_count}건의 알림이 예약되었습니다.')
                 return redirect('notifications:job_list')
     else:
         initial = {}
@@ -194,21 +170,59 @@ def job_list(request):
     if status:
         jobs = jobs.filter(status=status)
     
+    paginator = KeysetPaginator(jobs, 30, ordering=('-created_at', '-id'))
+    page_obj = paginator.get_page(request.GET.get('cursor'))
+    
     return render(request, 'notifications/job_list.html', {
-        'jobs': jobs,
+        'page_obj': page_obj,
+        'querystring': get_querystring(request),
         'status_choices': NotificationJob.STATUS_CHOICES,
     })
 
 
 @login_required
 def job_detail(request, pk):
-    """발송 작업 상세"""
-    job = get_object_or_404(NotificationJob, pk=pk)
-    logs = job.logs.all()[:100]  # 최근 100건
+    """발송 작업 상세 (로그는 커서 페이지네이션, 결과/오류 유형 집계는 완료 시 저장된 값)"""
+    job = get_object_or_404(NotificationJob.objects.select_related('template', 'created_by'), pk=pk)
+    
+    # 집계 저장 이전에 완료된 작업은 처음 열 때 한 번 계산
+    if job.status in FINISHED_STATUSES and not job.delivery_stats:
+        job.delivery_stats = store_delivery_stats(job.pk)
+    
+    logs = job.logs.all()
+    result = request.GET.get('result')
+    error_code = request.GET.get('error_code')
+    if result:
+        logs = logs.filter(result=result)
+    if error_code is not None:
+        logs = logs.filter(result='failed', error_code=error_code)
+    
+    paginator = KeysetPaginator(logs, 50, ordering=('-sent_at', '-id'))
+    page_obj = paginator.get_page(request.GET.get('cursor'))
     
     return render(request, 'notifications/job_detail.html', {
         'job': job,
-        'logs': logs,
+        'page_obj': page_obj,
+        'querystring': get_querystring(request),
+        'result_choices': NotificationLog.RESULT_CHOICES,
+        'selected_result': result or '',
+        'selected_error_code': error_code,
+    })
+
+
+@login_required
+def job_progress(request, pk):
+    """발송 작업 진행 상황 API (상세 화면 폴링용)"""
+    job = get_object_or_404(NotificationJob, pk=pk)
+    
+    return JsonResponse({
+        'status': job.status,
+        'status_display': job.get_status_display(),
+        'total_count': job.total_count,
+        'success_count': job.success_count,
+        'fail_count': job.fail_count,
+        'processed_at': timezone.localtime(job.processed_at).strftime('%Y-%m-%d %H:%M:%S') if job.processed_at else None,
+        'finished': job.status in FINISHED_STATUSES,
     })
 
 
@@ -232,7 +246,6 @@ def template_preview(request):
 # === 주간/월간 보고서 ===
 
 from .models import WeeklyReport
-from datetime import timedelta
 
 
 @login_required
@@ -265,16 +278,7 @@ def report_create(request):
         from students.models import Student
         student = get_object_or_404(Student, pk=student_id)
         
-        today = timezone.now().date()
-        if period_type == 'weekly':
-            start_date = today - timedelta(days=today.weekday())
-            end_date = start_date + timedelta(days=6)
-            title = f"{start_date.strftime('%m/%d')} ~ {end_date.strftime('%m/%d')} 주간 보고서"
-        else:
-            from calendar import monthrange
-            start_date = today.replace(day=1)
-            end_date = today.replace(day=monthrange(today.year, today.month)[1])
-            title = f"{today.month}월 월간 보고서"
+        start_date, end_date, title = WeeklyReport.get_period(period_type, timezone.now().date())
         
         report = WeeklyReport.objects.create(
             student=student,
@@ -301,6 +305,34 @@ def report_create(request):
     })
 
 
+@login_required
+def report_batch_create(request):
+    """보고서 일괄 생성 (반 전체 또는 전체 재원생, 백그라운드 처리)"""
+    from classes.models import Class
+    from .tasks import generate_weekly_reports
+    
+    if request.method == 'POST':
+        period_type = request.POST.get('period_type', 'weekly')
+        class_id = request.POST.get('assigned_class') or None
+        
+        if period_type not in dict(WeeklyReport.PERIOD_CHOICES):
+            messages.error(request, '보고서 유형을 선택해주세요.')
+            return redirect('notifications:report_batch_create')
+        if class_id:
+            get_object_or_404(Class, pk=class_id)
+        
+        user_id = request.user.pk
+        transaction.on_commit(lambda: generate_weekly_reports.delay(period_type, class_id, user_id))
+        
+        messages.success(request, '보고서 일괄 생성을 시작했습니다. 잠시 후 목록에서 확인하세요.')
+        return redirect('notifications:report_list')
+    
+    return render(request, 'notifications/report_batch.html', {
+        'classes': Class.objects.filter(is_active=True),
+        'period_choices': WeeklyReport.PERIOD_CHOICES,
+    })
+
+
 @login_required
 def report_edit(request, pk):
     """보고서 수정"""
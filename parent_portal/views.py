@@ -14,6 +14,7 @@ from .models import ParentAccount, ParentInvite, ParentMessage
 from .forms import ParentRegistrationForm, ParentLoginForm, ParentMessageForm, ParentProfileForm
 from students.models import Student
 from attendance.models import Attendance
+from attendance.summary import get_monthly_stats
 from payments.models import Payment
 from academics.models import Score
 
@@ -175,13 +176,8 @@ def child_attendance(request, student_pk):
         date__month=month
     ).order_by('-date')
     
-    # 통계
-    stats = {
-        'total': attendances.count(),
-        'present': attendances.filter(status='present').count(),
-        'absent': attendances.filter(status='absent').count(),
-        'late': attendances.filter(status='late').count(),
-    }
+    # 통계 (월간 출결 집계에서 조회)
+    stats = get_monthly_stats(student.pk, year, month)
     
     return render(request, 'parent_portal/child_attendance.html', {
         'student': student,
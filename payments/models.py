@@ -1,3 +1,6 @@
+import calendar
+from datetime import date
+
 from django.db import models
 from students.models import Student
 
@@ -44,6 +47,10 @@ class Payment(models.Model):
         verbose_name_plural = '수납 목록'
         ordering = ['-year', '-month', 'student__name']
         unique_together = ['student', 'year', 'month']
+        indexes = [
+            models.Index(fields=['year', 'month', 'status'], name='payment_ym_status_idx'),
+            models.Index(fields=['payment_date'], name='payment_date_idx'),
+        ]
     
     def __str__(self):
         return f"{self.student.name} - {self.year}년 {self.month}월"
@@ -53,6 +60,21 @@ class Payment(models.Model):
         """미납 금액"""
         return max(0, self.amount - self.paid_amount)
     
+    @property
+    def due_date(self):
+        """납부 마감일"""
+        return self.get_due_date(self.year, self.month)
+    
+    @staticmethod
+    def get_due_date(year, month):
+        """
+        해당 월의 납부 마감일 (시스템 설정 payment.due_day, 말일을 넘으면 말일)
+        """
+        from core.system_settings import get_int
+        
+        last_day = calendar.monthrange(year, month)[1]
+        return date(year, month, min(max(get_int('payment.due_day', default=10), 1), last_day))
+    
     def save(self, *args, **kwargs):
         # 자동 상태 업데이트
         if self.paid_amount >= self.amount and self.amount > 0:
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-19 11:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0002_waitlist_consultlog'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='consultlog',
+            index=models.Index(fields=['next_consult_date'], name='consult_next_date_idx'),
+        ),
+    ]
@@ -131,6 +131,9 @@ class ConsultLog(models.Model):
         verbose_name = '상담 일지'
         verbose_name_plural = '상담 일지 목록'
         ordering = ['-consult_date']
+        indexes = [
+            models.Index(fields=['next_consult_date'], name='consult_next_date_idx'),
+        ]
     
     def __str__(self):
         return f"{self.student.name} - {self.consult_date} ({self.topic})"